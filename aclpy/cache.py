@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# cache.py
+"""Caches for the responses received from Arrowhead Core.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Dict
+
+
+def cache_key(message: Dict[str, any]) -> str:
+    """Create a cache key from a message sent to the Core.
+
+    Arguments:
+    message (Dict[str, any]) -- message, e.g., created by 'aclpy.messages.build_orchestration_request'
+
+    Returns:
+    key (str) -- key identifying the message
+    """
+    return json.dumps(message, sort_keys = True, separators = (",", ":"))
+
+
+def is_failure(response: Dict[str, any]) -> bool:
+    """Check whether a stored 'response' is a failure.
+
+    Arguments:
+    response (Dict[str, any]) -- response obtained from the cache
+
+    Returns:
+    failure (bool) -- True when the response is an error message of the Core
+    """
+    return "errorCode" in response
+
+
+class OrchestrationCache(object):
+    """OrchestrationCache class for storing orchestration responses within a process.
+
+    Attributes:
+    ttl (float) -- time in seconds for which the responses are valid, 60 by default
+    negative_ttl (float) -- time in seconds for which failures and responses without providers
+                            are valid, 5 by default, None to store failures not at all and
+                            empty responses as any other response
+    max_entries (int) -- maximum number of stored responses, 1024 by default, None for no limit
+
+    Note: Failures are stored as the error message received from the Core, see 'is_failure'.
+    Note: When the cache is full, expired responses are removed first, then the least
+    recently stored ones.
+    """
+
+    def __init__(self, *, ttl: float = 60, negative_ttl: float = 5, max_entries: int = 1024):
+        """Initialize OrchestrationCache class."""
+        super(OrchestrationCache, self).__init__()
+
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get(self, key: str) -> Dict[str, any]:
+        """Get a stored response.
+
+        Arguments:
+        key (str) -- key of the response, see 'cache_key'
+
+        Returns:
+        response (Dict[str, any]) -- stored response, None when missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            if entry[0] < time.time():
+                del self._entries[key]
+                return None
+
+            return entry[1]
+
+
+    def put(self, key: str, response: Dict[str, any], ttl: float = None):
+        """Store a response.
+
+        Arguments:
+        key (str) -- key of the response, see 'cache_key'
+        response (Dict[str, any]) -- response to be stored
+        ttl (float) -- time in seconds for which the response is valid, 'self.ttl' by default
+        """
+        now = time.time()
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+            if self.max_entries is not None and len(self._entries) >= self.max_entries:
+                for expired in [stored for stored, entry in self._entries.items() if entry[0] < now]:
+                    del self._entries[expired]
+
+                while len(self._entries) >= self.max_entries:
+                    self._entries.popitem(last = False)
+
+            self._entries[key] = (now + (self.ttl if ttl is None else ttl), response)
+
+
+    def put_failure(self, key: str, status_code: int, response: Dict[str, any]):
+        """Store a failed request for 'negative_ttl' seconds.
+
+        Only failures that would repeat are stored, i.e., client errors except for
+        timeouts (408) and throttling (429).
+
+        Arguments:
+        key (str) -- key of the request, see 'cache_key'
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- error message received from the Core
+        """
+        if self.negative_ttl is None or not 400 <= status_code < 500 or status_code in (408, 429):
+            return
+
+        self.put(key, dict(response, errorCode = response.get("errorCode", status_code)), self.negative_ttl)
+
+
+    def clear(self):
+        """Remove all stored responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SharedOrchestrationCache(OrchestrationCache):
+    """SharedOrchestrationCache class for sharing orchestration responses among processes.
+
+    The responses are stored inside a local SQLite database that is memory-mapped by
+    all processes using the same 'filename'. SQLite takes care of the locking, so
+    readers and writers from multiple processes can access it concurrently.
+
+    Additional attributes:
+    filename (str) -- path to the cache file
+
+    Note: The cache can be created before forking; each process opens its own connection.
+    Note: The number of responses is not limited; expired ones are removed by each 'put'.
+    """
+
+    def __init__(self, filename: str, *, ttl: float = 60, negative_ttl: float = 5):
+        """Initialize SharedOrchestrationCache class."""
+        super(SharedOrchestrationCache, self).__init__(ttl = ttl, negative_ttl = negative_ttl, max_entries = None)
+
+        self.filename = filename
+        self._connection = None
+        self._pid = None
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS orchestration "
+                    "(key TEXT PRIMARY KEY, expires REAL NOT NULL, response TEXT NOT NULL)"
+                )
+
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get a connection to the cache file for this process. (Call with the lock held.)"""
+        if self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.filename,
+                timeout = 10,
+                isolation_level = None,
+                check_same_thread = False,
+            )
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+            self._connection.execute("PRAGMA mmap_size = 67108864")
+            self._pid = os.getpid()
+
+        return self._connection
+
+
+    def get(self, key: str) -> Dict[str, any]:
+        """Get a stored response.
+
+        Arguments:
+        key (str) -- key of the response, see 'cache_key'
+
+        Returns:
+        response (Dict[str, any]) -- stored response, None when missing or expired
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT response FROM orchestration WHERE key = ? AND expires >= ?",
+                (key, time.time())
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return json.loads(row[0])
+
+
+    def put(self, key: str, response: Dict[str, any], ttl: float = None):
+        """Store a response.
+
+        Arguments:
+        key (str) -- key of the response, see 'cache_key'
+        response (Dict[str, any]) -- response to be stored
+        ttl (float) -- time in seconds for which the response is valid, 'self.ttl' by default
+        """
+        now = time.time()
+        data = json.dumps(response, separators = (",", ":"))
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO orchestration (key, expires, response) VALUES (?, ?, ?)",
+                    (key, now + (self.ttl if ttl is None else ttl), data)
+                )
+                connection.execute("DELETE FROM orchestration WHERE expires < ?", (now, ))
+
+
+    def clear(self):
+        """Remove all stored responses."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM orchestration")
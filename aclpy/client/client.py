@@ -4,21 +4,44 @@
 """
 
 import json
+import threading
+import time
 
-from typing import Tuple, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple, List
 
-from aclpy.connector.connector import ArrowheadConnector
+from aclpy.cache import OrchestrationCache, cache_key, is_failure
+from aclpy.connector.connector import ArrowheadConnector, Error, unavailable_error
 from aclpy.interface import ArrowheadInterface
+from aclpy.intern import Interner
 from aclpy.messages import *
+from aclpy.probe import Prober
 from aclpy.service import ArrowheadService
+from aclpy.snapshot import Snapshot
 from aclpy.system import ArrowheadSystem
 
 
+def _expires_at(budget: float) -> float:
+    """Convert time budget in seconds to the time.monotonic() at which a connector request expires."""
+    return None if budget is None else time.monotonic() + budget
+
+
 class ArrowheadClient(ArrowheadSystem):
     """ArrowheadClient class for attaching a connector to system.
 
     Additional attributes:
     connector (ArrowheadConnector) -- class for handling the requests
+    cache (OrchestrationCache) -- cache for the orchestration responses, None (disabled) by default
+    interner (Interner) -- shares repeated strings and read-only interfaces of the providers,
+                           None (disabled) by default
+    prober (Prober) -- orders the providers by their reachability, None (disabled) by default
+    snapshot (Snapshot) -- last results stored on the disk for Core outages, None (disabled) by default
+    outage_backoff (float) -- time in seconds the snapshot is served without contacting the Core
+                              after it was found unreachable, 5 by default
+    index (ServiceIndex) -- index of the prefetched providers, None (disabled) by default
+    required_services (List[ArrowheadService]) -- services used by this client, see 'require'
+    providers (Dict[str, List[Dict[str, (ArrowheadSystem, ArrowheadService)]]]) -- prefetched providers
+                                                                                  of the required services
     """
 
     def __init__(self, name: str, address: str, port: int, pubkey: str, connector: ArrowheadConnector):
@@ -31,6 +54,113 @@ class ArrowheadClient(ArrowheadSystem):
         )
 
         self.connector = connector
+        self.cache = None
+        self.interner = None
+        self.prober = None
+        self.snapshot = None
+        self.outage_backoff = 5.0
+        self.index = None
+        self.required_services = []
+        self.providers = {}
+
+        self._refresh_thread = None
+        self._refresh_stop = threading.Event()
+        self._outage_until = None
+        self._outage_lock = threading.Lock()
+
+
+    def _in_outage(self) -> bool:
+        """Check whether the Core is known to be unreachable.
+
+        Returns:
+        outage (bool) -- True while 'outage_backoff' lasts; after that, a single caller
+                         gets False to try the Core again, while the others keep the snapshot
+        """
+        with self._outage_lock:
+            if self._outage_until is None:
+                return False
+
+            now = time.monotonic()
+
+            if now < self._outage_until:
+                return True
+
+            self._outage_until = now + self.outage_backoff
+
+            return False
+
+
+    def _set_outage(self, outage: bool):
+        """Mark the Core as unreachable or reachable again."""
+        with self._outage_lock:
+            self._outage_until = time.monotonic() + self.outage_backoff if outage else None
+
+
+    @staticmethod
+    def _read_pubkey(pubkey: str, pubfile: str, load: Callable[[], bytes]) -> str:
+        """Get the public key in the format of 'authenticationInfo'. (Used by the derived classes.)
+
+        Arguments:
+        pubkey (str) -- public key, mutually exclusive with 'pubfile'
+        pubfile (str) -- path to the public key .pub, mutually exclusive with 'pubkey'
+        load (Callable[[], bytes]) -- function obtaining the PEM public key from the certificate,
+                                      used when neither 'pubkey' nor 'pubfile' is given
+
+        Returns:
+        pubkey (str) -- base64 encoded key without the PEM header, footer and line breaks
+
+        Note: ValueError is raised when both 'pubkey' and 'pubfile' are given.
+        """
+        if pubkey is not None and pubfile is not None:
+            raise ValueError("Conflict betwen pubkey and pubfile. Provide only one of them.")
+
+        if pubfile is not None:
+            with open(pubfile, "r") as f:
+                pubkey = f.read()
+
+        if pubkey is None:
+            pubkey = load()
+
+        if isinstance(pubkey, bytes):
+            pubkey = pubkey.decode("ascii")
+
+        # Keep only the key itself
+        return "".join(line.strip() for line in pubkey.splitlines() if not line.startswith("-----"))
+
+
+    def _setup(self, *,
+            interfaces: List[ArrowheadInterface],
+            warmup: bool,
+            cache: OrchestrationCache,
+            interner: Interner,
+            prober: Prober,
+            snapshot: Snapshot,
+            required_services: List[ArrowheadService],
+            refresh_interval: float,
+    ):
+        """Configure the client and prepare the required services. (Used by the derived classes.)
+
+        Arguments are described by the derived classes, e.g., 'client_pkcs12.ArrowheadClient'.
+        """
+        self.cache = cache
+        self.interner = interner
+        self.prober = prober
+        self.snapshot = snapshot
+
+        self.restore()
+
+        for interface in interfaces:
+            self.interfaces.append(interface)
+
+        if warmup:
+            self.warmup()
+
+        if len(required_services) > 0:
+            self.require(*required_services)
+            self.prefetch()
+
+            if refresh_interval is not None:
+                self.start_refresh(refresh_interval)
 
 
     @property
@@ -38,11 +168,59 @@ class ArrowheadClient(ArrowheadSystem):
         return self.connector.last_error
 
 
-    def register_service(self, service: ArrowheadService) -> bool:
+    def warmup(self, wait: bool = False) -> Dict[str, bool]:
+        """Open connections to all configured core systems concurrently.
+
+        Arguments:
+        wait (bool) -- block until all connections are validated, False by default
+
+        Returns:
+        reachable (Dict[str, bool]) -- reachability of the core systems, empty when not waiting
+        """
+        futures = self.connector.warmup(self, wait = wait)
+
+        if not wait:
+            return {}
+
+        return {
+            core_system: future.result() for core_system, future in futures.items()
+        }
+
+
+    def discover(self, deadline: float = None) -> Dict[str, bool]:
+        """Discover the core systems through the Service Registry.
+
+        Arguments:
+        deadline (float) -- time budget for all queries in seconds, None by default
+
+        Returns:
+        discovered (Dict[str, bool]) -- True for each core system found in the Service Registry
+
+        Note: To discover the core systems automatically, set 'connector.discovery' to True.
+        """
+        return self.connector.discover(self, expires_at = _expires_at(deadline))
+
+
+    def restore(self):
+        """Restore the id of this client from 'snapshot' without contacting the Core.
+
+        Returns:
+        success (bool) -- True when the id was found in the snapshot
+        """
+        if self.snapshot is None or self.snapshot.system_id is None:
+            return False
+
+        self.id = self.snapshot.system_id
+
+        return True
+
+
+    def register_service(self, service: ArrowheadService, deadline: float = None) -> bool:
         """Register a service for this client.
 
         Arguments:
         service (ArrowheadService) -- service to be registered
+        deadline (float) -- time budget of the call in seconds, None (default budget of the connector) by default
 
         Returns:
         success (bool) -- True when registration is successful
@@ -53,7 +231,7 @@ class ArrowheadClient(ArrowheadSystem):
             service = service
         )
 
-        success, status_code, payload = self.connector.register_service(self, msg)
+        success, status_code, payload = self.connector.register_service(self, msg, _expires_at(deadline))
 
         if success:
             self.update(**payload.get("provider"))
@@ -64,14 +242,19 @@ class ArrowheadClient(ArrowheadSystem):
                     if interface.name == _interface.get("interfaceName"):
                         interface.update(**_interface)
 
+            if self.snapshot is not None:
+                self.snapshot.put_system(self.id)
+                self.snapshot.put_service(service.name, service.id)
+
         return success
 
 
-    def unregister_service(self, service: ArrowheadService) -> bool:
+    def unregister_service(self, service: ArrowheadService, deadline: float = None) -> bool:
         """Unregister a service for this client.
 
         Arguments:
         service (ArrowheadService) -- service to be unregistered
+        deadline (float) -- time budget of the call in seconds, None (default budget of the connector) by default
 
         Returns:
         success (bool) -- True when unregistration is successful
@@ -81,87 +264,348 @@ class ArrowheadClient(ArrowheadSystem):
             service = service
         )
 
-        success, status_code, payload = self.connector.unregister_service(self, msg)
+        success, status_code, payload = self.connector.unregister_service(self, msg, _expires_at(deadline))
 
         return success
 
 
-    def register_system(self) -> bool:
+    def register_system(self, deadline: float = None) -> bool:
         """Register this system inside Arrowhead Core.
 
+        Arguments:
+        deadline (float) -- time budget of the call in seconds, None (default budget of the connector) by default
+
         Returns:
         success (bool) -- True when registration is successful
         """
         msg = build_register_system(system = self)
 
-        success, status_code, payload = self.connector.register_system(self, msg)
+        success, status_code, payload = self.connector.register_system(self, msg, _expires_at(deadline))
 
         if success:
             self.update(**payload)
 
+            if self.snapshot is not None:
+                self.snapshot.put_system(self.id)
+
         return success
 
 
-    def orchestrate(self, service: ArrowheadService) -> Tuple[bool, List[Dict[str, any]]]:
+    def query_service(self, service: ArrowheadService, deadline: float = None) -> Tuple[bool, List[Dict[str, any]]]:
+        """Query the Service Registry for registrations of 'service' by this client.
+
+        Arguments:
+        service (ArrowheadService) -- service to be queried
+        deadline (float) -- time budget of the call in seconds, None (default budget of the connector) by default
+
+        Returns:
+        success (bool) -- True when query is successful
+        entries (List[Dict[str, any]]) -- registrations as received from the Service Registry
+        """
+        msg = build_service_query(service = service)
+
+        success, status_code, payload = self.connector.query_service(self, msg, _expires_at(deadline))
+
+        if not success:
+            return (False, [])
+
+        return (True, [
+            entry for entry in payload.get("serviceQueryData", [])
+            if entry.get("provider", {}).get("systemName") == self.name
+            and entry.get("provider", {}).get("address") == self.address
+            and entry.get("provider", {}).get("port") == self.port
+        ])
+
+
+    def reconcile(self, services: List[ArrowheadService], remove: List[ArrowheadService] = None, deadline: float = None, max_workers: int = 8) -> bool:
+        """Bring registrations of this client to the desired state.
+
+        Registrations are read from the Service Registry first, and only the services that
+        are missing or differ (version, metadata, URI or interfaces) are registered again. When
+        nothing has changed, no registration is sent.
+
+        Arguments:
+        services (List[ArrowheadService]) -- services that should be registered
+        remove (List[ArrowheadService]) -- services that should not be registered, None (none) by default
+        deadline (float) -- time budget of the whole call in seconds, None by default
+        max_workers (int) -- number of services reconciled concurrently, 8 by default
+
+        Returns:
+        success (bool) -- True when all services are in the desired state
+
+        Note: Services that are in neither list are left untouched, as the Service Registry
+        does not allow listing all services of a provider without management rights.
+        """
+        end = _expires_at(deadline)
+        remaining = lambda: None if end is None else end - time.monotonic()
+
+        interfaces = sorted(interface.name for interface in self.interfaces)
+
+        def reconcile_service(service: ArrowheadService, desired: bool) -> bool:
+            success, entries = self.query_service(service, remaining())
+
+            if not success:
+                return False
+
+            if not desired:
+                return len(entries) == 0 or self.unregister_service(service, remaining())
+
+            for entry in entries:
+                if entry.get("version") == service.version \
+                    and (entry.get("metadata") or {}) == (service.metadata or {}) \
+                    and (entry.get("serviceUri") or "") == (service.uri or "") \
+                    and sorted(_i.get("interfaceName") for _i in entry.get("interfaces", [])) == interfaces:
+                    self.update(**entry.get("provider"))
+                    service.update(**entry.get("serviceDefinition"))
+                    return True
+
+            if len(entries) > 0 and not self.unregister_service(service, remaining()):
+                return False
+
+            return self.register_service(service, remaining())
+
+        tasks = [(service, True) for service in services] + [(service, False) for service in (remove or [])]
+
+        if len(tasks) == 0:
+            return True
+
+        with ThreadPoolExecutor(max_workers = min(max_workers, len(tasks)), thread_name_prefix = "aclpy-reconcile") as executor:
+            return all(executor.map(lambda task: reconcile_service(*task), tasks))
+
+
+    def orchestrate(self, service: ArrowheadService, deadline: float = None, **options) -> Tuple[bool, List[Dict[str, any]]]:
         """Use Core Orchestrator to locate providers of the required 'service'.
 
         Arguments:
         service (ArrowheadService) -- service to be located
+        deadline (float) -- time budget of the call in seconds, None (default budget of the connector) by default
+        **options -- orchestration flags and requirements, see 'aclpy.messages.build_orchestration_request'
 
         Returns:
         success (bool) -- True when registration is successful
         matches (List[Dict[str, (ArrowheadSystem, ArrowheadService)]]) -- list of available providers
+
+        Note: With 'cache', failures and empty responses are repeated for 'cache.negative_ttl'
+        seconds without contacting the Orchestrator.
+        Note: With 'prober', providers are sorted by RTT, unreachable ones last (or removed, see 'Prober').
+        Note: With 'snapshot', the last successful response is used when the Core is unreachable;
+        such matches contain key 'stale' set to True. For 'outage_backoff' seconds after that,
+        the snapshot is used without contacting the Core.
         """
         msg = build_orchestration_request(
             interfaces = self.interfaces,
             system = self,
-            service = service
+            service = service,
+            **options
         )
 
-        success, status_code, payload = self.connector.orchestrate(self, msg)
+        key = None
+        payload = None
+        stale = False
 
-        if not success:
-            return (False, [])
-        else:
-            if len(payload.get("response")) > 0:
-                return (True, [{
-                    "provider": ArrowheadSystem(
-                        address = system.get("provider").get("address"),
-                        port = system.get("provider").get("port"),
-                        name = system.get("provider").get("systemName"),
-                        pubkey = system.get("provider").get("authenticationInfo"),
-                        id = system.get("provider").get("id"),
-                        created_at = system.get("provider").get("createdAt"),
-                        updated_at = system.get("provider").get("updatedAt"),
-                        interfaces = [
-                            ArrowheadInterface(
-                                name = _interface.get("interfaceName"),
-                                id = _interface.get("id"),
-                                created_at = _interface.get("createdAt"),
-                                updated_at = _interface.get("updatedAt"),
-                            ) for _interface in system.get("interfaces")
-                        ],
-                    ),
-                    "service": ArrowheadService(
-                        name = system.get("service").get("serviceDefinition"),
-                        id = system.get("service").get("id"),
-                        version = system.get("version"),
-                        metadata = system.get("metadata"),
-                        created_at = system.get("service").get("createdAt"),
-                        updated_at = system.get("service").get("updatedAt"),
-                    )
-                    } for system in payload.get("response")
-                ])
+        if self.cache is not None or self.snapshot is not None:
+            key = cache_key(msg)
+
+        if self.cache is not None:
+            payload = self.cache.get(key)
+
+            if payload is not None and is_failure(payload):
+                self.connector.last_error = Error(**payload, system_name = "Orchestrator", operation = "orchestrate")
+
+                return (False, [])
+
+        # Core is known to be down; serve the last known providers right away
+        if payload is None and self.snapshot is not None and self._in_outage():
+            payload = self.snapshot.get_orchestration(key)
+            stale = True
+
+            if payload is None:
+                self.connector.last_error = Error(
+                    **unavailable_error("orchestrate")[1], system_name = "Orchestrator", operation = "orchestrate"
+                )
+
+                return (False, [])
+
+        if payload is None:
+            success, status_code, payload = self.connector.orchestrate(self, msg, _expires_at(deadline))
+
+            if not success:
+                if self.cache is not None:
+                    self.cache.put_failure(key, status_code, payload)
+
+                # Core is not reachable; serve the last known providers
+                if self.snapshot is not None and (status_code >= 500 or status_code == 408):
+                    self._set_outage(True)
+                    payload = self.snapshot.get_orchestration(key)
+                    stale = payload is not None
+
+                if not stale:
+                    return (False, [])
 
             else:
-                return (True, [])
+                if self.snapshot is not None:
+                    self._set_outage(False)
 
+                if self.cache is not None:
+                    self.cache.put(key, payload, self.cache.negative_ttl if len(payload.get("response", [])) == 0 else None)
 
-    def obtain_id(self, service_name: str = "dummy") -> bool:
+            if self.snapshot is not None and not stale:
+                self.snapshot.put_orchestration(key, payload)
+
+        matches = self._parse_orchestration(payload)
+
+        if stale:
+            for match in matches:
+                match["stale"] = True
+
+        if self.prober is not None:
+            matches = self.prober.sort(matches)
+
+        return (True, matches)
+
+
+    def _parse_orchestration(self, payload: Dict[str, any]) -> List[Dict[str, any]]:
+        """Convert orchestration response into the library objects.
+
+        Arguments:
+        payload (Dict[str, any]) -- message received from the Orchestrator
+
+        Returns:
+        matches (List[Dict[str, (ArrowheadSystem, ArrowheadService)]]) -- list of available providers
+        """
+        if self.interner is None:
+            text = metadata = lambda value: value
+            interface = ArrowheadInterface
+        else:
+            text = self.interner.string
+            metadata = self.interner.metadata
+            interface = self.interner.interface
+
+        return [{
+            "provider": ArrowheadSystem(
+                address = text(system.get("provider").get("address")),
+                port = system.get("provider").get("port"),
+                name = text(system.get("provider").get("systemName")),
+                pubkey = text(system.get("provider").get("authenticationInfo")),
+                id = system.get("provider").get("id"),
+                created_at = text(system.get("provider").get("createdAt")),
+                updated_at = text(system.get("provider").get("updatedAt")),
+                interfaces = [
+                    interface(
+                        name = _interface.get("interfaceName"),
+                        id = _interface.get("id"),
+                        created_at = _interface.get("createdAt"),
+                        updated_at = _interface.get("updatedAt"),
+                    ) for _interface in system.get("interfaces")
+                ],
+            ),
+            "service": ArrowheadService(
+                name = text(system.get("service").get("serviceDefinition")),
+                id = system.get("service").get("id"),
+                version = system.get("version"),
+                metadata = metadata(system.get("metadata")),
+                uri = text(system.get("serviceUri", "")),
+                created_at = text(system.get("service").get("createdAt")),
+                updated_at = text(system.get("service").get("updatedAt")),
+            )
+            } for system in payload.get("response", [])
+        ]
+
+
+    def require(self, *services: ArrowheadService):
+        """Declare services used by this client, so they can be prefetched.
+
+        Arguments:
+        *services (ArrowheadService) -- required services
+        """
+        for service in services:
+            if service not in self.required_services:
+                self.required_services.append(service)
+
+
+    def prefetch(self, deadline: float = None, max_workers: int = 8, **options) -> bool:
+        """Orchestrate all required services concurrently and store the providers.
+
+        Arguments:
+        deadline (float) -- time budget of the whole call in seconds, None by default
+        max_workers (int) -- number of concurrent orchestrations, 8 by default
+        **options -- orchestration flags and requirements, see 'orchestrate'
+
+        Returns:
+        success (bool) -- True when all orchestrations are successful
+
+        Note: Providers of a service are replaced only when its orchestration succeeds.
+        Note: With 'index', the providers can be searched by 'index.find'.
+        """
+        if len(self.required_services) == 0:
+            return True
+
+        end = _expires_at(deadline)
+
+        def fetch(service: ArrowheadService) -> bool:
+            success, matches = self.orchestrate(
+                service, None if end is None else end - time.monotonic(), **options
+            )
+
+            if success:
+                self.providers[service.name] = matches
+
+                if self.index is not None:
+                    self.index.refresh(service.name, matches)
+
+            return success
+
+        with ThreadPoolExecutor(max_workers = min(max_workers, len(self.required_services)), thread_name_prefix = "aclpy-prefetch") as executor:
+            return all(executor.map(fetch, list(self.required_services)))
+
+
+    def get_providers(self, service: ArrowheadService) -> List[Dict[str, any]]:
+        """Get prefetched providers of the 'service' without contacting the Core.
+
+        Arguments:
+        service (ArrowheadService) -- required service
+
+        Returns:
+        matches (List[Dict[str, (ArrowheadSystem, ArrowheadService)]]) -- list of available providers
+        """
+        return self.providers.get(service.name, [])
+
+
+    def start_refresh(self, interval: float = 30, **options):
+        """Keep prefetched providers fresh by orchestrating them in the background.
+
+        Arguments:
+        interval (float) -- time between the refreshes in seconds, 30 by default
+        **options -- orchestration flags and requirements, see 'orchestrate'
+        """
+        self.stop_refresh()
+        self._refresh_stop.clear()
+
+        def refresh():
+            while not self._refresh_stop.wait(interval):
+                try:
+                    self.prefetch(interval, **options)
+                except Exception:
+                    pass
+
+        self._refresh_thread = threading.Thread(target = refresh, name = "aclpy-refresh", daemon = True)
+        self._refresh_thread.start()
+
+
+    def stop_refresh(self):
+        """Stop refreshing the prefetched providers."""
+        if self._refresh_thread is not None:
+            self._refresh_stop.set()
+            self._refresh_thread.join()
+            self._refresh_thread = None
+
+
+    def obtain_id(self, service_name: str = "dummy", deadline: float = None) -> bool:
         """Obtain the ID of this client.
 
         Arguments:
         service_name (str) -- name of the service used to obtain system id, dummy by default
+        deadline (float) -- time budget of the whole call (including retries) in seconds, None by default
 
         Returns:
         success (bool) -- True when id was successfully received
@@ -171,17 +615,20 @@ class ArrowheadClient(ArrowheadSystem):
             name = service_name
         )
 
+        end = _expires_at(deadline)
+        remaining = lambda: None if end is None else end - time.monotonic()
+
         # Register a service
-        success = self.register_service(service)
+        success = self.register_service(service, remaining())
 
         # If not successful, we try to unregister service first.
         if not success:
-            if not self.unregister_service(service):
+            if not self.unregister_service(service, remaining()):
                 return False
 
-            success = self.register_service(service)
+            success = self.register_service(service, remaining())
 
         # Clean after ourselves.
-        self.unregister_service(service)
+        self.unregister_service(service, remaining())
 
         return success and self.id >= 0
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# client_pem.py
+"""Arrowhead Client class using PEM certificates.
+"""
+
+from typing import List
+
+from aclpy.cache import OrchestrationCache
+from aclpy.intern import Interner
+from aclpy.probe import Prober
+from aclpy.snapshot import Snapshot
+from aclpy.client.client import ArrowheadClient as ArrowheadClientBase
+from aclpy.connector.connector_pem import ArrowheadConnector
+from aclpy.interface import ArrowheadInterface
+from aclpy.server import ArrowheadServer
+from aclpy.service import ArrowheadService
+
+
+class ArrowheadClient(ArrowheadClientBase):
+    """ArrowheadClient class for utilizing PEM files to communicate with Arrowhead Core.
+
+    Additional attributes:
+    certfile (str) -- path to the PEM certificate (chain)
+    keyfile (str) -- path to the PEM private key
+    keypass (str) -- password to the private key, None by default
+    pubkey (str) -- public key, mutually exclusive with 'pubfile'
+    pubfile (str) -- path to the public key .pub, mutually exclusive with 'pubkey'
+    cafile (str) -- path to the PEM certificate authority file
+    server (ArrowheadServer) -- configuration of the Arrowhead Core server
+    interfaces (List[ArrowheadInterfaces]) -- list of available interfaces, [] by default
+    warmup (bool) -- connect to the core systems in the background right away, False by default
+    cache (OrchestrationCache) -- cache for the orchestration responses, None (disabled) by default
+    interner (Interner) -- shares repeated strings and interfaces of the providers, None (disabled) by default
+    prober (Prober) -- orders the providers by their reachability, None (disabled) by default
+    snapshot (Snapshot) -- last results stored on the disk, used when the Core is unreachable, None (disabled) by default
+    required_services (List[ArrowheadService]) -- services orchestrated during the construction, [] by default
+    refresh_interval (float) -- refresh the required services in the background, None (disabled) by default
+
+    Note: When pub* are not given, the public key is obtained from the certificate.
+    Note: Rotated files are loaded automatically, see 'ArrowheadConnector.reload_interval'.
+    """
+
+    def __init__(self, *,
+            name: str,
+            address: str,
+            port: int,
+            certfile: str,
+            keyfile: str,
+            keypass: str = None,
+            pubkey: str = None,
+            pubfile: str = None,
+            cafile: str,
+            server: ArrowheadServer,
+            interfaces: List[ArrowheadInterface] = [],
+            warmup: bool = False,
+            cache: OrchestrationCache = None,
+            interner: Interner = None,
+            prober: Prober = None,
+            snapshot: Snapshot = None,
+            required_services: List[ArrowheadService] = [],
+            refresh_interval: float = None,
+    ):
+        """Initialize ArrowheadClient class."""
+        def load() -> bytes:
+            from OpenSSL import crypto
+
+            with open(certfile, "rb") as f:
+                return crypto.dump_publickey(
+                    crypto.FILETYPE_PEM,
+                    crypto.load_certificate(crypto.FILETYPE_PEM, f.read()).get_pubkey()
+                )
+
+        self.connector = ArrowheadConnector(server)
+
+        super(ArrowheadClient, self).__init__(name, address, port, self._read_pubkey(pubkey, pubfile, load), self.connector)
+
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self.keypass = keypass
+        self.pubfile = pubfile
+        self.cafile = cafile
+
+        self._setup(
+            interfaces = interfaces,
+            warmup = warmup,
+            cache = cache,
+            interner = interner,
+            prober = prober,
+            snapshot = snapshot,
+            required_services = required_services,
+            refresh_interval = refresh_interval,
+        )
@@ -5,10 +5,15 @@
 
 from typing import List
 
+from aclpy.cache import OrchestrationCache
+from aclpy.intern import Interner
+from aclpy.probe import Prober
+from aclpy.snapshot import Snapshot
 from aclpy.client.client import ArrowheadClient as ArrowheadClientBase
 from aclpy.connector.connector_pkcs12 import ArrowheadConnector
 from aclpy.interface import ArrowheadInterface
 from aclpy.server import ArrowheadServer
+from aclpy.service import ArrowheadService
 
 
 class ArrowheadClient(ArrowheadClientBase):
@@ -22,6 +27,13 @@ class ArrowheadClient(ArrowheadClientBase):
     cafile (str) -- path to the certificate authority file .ca
     server (ArrowheadServer) -- configuration of the Arrowhead Core server
     interfaces (List[ArrowheadInterfaces]) -- list of available interfaces, [] by default
+    warmup (bool) -- connect to the core systems in the background right away, False by default
+    cache (OrchestrationCache) -- cache for the orchestration responses, None (disabled) by default
+    interner (Interner) -- shares repeated strings and interfaces of the providers, None (disabled) by default
+    prober (Prober) -- orders the providers by their reachability, None (disabled) by default
+    snapshot (Snapshot) -- last results stored on the disk, used when the Core is unreachable, None (disabled) by default
+    required_services (List[ArrowheadService]) -- services orchestrated during the construction, [] by default
+    refresh_interval (float) -- refresh the required services in the background, None (disabled) by default
 
     Note: When pub* are not given, the public key is obtained from p12 file.
     """
@@ -37,36 +49,40 @@ class ArrowheadClient(ArrowheadClientBase):
             cafile: str,
             server: ArrowheadServer,
             interfaces: List[ArrowheadInterface] = [],
+            warmup: bool = False,
+            cache: OrchestrationCache = None,
+            interner: Interner = None,
+            prober: Prober = None,
+            snapshot: Snapshot = None,
+            required_services: List[ArrowheadService] = [],
+            refresh_interval: float = None,
     ):
         """Initialize ArrowheadClient class."""
-        if pubkey is not None and pubfile is not None:
-            raise ValueError("Conflict betwen pubkey and pubfile. Provide only one of them.")
-
-        if pubfile is not None:
-            # Read pubkey first
-            with open(pubfile, "r") as f:
-                pubkey = f.read()
-
-        if pubkey is None:
+        def load() -> bytes:
             from OpenSSL import crypto
 
-            pubkey = crypto.dump_publickey(
-                crypto.FILETYPE_PEM,
-                crypto.load_pkcs12(
-                    open(p12file, "rb").read(),
-                    p12pass
-                ).get_certificate().get_pubkey()
-            )
-
+            with open(p12file, "rb") as f:
+                return crypto.dump_publickey(
+                    crypto.FILETYPE_PEM,
+                    crypto.load_pkcs12(f.read(), p12pass).get_certificate().get_pubkey()
+                )
 
         self.connector = ArrowheadConnector(server)
 
-        super(ArrowheadClient, self).__init__(name, address, port, str(pubkey).replace("\n", ""), self.connector)
+        super(ArrowheadClient, self).__init__(name, address, port, self._read_pubkey(pubkey, pubfile, load), self.connector)
 
         self.p12file = p12file
         self.p12pass = p12pass
         self.pubfile = pubfile
         self.cafile = cafile
 
-        for interface in interfaces:
-            self.interfaces.append(interface)
+        self._setup(
+            interfaces = interfaces,
+            warmup = warmup,
+            cache = cache,
+            interner = interner,
+            prober = prober,
+            snapshot = snapshot,
+            required_services = required_services,
+            refresh_interval = refresh_interval,
+        )
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# invoker.py
+"""Invocation of the services provided by other Arrowhead systems.
+"""
+
+import threading
+
+import requests
+
+from typing import Dict, List, Tuple
+
+from aclpy.client.client import ArrowheadClient
+
+
+class ServiceInvoker(object):
+    """ServiceInvoker class for calling a service on the orchestrated providers.
+
+    Requests are sent using the session of the client's connector, so they use the already
+    loaded certificate and keep-alive connections to each provider. When a provider fails,
+    the request is sent to the next one, which is then used for the following requests.
+
+    Attributes:
+    client (ArrowheadClient) -- client with a HTTPS connector, e.g., 'aclpy.client.client_pkcs12.ArrowheadClient'
+    matches (List[Dict[str, (ArrowheadSystem, ArrowheadService)]]) -- providers, see 'ArrowheadClient.orchestrate'
+    scheme (str) -- scheme of the provider URLs, 'https' by default
+    timeout (Tuple[float, float]) -- connect and read timeouts of each attempt, (5, 30) by default
+    retry_statuses (Tuple[int, ...]) -- HTTP codes for which the next provider is tried, 502, 503 and 504 by default
+
+    Note: Requests are not idempotent in general; failing over a request that reached
+    the provider may execute it twice.
+    """
+
+    def __init__(self, client: ArrowheadClient, matches: List[Dict[str, any]], *,
+            scheme: str = "https",
+            timeout: Tuple[float, float] = (5.0, 30.0),
+            retry_statuses: Tuple[int, ...] = (502, 503, 504),
+    ):
+        """Initialize ServiceInvoker class."""
+        super(ServiceInvoker, self).__init__()
+
+        self.client = client
+        self.scheme = scheme
+        self.timeout = timeout
+        self.retry_statuses = retry_statuses
+
+        self._lock = threading.Lock()
+        self.update(matches)
+
+
+    def update(self, matches: List[Dict[str, any]]):
+        """Replace the providers, e.g., after a new orchestration.
+
+        Arguments:
+        matches (List[Dict[str, (ArrowheadSystem, ArrowheadService)]]) -- providers, see 'ArrowheadClient.orchestrate'
+        """
+        urls = [
+            "%s://%s:%d/%s" % (
+                self.scheme,
+                match["provider"].address,
+                match["provider"].port,
+                match["service"].uri.lstrip("/"),
+            ) for match in matches
+        ]
+
+        with self._lock:
+            self.matches = matches
+            self._urls = urls
+            self._current = 0
+
+
+    def get_url(self, index: int = None) -> str:
+        """Get URL of the service at a provider.
+
+        Arguments:
+        index (int) -- position of the provider in 'matches', currently used one by default
+
+        Returns:
+        url (str) -- URL of the service, None when there are no providers
+        """
+        with self._lock:
+            if len(self._urls) == 0:
+                return None
+
+            return self._urls[self._current if index is None else index]
+
+
+    def request(self, method: str, path: str = "", **kwargs) -> Tuple[bool, requests.Response]:
+        """Send a request to the service, failing over to the other providers.
+
+        Arguments:
+        method (str) -- HTTP method, e.g., 'GET'
+        path (str) -- path appended to the URI of the service, '' by default
+        **kwargs -- other arguments of 'requests.Session.request', e.g., 'json' or 'params'
+
+        Returns:
+        success (bool) -- True when a provider responded without an error in 'retry_statuses'
+        response (requests.Response) -- last received response, None when no provider responded
+        """
+        session = self.client.connector._get_session(self.client)
+        kwargs.setdefault("timeout", self.timeout)
+
+        with self._lock:
+            urls = self._urls
+            start = self._current
+
+        response = None
+
+        for attempt in range(len(urls)):
+            index = (start + attempt) % len(urls)
+
+            try:
+                response = session.request(method, urls[index] + path, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                continue
+
+            if response.status_code in self.retry_statuses:
+                continue
+
+            if index != start:
+                with self._lock:
+                    if self._urls is urls:
+                        self._current = index
+
+            return True, response
+
+        return False, response
+
+
+    def get(self, path: str = "", **kwargs) -> Tuple[bool, requests.Response]:
+        """Send a GET request to the service, see 'request'."""
+        return self.request("GET", path, **kwargs)
+
+
+    def post(self, path: str = "", **kwargs) -> Tuple[bool, requests.Response]:
+        """Send a POST request to the service, see 'request'."""
+        return self.request("POST", path, **kwargs)
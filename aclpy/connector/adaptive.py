@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# adaptive.py
+"""Timeouts adapting to the recent latencies of the Core.
+"""
+
+import threading
+
+from typing import Dict
+
+from aclpy.stats import LatencyWindow
+
+
+class AdaptiveTimeouts(object):
+    """AdaptiveTimeouts class for computing read timeouts from the recent latencies.
+
+    Latencies are tracked separately for each core system and operation. The timeout is
+    the 'percentile' of the recent latencies times 'multiplier', kept within 'floor' and
+    'ceiling'. Until 'min_samples' latencies are observed, the static timeouts are used.
+
+    Only responses received from the Core are recorded. Each request cut off by the timeout
+    extends the timeout by 'step' (up to 'max_backoff' times the computed value), so a slow
+    period is tolerated, while a hung replica is still cut off quickly. The next response
+    resets the extension.
+
+    Attributes:
+    percentile (float) -- percentile of the recent latencies used as the base, 99 by default
+    multiplier (float) -- multiplier of the percentile, 2 by default
+    floor (float) -- minimal timeout in seconds, 0.5 by default
+    ceiling (float) -- maximal timeout in seconds, 30 by default
+    min_samples (int) -- number of observed requests required before adapting, 20 by default
+    step (float) -- relative extension of the timeout after each timeout, 0.25 by default
+    max_backoff (float) -- maximal extension of the timeout by the timeouts, 2 (double) by default
+    window (int) -- number of the latest latencies kept for each core system and operation, 200 by default
+    """
+
+    def __init__(self, *,
+            percentile: float = 99,
+            multiplier: float = 2.0,
+            floor: float = 0.5,
+            ceiling: float = 30.0,
+            min_samples: int = 20,
+            step: float = 0.25,
+            max_backoff: float = 2.0,
+            window: int = 200,
+    ):
+        """Initialize AdaptiveTimeouts class."""
+        super(AdaptiveTimeouts, self).__init__()
+
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+        self.step = step
+        self.max_backoff = max_backoff
+        self.window = window
+
+        self._latencies = {}
+        self._backoff = {}
+        self._lock = threading.Lock()
+
+
+    def _get_window(self, core_system: str, operation: str) -> LatencyWindow:
+        """Get latencies of an operation, creating the window when missing."""
+        with self._lock:
+            return self._latencies.setdefault((core_system, operation), LatencyWindow(self.window))
+
+
+    def record(self, core_system: str, operation: str, duration: float):
+        """Store the latency of a request.
+
+        Arguments:
+        core_system (str) -- name of the core system
+        operation (str) -- name of the operation, see 'OPERATIONS'
+        duration (float) -- time in seconds from sending the request to receiving the response
+        """
+        self._get_window(core_system, operation).add(duration)
+
+        with self._lock:
+            self._backoff.pop((core_system, operation), None)
+
+
+    def timed_out(self, core_system: str, operation: str):
+        """Extend the timeout of an operation after a request ran out of time.
+
+        Arguments:
+        core_system (str) -- name of the core system
+        operation (str) -- name of the operation, see 'OPERATIONS'
+        """
+        key = (core_system, operation)
+
+        with self._lock:
+            self._backoff[key] = min(self._backoff.get(key, 1.0) * (1 + self.step), self.max_backoff)
+
+
+    def get(self, core_system: str, operation: str) -> float:
+        """Get the current timeout of an operation.
+
+        Arguments:
+        core_system (str) -- name of the core system
+        operation (str) -- name of the operation, see 'OPERATIONS'
+
+        Returns:
+        timeout (float) -- read timeout in seconds, None when there are not enough samples
+        """
+        latencies = self._get_window(core_system, operation)
+
+        if len(latencies) < self.min_samples:
+            return None
+
+        with self._lock:
+            backoff = self._backoff.get((core_system, operation), 1.0)
+
+        timeout = max(latencies.percentile(self.percentile) * self.multiplier, self.floor)
+
+        return min(timeout * backoff, self.ceiling)
+
+
+    def values(self) -> Dict[str, Dict[str, float]]:
+        """Get the current timeouts of all observed operations.
+
+        Returns:
+        timeouts (Dict[str, Dict[str, float]]) -- timeout of each operation for each core system,
+                                                  None when there are not enough samples
+        """
+        with self._lock:
+            keys = list(self._latencies.keys())
+
+        timeouts = {}
+
+        for core_system, operation in keys:
+            timeouts.setdefault(core_system, {})[operation] = self.get(core_system, operation)
+
+        return timeouts
+
+
+    def clear(self):
+        """Forget all latencies, e.g., after the Core was moved."""
+        with self._lock:
+            self._latencies.clear()
+            self._backoff.clear()
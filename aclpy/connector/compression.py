@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# compression.py
+"""Compression of the messages exchanged with Arrowhead Core.
+"""
+
+import gzip
+import zlib
+
+from typing import Callable, Dict
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Available codecs and their compression functions
+CODECS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": lambda data: gzip.compress(data, compresslevel = 6),
+    "deflate": lambda data: zlib.compress(data, 6),
+}
+
+if brotli is not None:
+    CODECS["br"] = lambda data: brotli.compress(data, quality = 5)
+
+
+def accept_encoding() -> str:
+    """Get value of the 'Accept-Encoding' header for all available codecs.
+
+    Returns:
+    header (str) -- supported codecs, e.g., 'gzip, deflate'
+    """
+    return ", ".join(CODECS.keys())
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    """Compress 'data' using 'codec'.
+
+    Arguments:
+    data (bytes) -- data to be compressed
+    codec (str) -- name of the codec, see 'CODECS'
+
+    Returns:
+    data (bytes) -- compressed data
+    """
+    if codec not in CODECS:
+        raise ValueError("Unsupported codec '%s'. Available: %s." % (codec, accept_encoding()))
+
+    return CODECS[codec](data)
@@ -3,10 +3,18 @@
 """Connector class for handling requests to Arrowhead Core.
 """
 
+import itertools
 import sys
+import threading
+import time
 
-from typing import Dict, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
+from aclpy.connector import ratelimit
+from aclpy.connector.ratelimit import RateLimiter
+from aclpy.connector import tracing
+from aclpy.connector.tracing import Trace
 from aclpy.server import ArrowheadServer
 from aclpy.system import ArrowheadSystem
 
@@ -72,13 +80,142 @@ def report_error(self, status_code: int, system_name: str, operation: str):
         print ("Unknown error with code %d when trying to %s with the %s." % (status_code, system_name, operation), file=sys.stderr)
 
 
+# Core system handling each operation
+OPERATIONS = {
+    "orchestrate": "orchestrator",
+    "register_service": "serviceregistry",
+    "unregister_service": "serviceregistry",
+    "register_system": "serviceregistry",
+    "query_service": "serviceregistry",
+}
+
+
+# Service registered by each core system, used for discovering it in the Service Registry
+CORE_SERVICES = {
+    "orchestrator": "orchestration-service",
+    "authorization": "auth-public-key",
+}
+
+
+# Default time budget of each operation in seconds
+DEADLINES = {
+    "orchestrate": 10.0,
+    "register_service": 30.0,
+    "unregister_service": 30.0,
+    "register_system": 30.0,
+    "query_service": 10.0,
+    "warmup": 10.0,
+}
+
+
+class Timeouts(tuple):
+    """Connect and read timeouts of a request, see 'ArrowheadConnector.get_timeout'.
+
+    Attributes:
+    expires_at (float) -- time.monotonic() by which the whole request has to be finished, None for no limit
+
+    Note: It is a tuple of two items, so it can be passed directly as 'timeout' to 'requests'.
+    """
+
+    def __new__(cls, connect_timeout: float, read_timeout: float, expires_at: float = None):
+        """Create Timeouts instance."""
+        timeouts = super(Timeouts, cls).__new__(cls, (connect_timeout, read_timeout))
+        timeouts.expires_at = expires_at
+
+        return timeouts
+
+
+def timeout_error(operation: str) -> Tuple[int, Dict[str, any]]:
+    """Create a response for an operation that ran out of time.
+
+    Arguments:
+    operation (str) -- name of the operation
+
+    Returns:
+    status_code (int) -- HTTP code 408 (Request Timeout)
+    response (Dict[str, any]) -- error message in the format of Arrowhead Core, see 'is_local_error'
+    """
+    return (408, {
+        "errorCode": 408,
+        "exceptionType": "TIMEOUT",
+        "errorMessage": "Operation '%s' exceeded its time budget." % operation,
+        "origin": "client",
+    })
+
+
+def is_local_error(response: Dict[str, any]) -> bool:
+    """Check whether a response was created by the client instead of received from the Core.
+
+    Arguments:
+    response (Dict[str, any]) -- message returned by the connector
+
+    Returns:
+    local (bool) -- True for 'timeout_error' and 'unavailable_error'
+    """
+    return isinstance(response, dict) and response.get("origin") == "client"
+
+
+def service_url(entry: Dict[str, any]) -> str:
+    """Get base URL of a core system from its entry in the Service Registry.
+
+    Arguments:
+    entry (Dict[str, any]) -- item of 'serviceQueryData' received from the Service Registry
+
+    Returns:
+    url (str) -- URL to the system (with trailing slash), e.g., 'https://10.0.0.1:8441/orchestrator/'
+    """
+    provider = entry.get("provider", {})
+    endpoint = entry.get("serviceUri", "").strip("/").split("/")[0]
+
+    return "%s://%s:%s/%s" % (
+        "http" if entry.get("secure") == "NOT_SECURE" else "https",
+        provider.get("address"),
+        provider.get("port"),
+        endpoint + "/" if endpoint else "",
+    )
+
+
+def unavailable_error(operation: str) -> Tuple[int, Dict[str, any]]:
+    """Create a response for an operation that could not reach the Core.
+
+    Arguments:
+    operation (str) -- name of the operation
+
+    Returns:
+    status_code (int) -- HTTP code 503 (Service Unavailable)
+    response (Dict[str, any]) -- error message in the format of Arrowhead Core, see 'is_local_error'
+    """
+    return (503, {
+        "errorCode": 503,
+        "exceptionType": "UNAVAILABLE",
+        "errorMessage": "Operation '%s' could not connect to the Core." % operation,
+        "origin": "client",
+    })
+
+
 class ArrowheadConnector(object):
     """ArrowheadConnector class for handing requests to the Arrowhead Core.
 
     Attributes:
     server (ArrowheadServer) -- configuration of the Arrowhead Core server
     last_error (Error) -- last received error
-    timeout (int) -- timeout limit for requests
+    timeout (int) -- timeout limit for requests, overrides 'connect_timeout' and 'read_timeout' when set
+    connect_timeout (float) -- timeout for establishing a connection, 5 s by default
+    read_timeout (float) -- timeout for receiving data, None (limited only by the time budget) by default
+    deadlines (Dict[str, float]) -- default time budget of each operation, see 'DEADLINES'
+    recorder (Recorder) -- recorder of all requests sent to the Core and their responses, None (disabled) by default
+    hedging (Hedging) -- hedging of slow requests, None (disabled) by default
+    tracer (Tracer) -- timing breakdown and log of slow requests, None (disabled) by default
+    adaptive (AdaptiveTimeouts) -- read timeouts computed from the recent latencies, None (static) by default
+    discovery (bool) -- discover the core systems through the Service Registry, False by default
+    discovery_ttl (float) -- time in seconds after which the core systems are discovered again,
+                             300 by default, None to keep them until a request fails
+    discovery_retry (float) -- time in seconds before a failed discovery is tried again, 30 by default
+
+    Note: Rate limits of the core systems are taken from 'server', see 'get_limiter'.
+    Note: The time budget is applied to each request. Connecting gets at most half of it and
+    the rest is left for the response, so the response starts within the budget. Connectors
+    receiving the body in parts check 'expires_at' of the timeouts between the reads.
     """
 
     def __init__(self, server: ArrowheadServer):
@@ -88,14 +225,28 @@ class ArrowheadConnector(object):
         self.server = server
         self.last_error = None
         self.timeout = None
-
-
-    def orchestrate(self, system: ArrowheadSystem, message: Dict[str, any]) -> Tuple[bool, int, Dict[str, any]]:
+        self.connect_timeout = 5.0
+        self.read_timeout = None
+        self.deadlines = dict(DEADLINES)
+        self.recorder = None
+        self.hedging = None
+        self.tracer = None
+        self.adaptive = None
+        self.discovery = False
+        self.discovery_ttl = 300.0
+        self.discovery_retry = 30.0
+
+        self._limiters = {}
+        self._limiters_lock = threading.Lock()
+
+
+    def orchestrate(self, system: ArrowheadSystem, message: Dict[str, any], expires_at: float = None) -> Tuple[bool, int, Dict[str, any]]:
         """Request available providers from the Orchestrator.
 
         Arguments:
         system (ArrowheadSystem) -- system requesting the orchestration
         message (Dict[str, any]) -- message to be sent to the Orchestrator
+        expires_at (float) -- time.monotonic() by which the request has to be finished, None by default
 
         Returns:
         success (bool) -- True when orchestration is successful
@@ -104,7 +255,7 @@ class ArrowheadConnector(object):
 
         Note: 'message' is created by 'aclpy.messages.build_orchestration_request'.
         """
-        status_code, payload = self._orchestrate(system, message)
+        status_code, payload = self._call("orchestrate", system, message, expires_at)
 
         success = status_code < 300
 
@@ -126,12 +277,13 @@ class ArrowheadConnector(object):
         return True, status_code, payload
 
 
-    def register_service(self, system: ArrowheadSystem, message: Dict[str, any]) -> Tuple[bool, int, Dict[str, any]]:
+    def register_service(self, system: ArrowheadSystem, message: Dict[str, any], expires_at: float = None) -> Tuple[bool, int, Dict[str, any]]:
         """Register a service for 'system' to the Service Registry.
 
         Arguments:
         system (ArrowheadSystem) -- system for service registration
         message (Dict[str, any]) -- message to be sent to the Service Registry
+        expires_at (float) -- time.monotonic() by which the request has to be finished, None by default
 
         Returns:
         success (bool) -- True when registration is successful
@@ -140,7 +292,7 @@ class ArrowheadConnector(object):
 
         Note: 'message' is created by 'aclpy.messages.build_register_service'.
         """
-        status_code, payload = self._register_service(system, message)
+        status_code, payload = self._call("register_service", system, message, expires_at)
 
         success = status_code < 300
 
@@ -158,12 +310,13 @@ class ArrowheadConnector(object):
         return True, status_code, payload
 
 
-    def unregister_service(self, system: ArrowheadSystem, message: Dict[str, any]) -> Tuple[bool, int, Dict[str, any]]:
+    def unregister_service(self, system: ArrowheadSystem, message: Dict[str, any], expires_at: float = None) -> Tuple[bool, int, Dict[str, any]]:
         """Unregister a service for 'system' to the Service Registry.
 
         Arguments:
         system (ArrowheadSystem) -- system for service unregistration
         message (Dict[str, any]) -- message to be sent to the Service Registry
+        expires_at (float) -- time.monotonic() by which the request has to be finished, None by default
 
         Returns:
         success (bool) -- True when unregistration is successful
@@ -172,7 +325,7 @@ class ArrowheadConnector(object):
 
         Note: 'message' is created by 'aclpy.messages.build_unregister_service'.
         """
-        status_code, payload = self._unregister_service(system, message)
+        status_code, payload = self._call("unregister_service", system, message, expires_at)
 
         success = status_code < 300
 
@@ -184,12 +337,13 @@ class ArrowheadConnector(object):
         return True, status_code, payload
 
 
-    def register_system(self, system: ArrowheadSystem, message: Dict[str, any]) -> Tuple[bool, int, Dict[str, any]]:
+    def register_system(self, system: ArrowheadSystem, message: Dict[str, any], expires_at: float = None) -> Tuple[bool, int, Dict[str, any]]:
         """Register a 'system' to Arrowhead Core via Service Registry.
 
         Arguments:
         system (ArrowheadSystem) -- system for registration
         message (Dict[str, any]) -- message to be sent to the Service Registry
+        expires_at (float) -- time.monotonic() by which the request has to be finished, None by default
 
         Returns:
         success (bool) -- True when registration is successful
@@ -198,7 +352,7 @@ class ArrowheadConnector(object):
 
         Note: 'message' is created by 'aclpy.messages.build_register_system'.
         """
-        status_code, payload = self._register_system(system, message)
+        status_code, payload = self._call("register_system", system, message, expires_at)
 
         success = status_code < 300
 
@@ -212,13 +366,317 @@ class ArrowheadConnector(object):
         return True, status_code, payload
 
 
+    def query_service(self, system: ArrowheadSystem, message: Dict[str, any], expires_at: float = None) -> Tuple[bool, int, Dict[str, any]]:
+        """Query the Service Registry for registered providers of a service.
+
+        Arguments:
+        system (ArrowheadSystem) -- system sending the query
+        message (Dict[str, any]) -- message to be sent to the Service Registry
+        expires_at (float) -- time.monotonic() by which the request has to be finished, None by default
+
+        Returns:
+        success (bool) -- True when query is successful
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- message received from the Service Registry
+
+        Note: 'message' is created by 'aclpy.messages.build_service_query'.
+        """
+        status_code, payload = self._call("query_service", system, message, expires_at)
+
+        success = status_code < 300
+
+        if not success:
+            self.last_error = Error(**payload, system_name = "Service Registry", operation = "query service")
+
+            return False, status_code, payload
+
+        return True, status_code, payload
+
+
+    def get_timeout(self, operation: str, expires_at: float = None) -> Timeouts:
+        """Compute timeouts for a request.
+
+        Arguments:
+        operation (str) -- name of the operation, see 'OPERATIONS'
+        expires_at (float) -- time.monotonic() by which the request has to be finished, None by default
+
+        Returns:
+        connect_timeout (float) -- timeout for establishing a connection, None for no limit
+        read_timeout (float) -- timeout for receiving data, None for no limit
+
+        Note: The result is 'Timeouts' carrying also the end of the time budget of the request.
+        Note: Returned timeouts are not positive when 'expires_at' has already passed.
+        Note: When 'adaptive' is set and has enough samples, it replaces the static read timeout.
+        """
+        if self.timeout is not None:
+            connect_timeout = read_timeout = self.timeout
+        else:
+            connect_timeout, read_timeout = self.connect_timeout, self.read_timeout
+
+        if self.adaptive is not None and operation in OPERATIONS:
+            adaptive_timeout = self.adaptive.get(OPERATIONS[operation], operation)
+
+            if adaptive_timeout is not None:
+                read_timeout = adaptive_timeout
+
+        now = time.monotonic()
+        budget = self.deadlines.get(operation)
+
+        if expires_at is not None and (budget is None or expires_at - now < budget):
+            budget = expires_at - now
+        elif budget is not None:
+            expires_at = now + budget
+
+        if budget is not None:
+            # Connecting and waiting for the response together fit into the budget
+            connect_timeout = budget / 2 if connect_timeout is None else min(connect_timeout, budget / 2)
+            read_timeout = budget - connect_timeout if read_timeout is None else min(read_timeout, budget - connect_timeout)
+
+        return Timeouts(connect_timeout, read_timeout, expires_at)
+
+
+    def get_limiter(self, core_system: str) -> RateLimiter:
+        """Get the rate limiter for the 'core_system'.
+
+        Arguments:
+        core_system (str) -- name of the core system
+
+        Returns:
+        limiter (RateLimiter) -- limiter configured in 'server', None when not limited
+
+        Note: Limiters are shared by all connectors in the process using the same Core, see 'ratelimit.get_shared'.
+        """
+        with self._limiters_lock:
+            if core_system not in self._limiters:
+                config = getattr(self.server, core_system)
+
+                if config.get("rate_limit") is None and config.get("max_in_flight") is None:
+                    self._limiters[core_system] = None
+                else:
+                    self._limiters[core_system] = ratelimit.get_shared(
+                        (core_system, self.server.get_configured_url(core_system)),
+                        rate = config.get("rate_limit"),
+                        max_in_flight = config.get("max_in_flight"),
+                    )
+
+            return self._limiters[core_system]
+
+
+    def limiter_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get state of all rate limiters.
+
+        Returns:
+        stats (Dict[str, Dict[str, float]]) -- queue depth and waiting times for each limited core system
+        """
+        with self._limiters_lock:
+            limiters = dict(self._limiters)
+
+        return {
+            core_system: limiter.stats()
+            for core_system, limiter in limiters.items() if limiter is not None
+        }
+
+
+    def adaptive_timeouts(self) -> Dict[str, Dict[str, float]]:
+        """Get the current adaptive timeouts.
+
+        Returns:
+        timeouts (Dict[str, Dict[str, float]]) -- read timeout of each operation for each core system,
+                                                  empty when 'adaptive' is not set
+        """
+        if self.adaptive is None:
+            return {}
+
+        return self.adaptive.values()
+
+
+    def discover(self, system: ArrowheadSystem, core_systems: List[str] = None, expires_at: float = None) -> Dict[str, bool]:
+        """Discover URLs of the core systems through the Service Registry.
+
+        Arguments:
+        system (ArrowheadSystem) -- system sending the queries
+        core_systems (List[str]) -- names of the core systems, all in 'CORE_SERVICES' by default
+        expires_at (float) -- time.monotonic() by which the queries have to be finished, None by default
+
+        Returns:
+        discovered (Dict[str, bool]) -- True for each core system with a new URL stored in 'server'
+
+        Note: When the discovery fails, the previous URL is kept and used for 'discovery_retry' seconds.
+        """
+        if core_systems is None:
+            core_systems = list(CORE_SERVICES.keys())
+
+        discovered = {}
+
+        for core_system in core_systems:
+            success, _, payload = self.query_service(
+                system,
+                {"serviceDefinitionRequirement": CORE_SERVICES[core_system]},
+                expires_at,
+            )
+
+            entries = payload.get("serviceQueryData", []) if success else []
+
+            if len(entries) > 0:
+                self.server.set_url(core_system, service_url(entries[0]), self.discovery_ttl)
+            else:
+                # Do not query the Service Registry on every request while it is failing
+                self.server.defer(core_system, self.discovery_retry)
+
+            discovered[core_system] = len(entries) > 0
+
+        return discovered
+
+
+    def _call(self, operation: str, system: ArrowheadSystem, message: Dict[str, any], expires_at: float = None) -> Tuple[int, Dict[str, any]]:
+        """Send a request for 'operation' using the implementation of the derived class.
+
+        Arguments:
+        operation (str) -- name of the operation, see 'OPERATIONS'
+        system (ArrowheadSystem) -- system sending the request
+        message (Dict[str, any]) -- message to be sent to the Core
+        expires_at (float) -- time.monotonic() by which the request has to be finished, None by default
+
+        Returns:
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- message received from the Core
+        """
+        core_system = OPERATIONS[operation]
+        discovered = self.discovery and core_system in CORE_SERVICES
+
+        if discovered and not self.server.is_fresh(core_system):
+            self.discover(system, [core_system], expires_at)
+
+        trace = None
+        status_code = None
+
+        if self.tracer is not None:
+            trace = self.tracer.begin(operation, core_system, self.server.get_url(core_system))
+
+        try:
+            status_code, payload = self._send(operation, core_system, system, message, expires_at, discovered, trace)
+        finally:
+            if trace is not None:
+                self.tracer.end(trace, status_code)
+
+        return status_code, payload
+
+
+    def _send(self, operation: str, core_system: str, system: ArrowheadSystem, message: Dict[str, any], expires_at: float, discovered: bool, trace: Trace) -> Tuple[int, Dict[str, any]]:
+        """Send a request for 'operation' respecting the rate limits and 'expires_at'. (Used by '_call'.)"""
+        if any(value is not None and value <= 0 for value in self.get_timeout(operation, expires_at)):
+            return timeout_error(operation)
+
+        limiter = self.get_limiter(core_system)
+        attempts = itertools.count()
+
+        def attempt() -> Tuple[int, Dict[str, any]]:
+            # Each attempt (including a hedged one) is limited and gets the remaining time
+            first = next(attempts) == 0
+
+            # Phases are recorded for the first attempt only, whichever thread sends it
+            tracing.set_current(trace if first else None)
+
+            if limiter is not None:
+                waiting = time.perf_counter()
+                acquired = limiter.acquire(self.get_timeout(operation, expires_at)[1])
+
+                if trace is not None and first:
+                    trace.add("queue", time.perf_counter() - waiting)
+
+                if not acquired:
+                    return timeout_error(operation)
+
+            try:
+                timeout = self.get_timeout(operation, expires_at)
+
+                if any(value is not None and value <= 0 for value in timeout):
+                    return timeout_error(operation)
+
+                sent = time.perf_counter()
+                status_code, payload = getattr(self, "_" + operation)(system, message, timeout)
+                duration = time.perf_counter() - sent
+
+                # Only responses of the Core are recorded and are latency samples; timeouts extend the timeout by a bounded step
+                if not is_local_error(payload):
+                    if self.recorder is not None:
+                        self.recorder.record(operation, message, status_code, payload, duration)
+
+                    if self.adaptive is not None:
+                        self.adaptive.record(core_system, operation, duration)
+                elif status_code == 408 and self.adaptive is not None:
+                    self.adaptive.timed_out(core_system, operation)
+
+                return status_code, payload
+            finally:
+                if limiter is not None:
+                    limiter.release()
+
+        try:
+            if self.hedging is not None and operation in self.hedging.operations:
+                status_code, payload = self.hedging.run(attempt)
+            else:
+                status_code, payload = attempt()
+        except Exception:
+            if discovered:
+                self.server.expire(core_system)
+
+            raise
+
+        # The core system might have moved; look it up again before the next request
+        if discovered and (status_code >= 500 or status_code == 408):
+            self.server.expire(core_system)
+
+        return status_code, payload
+
+
+    def warmup(self, system: ArrowheadSystem, core_systems: List[str] = None, wait: bool = False) -> Dict[str, Future]:
+        """Open and validate connections to the core systems in the background.
+
+        Arguments:
+        system (ArrowheadSystem) -- system used for the communication
+        core_systems (List[str]) -- names of the core systems, all configured by default
+        wait (bool) -- block until all connections are validated, False by default
+
+        Returns:
+        futures (Dict[str, Future]) -- futures resolving to True when the core system is reachable
+
+        Note: Failed warm-ups are not reported as errors; real requests simply connect again.
+        """
+        if core_systems is None:
+            core_systems = self.server.core_systems
+
+        executor = ThreadPoolExecutor(
+            max_workers = max(len(core_systems), 1),
+            thread_name_prefix = "aclpy-warmup",
+        )
+
+        futures = {
+            core_system: executor.submit(self._warmup_safe, system, core_system)
+            for core_system in core_systems
+        }
+
+        executor.shutdown(wait = wait)
+
+        return futures
+
+
+    def _warmup_safe(self, system: ArrowheadSystem, core_system: str) -> bool:
+        """Warm up connection to the 'core_system', suppressing all exceptions."""
+        try:
+            return self._warmup(system, core_system)
+        except Exception:
+            return False
+
+
     ## Implemented by the subclass
-    def _orchestrate(self, system: ArrowheadSystem, message: Dict[str, any]) -> Tuple[int, Dict[str, any]]:
+    def _orchestrate(self, system: ArrowheadSystem, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
         """Request available providers from the Orchestrator. (Implemented by the derived class.)
 
         Arguments:
         system (ArrowheadSystem) -- system requesting the orchestration
         message (Dict[str, any]) -- message to be sent to the Orchestrator
+        timeout (Tuple[float, float]) -- connect and read timeouts, see 'get_timeout'
 
         Returns:
         status_code (int) -- HTTP code from the response
@@ -229,12 +687,13 @@ class ArrowheadConnector(object):
         raise NotImplementedError
 
 
-    def _register_service(self, system: ArrowheadSystem, message: Dict[str, any]) -> Tuple[int, Dict[str, any]]:
+    def _register_service(self, system: ArrowheadSystem, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
         """Register a service for 'system' to the Service Registry. (Implemented by the derived class.)
 
         Arguments:
         system (ArrowheadSystem) -- system for service registration
         message (Dict[str, any]) -- message to be sent to the Service Registry
+        timeout (Tuple[float, float]) -- connect and read timeouts, see 'get_timeout'
 
         Returns:
         status_code (int) -- HTTP code from the response
@@ -245,12 +704,13 @@ class ArrowheadConnector(object):
         raise NotImplementedError
 
 
-    def _unregister_service(self, system: ArrowheadSystem, message: Dict[str, any]) -> Tuple[int, Dict[str, any]]:
+    def _unregister_service(self, system: ArrowheadSystem, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
         """Unregister a service for 'system' to the Service Registry. (Implemented by the derived class.)
 
         Arguments:
         system (ArrowheadSystem) -- system for service unregistration
         message (Dict[str, any]) -- message to be sent to the Service Registry
+        timeout (Tuple[float, float]) -- connect and read timeouts, see 'get_timeout'
 
         Returns:
         status_code (int) -- HTTP code from the response
@@ -261,12 +721,13 @@ class ArrowheadConnector(object):
         raise NotImplementedError
 
 
-    def _register_system(self, system: ArrowheadSystem, message: Dict[str, any]) -> Tuple[int, Dict[str, any]]:
+    def _register_system(self, system: ArrowheadSystem, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
         """Register a 'system' to Arrowhead Core via Service Registry. (Implemented by the derived class.)
 
         Arguments:
         system (ArrowheadSystem) -- system for registration
         message (Dict[str, any]) -- message to be sent to the Service Registry
+        timeout (Tuple[float, float]) -- connect and read timeouts, see 'get_timeout'
 
         Returns:
         status_code (int) -- HTTP code from the response
@@ -275,3 +736,33 @@ class ArrowheadConnector(object):
         Note: 'message' is created by 'aclpy.messages.build_register_system'.
         """
         raise NotImplementedError
+
+
+    def _query_service(self, system: ArrowheadSystem, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Query the Service Registry for registered providers of a service. (Implemented by the derived class.)
+
+        Arguments:
+        system (ArrowheadSystem) -- system sending the query
+        message (Dict[str, any]) -- message to be sent to the Service Registry
+        timeout (Tuple[float, float]) -- connect and read timeouts, see 'get_timeout'
+
+        Returns:
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- message received from the Service Registry
+
+        Note: 'message' is created by 'aclpy.messages.build_service_query'.
+        """
+        raise NotImplementedError
+
+
+    def _warmup(self, system: ArrowheadSystem, core_system: str) -> bool:
+        """Open and validate connection to the 'core_system'. (Implemented by the derived class.)
+
+        Arguments:
+        system (ArrowheadSystem) -- system used for the communication
+        core_system (str) -- name of the core system
+
+        Returns:
+        success (bool) -- True when the core system responded
+        """
+        raise NotImplementedError
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# connector_https.py
+"""Connector / interface to Arrowhead Core over HTTPS with client certificates.
+"""
+
+import json
+import threading
+import time
+
+import requests
+
+from typing import Dict, Tuple
+
+from aclpy.connector import tracing
+from aclpy.connector.compression import accept_encoding, compress
+from aclpy.connector.connector import ArrowheadConnector as ArrowheadConnectorBase, timeout_error, unavailable_error
+from aclpy.server import ArrowheadServer
+from aclpy.client.client import ArrowheadClient
+
+
+# Size of the parts in which the response bodies are received
+CHUNK_SIZE = 64 * 1024
+
+
+class ArrowheadConnector(ArrowheadConnectorBase):
+    """ArrowheadConnector class to handle requests to Arrowhead Core over HTTPS.
+
+    The certificate is loaded only once, when the first request is sent. Connections
+    to the Core are kept alive and reused by the following requests.
+
+    Additional attributes:
+    compress_responses (bool) -- ask the Core for compressed responses, True by default
+    compress_requests (str) -- codec used for compressing the requests, None (disabled) by default
+    compress_threshold (int) -- minimal size of a request in bytes to be compressed, 1024 by default
+
+    Note: Request compression requires the Core to accept 'Content-Encoding' of the requests.
+    Note: Connection errors are not raised; they are returned as 'unavailable_error' (503).
+    Note: Response bodies are streamed, so a request running out of its time budget while
+    receiving the body is cut off and returned as 'timeout_error' (408).
+    Note: The client certificate is provided by the derived class, see '_get_adapter'.
+    """
+
+    def __init__(self, server: ArrowheadServer):
+        """Initialize ArrowheadConnector class."""
+        super(ArrowheadConnector, self).__init__(server)
+
+        self.compress_responses = True
+        self.compress_requests = None
+        self.compress_threshold = 1024
+        self._session = None
+        self._session_lock = threading.Lock()
+
+
+    def _get_session(self, system: ArrowheadClient) -> requests.Session:
+        """Get a session with loaded certificate of the 'system'.
+
+        Arguments:
+        system (ArrowheadSystem) -- system used for the communication
+
+        Returns:
+        session (requests.Session) -- session shared by all requests of this connector
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    start = time.perf_counter()
+
+                    session = requests.Session()
+                    session.mount("https://", self._get_adapter(system))
+                    session.verify = system.cafile
+                    session.headers["Accept-Encoding"] = accept_encoding() if self.compress_responses else "identity"
+
+                    self._session = session
+
+                    trace = tracing.current()
+
+                    if trace is not None:
+                        trace.add("certificate", time.perf_counter() - start)
+
+        return self._session
+
+
+    def _post(self, system: ArrowheadClient, url: str, message: Dict[str, any], timeout: Tuple[float, float]) -> requests.Response:
+        """Send 'message' to 'url', compressing it when enabled and large enough.
+
+        Arguments:
+        system (ArrowheadSystem) -- system used for the communication
+        url (str) -- URL of the endpoint
+        message (Dict[str, any]) -- message to be sent
+        timeout (Tuple[float, float]) -- connect and read timeouts
+
+        Returns:
+        response (requests.Response) -- received response, the body is read by '_json'
+        """
+        data = json.dumps(message, separators = (",", ":")).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+
+        if self.compress_requests is not None and len(data) >= self.compress_threshold:
+            data = compress(data, self.compress_requests)
+            headers["Content-Encoding"] = self.compress_requests
+
+        session = self._get_session(system)
+        trace = tracing.current()
+
+        if trace is not None:
+            trace.sending()
+
+        res = session.post(
+            url,
+            data = data,
+            headers = headers,
+            timeout = timeout,
+            stream = True,
+        )
+
+        if trace is not None:
+            trace.received(res.elapsed.total_seconds())
+
+        return res
+
+
+    def _receive(self, res: requests.Response, timeout: Tuple[float, float]) -> bytes:
+        """Download the body of 'res' within the time budget of the request.
+
+        Arguments:
+        res (requests.Response) -- streamed response
+        timeout (Tuple[float, float]) -- connect and read timeouts, see 'get_timeout'
+
+        Returns:
+        content (bytes) -- body of the response
+
+        Note: requests.exceptions.Timeout is raised when 'expires_at' of the timeouts passes.
+        """
+        expires_at = getattr(timeout, "expires_at", None)
+
+        if expires_at is None:
+            return res.content
+
+        chunks = []
+
+        try:
+            self._limit_read(res, timeout)
+
+            for chunk in res.iter_content(CHUNK_SIZE):
+                chunks.append(chunk)
+                self._limit_read(res, timeout)
+        except requests.exceptions.RequestException as e:
+            res.close()
+
+            # Read timeouts of a streamed body are reported as connection errors
+            if not isinstance(e, requests.exceptions.Timeout) and time.monotonic() < expires_at:
+                raise
+
+            raise requests.exceptions.Timeout("Response was not received within the time budget.")
+
+        return b"".join(chunks)
+
+
+    def _limit_read(self, res: requests.Response, timeout: Tuple[float, float]):
+        """Shorten the timeout of the next read from the socket of 'res' to the remaining budget.
+
+        Note: requests.exceptions.Timeout is raised when 'expires_at' of the timeouts has passed.
+        """
+        remaining = timeout.expires_at - time.monotonic()
+
+        if remaining <= 0:
+            raise requests.exceptions.Timeout("Response was not received within the time budget.")
+
+        # The socket is reachable only through urllib3 internals; without it, the clock is checked between the reads
+        sock = getattr(getattr(res.raw, "_connection", None), "sock", None)
+
+        if sock is not None and (timeout[1] is None or remaining < timeout[1]):
+            sock.settimeout(remaining)
+
+
+    def _json(self, res: requests.Response, timeout: Tuple[float, float] = None) -> Dict[str, any]:
+        """Receive and decode the JSON body of 'res'.
+
+        Arguments:
+        res (requests.Response) -- received response
+        timeout (Tuple[float, float]) -- connect and read timeouts, see 'get_timeout', None by default
+
+        Returns:
+        response (Dict[str, any]) -- decoded body
+        """
+        trace = tracing.current()
+        start = time.perf_counter()
+        content = self._receive(res, timeout)
+        decoding = time.perf_counter()
+        payload = json.loads(content)
+
+        if trace is not None:
+            trace.add("download", decoding - start)
+            trace.add("decode", time.perf_counter() - decoding)
+
+        return payload
+
+
+    def _orchestrate(self, system: ArrowheadClient, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Request available providers from the Orchestrator.
+
+        Arguments:
+        system (ArrowheadSystem) -- system requesting the orchestration
+        message (Dict[str, any]) -- message to be sent to the Orchestrator
+        timeout (Tuple[float, float]) -- connect and read timeouts
+
+        Returns:
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- message received from the Orchestrator
+
+        Note: 'message' is created by 'aclpy.messages.build_orchestration_request'.
+        """
+        try:
+            res = self._post(system, self.server.get_url("orchestrator") + "orchestration", message, timeout)
+            return (res.status_code, self._json(res, timeout))
+        except requests.exceptions.Timeout:
+            return timeout_error("orchestrate")
+        except requests.exceptions.ConnectionError:
+            return unavailable_error("orchestrate")
+
+
+    def _register_service(self, system: ArrowheadClient, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Register a service for 'system' to the Service Registry.
+
+        Arguments:
+        system (ArrowheadSystem) -- system for service registration
+        message (Dict[str, any]) -- message to be sent to the Service Registry
+        timeout (Tuple[float, float]) -- connect and read timeouts
+
+        Returns:
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- message received from the Service Registry
+
+        Note: 'message' is created by 'aclpy.messages.build_register_service'.
+        """
+        try:
+            res = self._post(system, self.server.get_url("serviceregistry") + "register", message, timeout)
+            return (res.status_code, self._json(res, timeout))
+        except requests.exceptions.Timeout:
+            return timeout_error("register_service")
+        except requests.exceptions.ConnectionError:
+            return unavailable_error("register_service")
+
+
+    def _unregister_service(self, system: ArrowheadClient, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Unregister a service for 'system' to the Service Registry.
+
+        Arguments:
+        system (ArrowheadSystem) -- system for service unregistration
+        message (Dict[str, any]) -- message to be sent to the Service Registry
+        timeout (Tuple[float, float]) -- connect and read timeouts
+
+        Returns:
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- message received from the Service Registry
+
+        Note: 'message' is created by 'aclpy.messages.build_unregister_service'.
+        """
+        try:
+            res = self._get_session(system).delete(
+                self.server.get_url("serviceregistry")
+                    + "unregister?"
+                    + "&".join(
+                        ["%s=%s" % (key, value) for key, value in message.items()]
+                    ),
+                timeout = timeout,
+            )
+        except requests.exceptions.Timeout:
+            return timeout_error("unregister_service")
+        except requests.exceptions.ConnectionError:
+            return unavailable_error("unregister_service")
+
+        return (res.status_code, {})
+
+
+    def _register_system(self, system: ArrowheadClient, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Register a 'system' to Arrowhead Core via Service Registry.
+
+        Arguments:
+        system (ArrowheadSystem) -- system for registration
+        message (Dict[str, any]) -- message to be sent to the Service Registry
+        timeout (Tuple[float, float]) -- connect and read timeouts
+
+        Returns:
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- message received from the Service Registry
+
+        Note: 'message' is created by 'aclpy.messages.build_register_system'.
+        """
+        try:
+            res = self._post(system, self.server.get_url("serviceregistry") + "register-system", message, timeout)
+            return (res.status_code, self._json(res, timeout))
+        except requests.exceptions.Timeout:
+            return timeout_error("register_system")
+        except requests.exceptions.ConnectionError:
+            return unavailable_error("register_system")
+
+
+    def _query_service(self, system: ArrowheadClient, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Query the Service Registry for registered providers of a service.
+
+        Arguments:
+        system (ArrowheadSystem) -- system sending the query
+        message (Dict[str, any]) -- message to be sent to the Service Registry
+        timeout (Tuple[float, float]) -- connect and read timeouts
+
+        Returns:
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- message received from the Service Registry
+
+        Note: 'message' is created by 'aclpy.messages.build_service_query'.
+        """
+        try:
+            res = self._post(system, self.server.get_url("serviceregistry") + "query", message, timeout)
+            return (res.status_code, self._json(res, timeout))
+        except requests.exceptions.Timeout:
+            return timeout_error("query_service")
+        except requests.exceptions.ConnectionError:
+            return unavailable_error("query_service")
+
+
+    def _warmup(self, system: ArrowheadClient, core_system: str) -> bool:
+        """Open and validate connection to the 'core_system'.
+
+        Arguments:
+        system (ArrowheadSystem) -- system used for the communication
+        core_system (str) -- name of the core system
+
+        Returns:
+        success (bool) -- True when the core system responded
+        """
+        res = self._get_session(system).get(
+            self.server.get_url(core_system) + "echo",
+            timeout = self.get_timeout("warmup"),
+        )
+
+        return res.status_code < 300
+
+
+    ## Implemented by the subclass
+    def _get_adapter(self, system: ArrowheadClient) -> requests.adapters.HTTPAdapter:
+        """Create an adapter holding the client certificate of the 'system'. (Implemented by the derived class.)
+
+        Arguments:
+        system (ArrowheadSystem) -- system used for the communication
+
+        Returns:
+        adapter (requests.adapters.HTTPAdapter) -- adapter mounted for 'https://'
+        """
+        raise NotImplementedError
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# connector_pem.py
+"""Connector / interface to Arrowhead Core using PEM certificates.
+"""
+
+import os
+import ssl
+import time
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from typing import Tuple
+
+from aclpy.connector.connector_https import ArrowheadConnector as ArrowheadConnectorBase
+from aclpy.connector.tls import ResumingSSLContext
+from aclpy.server import ArrowheadServer
+from aclpy.client.client import ArrowheadClient
+
+
+def create_ssl_context(certfile: str, keyfile: str, keypass: str = None, cafile: str = None) -> ssl.SSLContext:
+    """Create an SSL context with the client certificate.
+
+    Arguments:
+    certfile (str) -- path to the PEM certificate (chain)
+    keyfile (str) -- path to the PEM private key
+    keypass (str) -- password to the private key, None by default
+    cafile (str) -- path to the PEM certificate authority file, None (system defaults) by default
+
+    Returns:
+    context (ssl.SSLContext) -- context for the connections to the Core
+    """
+    context = ssl.create_default_context(cafile = cafile)
+    context.load_cert_chain(certfile, keyfile, keypass)
+
+    return context
+
+
+class SSLContextAdapter(HTTPAdapter):
+    """SSLContextAdapter class for using a prepared SSL context with requests.
+
+    Attributes:
+    ssl_context (ResumingSSLContext) -- context used for all connections of the adapter
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext, *args, **kwargs):
+        """Initialize SSLContextAdapter class."""
+        self.ssl_context = ResumingSSLContext(ssl_context)
+
+        super(SSLContextAdapter, self).__init__(*args, **kwargs)
+
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+
+        return super(SSLContextAdapter, self).init_poolmanager(*args, **kwargs)
+
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+
+        return super(SSLContextAdapter, self).proxy_manager_for(*args, **kwargs)
+
+
+class ArrowheadConnector(ArrowheadConnectorBase):
+    """ArrowheadConnector class to handle requests to Arrowhead Core using PEM files.
+
+    The certificate, key and CA files are loaded into an SSL context once. When any of them
+    changes on the disk, the context is loaded again and new requests use it right away.
+
+    Additional attributes:
+    reload_interval (float) -- how often the files are checked for changes in seconds,
+                               5 by default, None to disable reloading
+
+    Note: Requests that are already being sent finish with the previous certificate.
+    """
+
+    def __init__(self, server: ArrowheadServer):
+        """Initialize ArrowheadConnector class."""
+        super(ArrowheadConnector, self).__init__(server)
+
+        self.reload_interval = 5
+        self._checked = 0
+        self._mtimes = None
+
+
+    def _get_mtimes(self, system: ArrowheadClient) -> Tuple[float, ...]:
+        """Get modification times of the PEM files of the 'system'."""
+        return tuple(
+            os.stat(filename).st_mtime_ns if filename is not None else None
+            for filename in (system.certfile, system.keyfile, system.cafile)
+        )
+
+
+    def _get_adapter(self, system: ArrowheadClient) -> SSLContextAdapter:
+        """Create an adapter with loaded PEM certificate of the 'system'.
+
+        Arguments:
+        system (ArrowheadSystem) -- system used for the communication
+
+        Returns:
+        adapter (SSLContextAdapter) -- adapter mounted for 'https://'
+        """
+        self._mtimes = self._get_mtimes(system)
+        self._checked = time.monotonic()
+
+        return SSLContextAdapter(
+            create_ssl_context(system.certfile, system.keyfile, system.keypass, system.cafile)
+        )
+
+
+    def reload(self, system: ArrowheadClient):
+        """Load the PEM files of the 'system' again.
+
+        Arguments:
+        system (ArrowheadSystem) -- system used for the communication
+        """
+        session = super(ArrowheadConnector, self)._get_session(system)
+
+        with self._session_lock:
+            old = session.get_adapter("https://")
+            session.mount("https://", self._get_adapter(system))
+
+        # Idle connections are closed now, busy ones when they are returned
+        old.close()
+
+
+    def _get_session(self, system: ArrowheadClient) -> requests.Session:
+        """Get a session with loaded certificate of the 'system', reloading changed files.
+
+        Arguments:
+        system (ArrowheadSystem) -- system used for the communication
+
+        Returns:
+        session (requests.Session) -- session shared by all requests of this connector
+        """
+        session = super(ArrowheadConnector, self)._get_session(system)
+
+        if self.reload_interval is not None and time.monotonic() - self._checked >= self.reload_interval:
+            self._checked = time.monotonic()
+
+            try:
+                changed = self._get_mtimes(system) != self._mtimes
+            except OSError:
+                # Files are being replaced right now; try again later
+                changed = False
+
+            if changed:
+                try:
+                    self.reload(system)
+                except (OSError, ssl.SSLError):
+                    # Keep the previous certificate until the new one is complete
+                    pass
+
+        return session
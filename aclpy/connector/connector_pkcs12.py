@@ -3,116 +3,111 @@
 """Connector / interface to Arrowhead Core using .p12 certificates.
 """
 
-import requests_pkcs12
+import os
 
-from typing import Dict, Tuple
+import requests
+import requests_pkcs12
 
-from aclpy.connector.connector import ArrowheadConnector as ArrowheadConnectorBase
+from aclpy.connector.connector_https import ArrowheadConnector as ArrowheadConnectorBase
+from aclpy.connector.identity import IdentityRegistry
+from aclpy.connector.tls import ResumingSSLContext
 from aclpy.server import ArrowheadServer
 from aclpy.client.client import ArrowheadClient
 
 
-class ArrowheadConnector(ArrowheadConnectorBase):
-    """ArrowheadConnector class to handle requests to Arrowhead Core using pkcs12."""
+class Pkcs12Adapter(requests_pkcs12.Pkcs12Adapter):
+    """Pkcs12Adapter class that resumes TLS sessions to the Core."""
 
-    def _orchestrate(self, system: ArrowheadClient, message: Dict[str, any]) -> Tuple[int, Dict[str, any]]:
-        """Request available providers from the Orchestrator.
+    def init_poolmanager(self, *args, **kwargs):
+        if self.ssl_context is not None and not isinstance(self.ssl_context, ResumingSSLContext):
+            self.ssl_context = ResumingSSLContext(self.ssl_context)
 
-        Arguments:
-        system (ArrowheadSystem) -- system requesting the orchestration
-        message (Dict[str, any]) -- message to be sent to the Orchestrator
+        return super(Pkcs12Adapter, self).init_poolmanager(*args, **kwargs)
 
-        Returns:
-        status_code (int) -- HTTP code from the response
-        response (Dict[str, any]) -- message received from the Orchestrator
 
-        Note: 'message' is created by 'aclpy.messages.build_orchestration_request'.
-        """
-        res = requests_pkcs12.post(
-            self.server.get_url("orchestrator") + "orchestration",
-            json = message,
-            pkcs12_filename = system.p12file,
-            pkcs12_password = system.p12pass,
-            verify = system.cafile,
-            timeout = self.timeout,
-        )
+# Identities shared by all connectors within this process
+identities = IdentityRegistry(max_identities = 256)
 
-        return (res.status_code, res.json())
 
+def get_adapter(p12file: str, p12pass: str) -> Pkcs12Adapter:
+    """Get an adapter with loaded .p12 certificate, shared within the process.
 
-    def _register_service(self, system: ArrowheadClient, message: Dict[str, any]) -> Tuple[int, Dict[str, any]]:
-        """Register a service for 'system' to the Service Registry.
+    Arguments:
+    p12file (str) -- path to the .p12 certificate
+    p12pass (str) -- password to the .p12 certificate
 
-        Arguments:
-        system (ArrowheadSystem) -- system for service registration
-        message (Dict[str, any]) -- message to be sent to the Service Registry
+    Returns:
+    adapter (Pkcs12Adapter) -- adapter holding the SSL context, TLS sessions and connections
 
-        Returns:
-        status_code (int) -- HTTP code from the response
-        response (Dict[str, any]) -- message received from the Service Registry
+    Note: Up to 'identities.max_identities' certificates are kept loaded, see 'IdentityRegistry'.
+    """
+    return identities.get(
+        (os.path.realpath(p12file), p12pass),
+        lambda: Pkcs12Adapter(pkcs12_filename = p12file, pkcs12_password = p12pass),
+    )
 
-        Note: 'message' is created by 'aclpy.messages.build_register_service'.
-        """
-        res = requests_pkcs12.post(
-            self.server.get_url("serviceregistry") + "register",
-            json = message,
-            pkcs12_filename = system.p12file,
-            pkcs12_password = system.p12pass,
-            verify = system.cafile,
-            timeout = self.timeout,
-        )
 
-        return (res.status_code, res.json())
+class ArrowheadConnector(ArrowheadConnectorBase):
+    """ArrowheadConnector class to handle requests to Arrowhead Core using pkcs12.
+
+    Additional attributes:
+    share_sessions (bool) -- share certificate, TLS sessions and connections with other
+                             connectors using the same .p12 file, True by default
+
+    Note: TLS sessions cannot be stored outside of the process, as Python 'ssl' module
+    does not allow to export them.
+    Note: With 'share_sessions', a gateway running many clients keeps loaded only the recently
+    used certificates, see 'identities'.
+    """
+
+    def __init__(self, server: ArrowheadServer):
+        """Initialize ArrowheadConnector class."""
+        super(ArrowheadConnector, self).__init__(server)
 
+        self.share_sessions = True
+        self._identity = None
 
-    def _unregister_service(self, system: ArrowheadClient, message: Dict[str, any]) -> Tuple[int, Dict[str, any]]:
-        """Unregister a service for 'system' to the Service Registry.
+
+    def _get_session(self, system: ArrowheadClient) -> requests.Session:
+        """Get a session with loaded certificate of the 'system'.
 
         Arguments:
-        system (ArrowheadSystem) -- system for service unregistration
-        message (Dict[str, any]) -- message to be sent to the Service Registry
+        system (ArrowheadSystem) -- system used for the communication
 
         Returns:
-        status_code (int) -- HTTP code from the response
-        response (Dict[str, any]) -- message received from the Service Registry
-
-        Note: 'message' is created by 'aclpy.messages.build_unregister_service'.
+        session (requests.Session) -- session shared by all requests of this connector
         """
-        res = requests_pkcs12.delete(
-            self.server.get_url("serviceregistry")
-                + "unregister?"
-                + "&".join(
-                    ["%s=%s" % (key, value) for key, value in message.items()]
-                ),
-            pkcs12_filename = system.p12file,
-            pkcs12_password = system.p12pass,
-            verify = system.cafile,
-            timeout = self.timeout,
-        )
+        session = super(ArrowheadConnector, self)._get_session(system)
+
+        if self.share_sessions:
+            if self._identity is None:
+                self._identity = (os.path.realpath(system.p12file), system.p12pass)
+
+            adapter = identities.get(
+                self._identity,
+                lambda: Pkcs12Adapter(pkcs12_filename = system.p12file, pkcs12_password = system.p12pass),
+            )
+
+            # Identity was evicted from the registry meanwhile; use the new one
+            if session.adapters.get("https://") is not adapter:
+                session.mount("https://", adapter)
 
-        return (res.status_code, {})
+        return session
 
 
-    def _register_system(self, system: ArrowheadClient, message: Dict[str, any]) -> Tuple[int, Dict[str, any]]:
-        """Register a 'system' to Arrowhead Core via Service Registry.
+    def _get_adapter(self, system: ArrowheadClient) -> Pkcs12Adapter:
+        """Create an adapter with loaded .p12 certificate of the 'system'.
 
         Arguments:
-        system (ArrowheadSystem) -- system for registration
-        message (Dict[str, any]) -- message to be sent to the Service Registry
+        system (ArrowheadSystem) -- system used for the communication
 
         Returns:
-        status_code (int) -- HTTP code from the response
-        response (Dict[str, any]) -- message received from the Service Registry
-
-        Note: 'message' is created by 'aclpy.messages.build_register_system'.
+        adapter (Pkcs12Adapter) -- adapter mounted for 'https://'
         """
-        res = requests_pkcs12.post(
-            self.server.get_url("serviceregistry") + "register-system",
-            json = message,
+        if self.share_sessions:
+            return get_adapter(system.p12file, system.p12pass)
+
+        return Pkcs12Adapter(
             pkcs12_filename = system.p12file,
             pkcs12_password = system.p12pass,
-            verify = system.cafile,
-            timeout = self.timeout,
         )
-
-        return (res.status_code, res.json())
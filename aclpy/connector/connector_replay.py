@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# connector_replay.py
+"""Connector replaying responses recorded from Arrowhead Core.
+"""
+
+import threading
+import time
+
+from typing import Dict, Tuple
+
+from aclpy.connector.connector import ArrowheadConnector as ArrowheadConnectorBase, timeout_error
+from aclpy.connector.recorder import load_records
+from aclpy.server import ArrowheadServer
+from aclpy.system import ArrowheadSystem
+
+
+class ArrowheadConnector(ArrowheadConnectorBase):
+    """ArrowheadConnector class to serve responses stored by 'Recorder' without the Core.
+
+    Requests are answered by the first unused record of the same operation with an equal
+    message. When there is none, the first unused record of the operation is used instead.
+
+    Additional attributes:
+    filename (str) -- path to the recording
+    latency (bool) -- wait for the recorded duration before responding, False by default;
+                      responses slower than the read timeout are replayed as timeouts
+    loop (bool) -- start over when all records of an operation are used, True by default
+
+    Note: When no record is available, a response with status code 404 is returned.
+    """
+
+    def __init__(self, server: ArrowheadServer, filename: str, *,
+            latency: bool = False,
+            loop: bool = True,
+    ):
+        """Initialize ArrowheadConnector class."""
+        super(ArrowheadConnector, self).__init__(server)
+
+        self.filename = filename
+        self.latency = latency
+        self.loop = loop
+
+        self._records = {}
+        self._unused = {}
+        self._lock = threading.Lock()
+
+        for record in load_records(filename):
+            self._records.setdefault(record.get("operation"), []).append(record)
+
+        self.rewind()
+
+
+    def rewind(self):
+        """Mark all records as unused."""
+        with self._lock:
+            self._unused = {
+                operation: list(records) for operation, records in self._records.items()
+            }
+
+
+    def _replay(self, operation: str, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Find a record for the request and replay it.
+
+        Arguments:
+        operation (str) -- name of the operation
+        message (Dict[str, any]) -- message sent to the Core
+        timeout (Tuple[float, float]) -- connect and read timeouts
+
+        Returns:
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- message received from the Core
+        """
+        with self._lock:
+            unused = self._unused.get(operation, [])
+
+            if len(unused) == 0 and self.loop:
+                unused = self._unused[operation] = list(self._records.get(operation, []))
+
+            if len(unused) == 0:
+                return (404, {
+                    "errorCode": 404,
+                    "exceptionType": "REPLAY",
+                    "errorMessage": "No recorded response for '%s'." % operation,
+                })
+
+            record = next(
+                (record for record in unused if record.get("message") == message),
+                unused[0]
+            )
+            unused.remove(record)
+
+        if self.latency:
+            duration = record.get("duration", 0)
+
+            if timeout is not None and timeout[1] is not None and duration > timeout[1]:
+                time.sleep(timeout[1])
+                return timeout_error(operation)
+
+            time.sleep(duration)
+
+        return (record.get("status_code"), record.get("response"))
+
+
+    def _orchestrate(self, system: ArrowheadSystem, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Replay a response from the Orchestrator."""
+        return self._replay("orchestrate", message, timeout)
+
+
+    def _register_service(self, system: ArrowheadSystem, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Replay a service registration response from the Service Registry."""
+        return self._replay("register_service", message, timeout)
+
+
+    def _unregister_service(self, system: ArrowheadSystem, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Replay a service unregistration response from the Service Registry."""
+        return self._replay("unregister_service", message, timeout)
+
+
+    def _register_system(self, system: ArrowheadSystem, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Replay a system registration response from the Service Registry."""
+        return self._replay("register_system", message, timeout)
+
+
+    def _query_service(self, system: ArrowheadSystem, message: Dict[str, any], timeout: Tuple[float, float] = None) -> Tuple[int, Dict[str, any]]:
+        """Replay a service query response from the Service Registry."""
+        return self._replay("query_service", message, timeout)
+
+
+    def _warmup(self, system: ArrowheadSystem, core_system: str) -> bool:
+        """There is no connection to warm up."""
+        return True
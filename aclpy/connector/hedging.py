@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# hedging.py
+"""Hedged requests for cutting the tail latency of the Core.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Tuple
+
+from aclpy.stats import LatencyWindow
+
+
+class _Scheduler(object):
+    """Single thread running callbacks after a delay, shared by all requests of a 'Hedging'."""
+
+    def __init__(self):
+        """Initialize _Scheduler class."""
+        super(_Scheduler, self).__init__()
+
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+
+    def schedule(self, delay: float, callback: Callable[[], None]):
+        """Run 'callback' after 'delay' seconds."""
+        with self._condition:
+            if self._closed:
+                return
+
+            heapq.heappush(self._queue, (time.monotonic() + delay, next(self._counter), callback))
+
+            if self._thread is None:
+                self._thread = threading.Thread(target = self._run, name = "aclpy-hedging-timer", daemon = True)
+                self._thread.start()
+
+            self._condition.notify()
+
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed and (len(self._queue) == 0 or self._queue[0][0] > time.monotonic()):
+                    self._condition.wait(None if len(self._queue) == 0 else self._queue[0][0] - time.monotonic())
+
+                if self._closed:
+                    return
+
+                _, _, callback = heapq.heappop(self._queue)
+
+            callback()
+
+
+    def close(self):
+        """Stop the thread, dropping the scheduled callbacks."""
+        with self._condition:
+            self._closed = True
+            self._queue.clear()
+            self._condition.notify()
+
+
+class Hedging(object):
+    """Hedging class for sending a duplicate request when the first one is slow.
+
+    The first request is sent by the calling thread. When it does not finish within the
+    'percentile' of the recent latencies, a second request is sent by a pool thread (over
+    another pooled connection). When the first request fails (server error, timeout or an
+    exception), the response of the second one is used instead.
+
+    Each request earns 'budget' tokens and each hedge spends one of them, so at most
+    'budget' ratio of the requests is duplicated. This keeps the hedging from amplifying
+    the load when the Core is overloaded or down.
+
+    Attributes:
+    operations (Tuple[str, ...]) -- operations that are hedged, orchestration only by default
+    percentile (float) -- percentile of the recent latencies used as the hedging delay, 95 by default
+    min_delay (float) -- minimal hedging delay in seconds, 0.01 by default
+    min_samples (int) -- number of observed requests required before hedging, 20 by default
+    budget (float) -- maximum ratio of hedged requests, 0.05 by default
+    max_tokens (float) -- maximum number of saved hedges, 10 by default
+    latencies (LatencyWindow) -- recent latencies of the requests
+    requests (int) -- number of requests sent through hedging
+    hedged (int) -- number of hedged requests
+
+    Note: Python cannot abort a request that is already being sent, so the caller always waits
+    for the first request; the second one only replaces its failure. A second request that is
+    not needed is received in the background and discarded.
+    Note: Each request passes the rate limiter and gets the remaining time budget on its own.
+    Note: 'max_workers' limits only the concurrent second requests, not the hedged calls.
+    """
+
+    def __init__(self, *,
+            operations: Tuple[str, ...] = ("orchestrate", ),
+            percentile: float = 95,
+            min_delay: float = 0.01,
+            min_samples: int = 20,
+            budget: float = 0.05,
+            max_tokens: float = 10,
+            window: int = 200,
+            max_workers: int = 16,
+    ):
+        """Initialize Hedging class."""
+        super(Hedging, self).__init__()
+
+        self.operations = operations
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.budget = budget
+        self.max_tokens = max_tokens
+        self.latencies = LatencyWindow(window)
+        self.requests = 0
+        self.hedged = 0
+
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers = max_workers, thread_name_prefix = "aclpy-hedging")
+        self._scheduler = _Scheduler()
+
+
+    def close(self):
+        """Stop the threads sending the hedged requests, waiting for the running ones."""
+        self._scheduler.close()
+        self._executor.shutdown(wait = True)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def delay(self) -> float:
+        """Get the current hedging delay.
+
+        Returns:
+        delay (float) -- delay in seconds, None when there are not enough samples
+        """
+        if len(self.latencies) < self.min_samples:
+            return None
+
+        return max(self.latencies.percentile(self.percentile), self.min_delay)
+
+
+    def _acquire(self) -> bool:
+        """Spend a token for a hedged request.
+
+        Returns:
+        success (bool) -- True when the budget allows sending a hedged request
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            self.hedged += 1
+
+            return True
+
+
+    def _timed(self, request: Callable[[], Tuple[int, Dict[str, any]]]) -> Tuple[int, Dict[str, any]]:
+        """Run the 'request' and store its latency."""
+        start = time.perf_counter()
+        result = request()
+        self.latencies.add(time.perf_counter() - start)
+
+        return result
+
+
+    def run(self, request: Callable[[], Tuple[int, Dict[str, any]]]) -> Tuple[int, Dict[str, any]]:
+        """Run the 'request' in the calling thread, hedging it when it is slow.
+
+        Arguments:
+        request (Callable[[], Tuple[int, Dict[str, any]]]) -- function sending the request
+
+        Returns:
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- message received from the Core
+        """
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self._tokens + self.budget, self.max_tokens)
+
+        delay = self.delay()
+
+        if delay is None:
+            return self._timed(request)
+
+        state = {"done": False, "hedge": None}
+        state_lock = threading.Lock()
+
+        def hedge():
+            with state_lock:
+                if not state["done"] and self._acquire():
+                    state["hedge"] = self._executor.submit(self._timed, request)
+
+        # The delay starts when the first request is being sent
+        self._scheduler.schedule(delay, hedge)
+
+        try:
+            result = self._timed(request)
+            error = None
+        except Exception as e:
+            result = None
+            error = e
+
+        with state_lock:
+            state["done"] = True
+            second = state["hedge"]
+
+        # Prefer a successful response; a failed first request waits for the second one
+        if second is not None and (error is not None or result[0] >= 500 or result[0] == 408):
+            try:
+                other = second.result()
+
+                if other[0] < 500 and other[0] != 408:
+                    return other
+            except Exception:
+                pass
+
+        if error is not None:
+            raise error
+
+        return result
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# identity.py
+"""Registry of the identities (certificates) used for connecting to Arrowhead Core.
+"""
+
+import collections
+import threading
+
+from typing import Callable, Dict, Hashable
+
+
+class IdentityRegistry(object):
+    """IdentityRegistry class for sharing loaded certificates and connections among connectors.
+
+    Each identity is stored as an adapter holding the SSL context with the loaded certificate,
+    its TLS sessions and pools of connections to the core systems. Adapters are shared by all
+    connectors using the same identity. When there are more than 'max_identities', the least
+    recently used one is closed and forgotten.
+
+    Attributes:
+    max_identities (int) -- maximum number of stored identities, None (unlimited) by default
+    hits (int) -- number of requests served by a stored identity
+    misses (int) -- number of identities loaded
+    evictions (int) -- number of identities forgotten because of 'max_identities'
+
+    Note: An evicted adapter keeps working for the requests using it; it is only not shared anymore.
+    """
+
+    def __init__(self, max_identities: int = None):
+        """Initialize IdentityRegistry class."""
+        super(IdentityRegistry, self).__init__()
+
+        self.max_identities = max_identities
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._adapters = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def __len__(self):
+        return len(self._adapters)
+
+
+    def __contains__(self, key: Hashable):
+        return key in self._adapters
+
+
+    def get(self, key: Hashable, factory: Callable[[], any]) -> any:
+        """Get the adapter of an identity, creating it when missing.
+
+        Arguments:
+        key (Hashable) -- key of the identity, e.g., path to the certificate and its password
+        factory (Callable[[], any]) -- function creating the adapter of the identity
+
+        Returns:
+        adapter (any) -- adapter shared by all users of the identity
+
+        Note: Certificates are loaded outside of the lock, so loading one identity does not
+        block the others.
+        """
+        with self._lock:
+            adapter = self._adapters.get(key)
+
+            if adapter is not None:
+                self._adapters.move_to_end(key)
+                self.hits += 1
+
+                return adapter
+
+        adapter = factory()
+
+        with self._lock:
+            stored = self._adapters.setdefault(key, adapter)
+            self._adapters.move_to_end(key)
+
+            if stored is adapter:
+                self.misses += 1
+                evicted = self._evict()
+            else:
+                # Loaded concurrently by another thread; use the stored one
+                self.hits += 1
+                evicted = [adapter]
+
+        for _adapter in evicted:
+            _adapter.close()
+
+        return stored
+
+
+    def _evict(self) -> list:
+        """Remove the least recently used identities over the limit. (Call with the lock held.)"""
+        evicted = []
+
+        while self.max_identities is not None and len(self._adapters) > self.max_identities:
+            evicted.append(self._adapters.popitem(last = False)[1])
+            self.evictions += 1
+
+        return evicted
+
+
+    def remove(self, key: Hashable):
+        """Close and forget the adapter of an identity.
+
+        Arguments:
+        key (Hashable) -- key of the identity
+        """
+        with self._lock:
+            adapter = self._adapters.pop(key, None)
+
+        if adapter is not None:
+            adapter.close()
+
+
+    def clear(self):
+        """Close and forget all adapters."""
+        with self._lock:
+            adapters = list(self._adapters.values())
+            self._adapters.clear()
+
+        for adapter in adapters:
+            adapter.close()
+
+
+    def stats(self) -> Dict[str, int]:
+        """Get usage of the registry.
+
+        Returns:
+        stats (Dict[str, int]) -- number of stored identities, hits, misses and evictions
+        """
+        with self._lock:
+            return {
+                "identities": len(self._adapters),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
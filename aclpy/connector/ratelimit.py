@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# ratelimit.py
+"""Client-side rate limiting of the requests sent to Arrowhead Core.
+"""
+
+import collections
+import itertools
+import threading
+import time
+
+from typing import Dict, Hashable
+
+
+# Limiters shared by all connectors in the process, see 'get_shared'
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+class RateLimiter(object):
+    """RateLimiter class combining a token bucket with a limit of requests in flight.
+
+    Waiting requests are served in the order of arrival (FIFO), so no thread is starved.
+
+    Attributes:
+    rate (float) -- sustained number of requests per second, None (unlimited) by default
+    burst (float) -- size of the token bucket, 'rate' (one second) by default
+    max_in_flight (int) -- maximum number of concurrent requests, None (unlimited) by default
+    in_flight (int) -- number of requests being sent
+    waited (int) -- number of requests that had to wait
+    total_wait (float) -- total time spent waiting in seconds
+    max_wait (float) -- longest wait in seconds
+
+    Note: ValueError is raised when 'rate' or 'max_in_flight' is not positive.
+    """
+
+    def __init__(self, *,
+            rate: float = None,
+            burst: float = None,
+            max_in_flight: int = None,
+    ):
+        """Initialize RateLimiter class."""
+        super(RateLimiter, self).__init__()
+
+        if rate is not None and rate <= 0:
+            raise ValueError("Rate has to be positive, got %s." % rate)
+
+        if max_in_flight is not None and max_in_flight <= 0:
+            raise ValueError("Maximum number of requests in flight has to be positive, got %s." % max_in_flight)
+
+        self.rate = rate
+        self.burst = burst if burst is not None else (max(rate, 1) if rate is not None else None)
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._queue = collections.deque()
+        self._tickets = itertools.count()
+        self._condition = threading.Condition()
+
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for their turn."""
+        return len(self._queue)
+
+
+    def _refill(self, now: float):
+        """Add tokens for the time elapsed since the last refill. (Call with the lock held.)"""
+        if self.rate is not None:
+            self._tokens = min(self._tokens + (now - self._updated) * self.rate, self.burst)
+
+        self._updated = now
+
+
+    def acquire(self, timeout: float = None) -> bool:
+        """Wait until a request can be sent.
+
+        Arguments:
+        timeout (float) -- maximum time to wait in seconds, None (forever) by default
+
+        Returns:
+        success (bool) -- True when the request can be sent, False on timeout
+
+        Note: Each successful 'acquire' has to be followed by 'release'.
+        """
+        start = time.monotonic()
+        end = None if timeout is None else start + timeout
+
+        with self._condition:
+            ticket = next(self._tickets)
+            self._queue.append(ticket)
+
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+
+                    delay = None
+
+                    if self._queue[0] == ticket:
+                        has_token = self.rate is None or self._tokens >= 1
+                        has_slot = self.max_in_flight is None or self.in_flight < self.max_in_flight
+
+                        if has_token and has_slot:
+                            break
+
+                        if not has_token:
+                            delay = (1 - self._tokens) / self.rate
+
+                    if end is not None:
+                        if now >= end:
+                            return False
+
+                        delay = end - now if delay is None else min(delay, end - now)
+
+                    self._condition.wait(delay)
+
+                if self.rate is not None:
+                    self._tokens -= 1
+
+                self.in_flight += 1
+            finally:
+                self._queue.remove(ticket)
+                self._condition.notify_all()
+
+            wait = time.monotonic() - start
+
+            if wait > 0.001:
+                self.waited += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+
+            return True
+
+
+    def release(self):
+        """Mark a request as finished."""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+
+    def stats(self) -> Dict[str, float]:
+        """Get the current state of the limiter.
+
+        Returns:
+        stats (Dict[str, float]) -- queue depth, requests in flight and waiting times
+        """
+        with self._condition:
+            return {
+                "queue_depth": len(self._queue),
+                "in_flight": self.in_flight,
+                "waited": self.waited,
+                "total_wait": self.total_wait,
+                "max_wait": self.max_wait,
+            }
+
+
+def get_shared(key: Hashable, rate: float = None, max_in_flight: int = None) -> RateLimiter:
+    """Get a limiter shared by the whole process, creating it when missing.
+
+    Arguments:
+    key (Hashable) -- key of the limited endpoint, e.g., URL of a core system
+    rate (float) -- sustained number of requests per second, None (unlimited) by default
+    max_in_flight (int) -- maximum number of concurrent requests, None (unlimited) by default
+
+    Returns:
+    limiter (RateLimiter) -- limiter of the endpoint
+
+    Note: Limits of an existing limiter are kept; the first configuration wins.
+    """
+    with _shared_lock:
+        if key not in _shared:
+            _shared[key] = RateLimiter(rate = rate, max_in_flight = max_in_flight)
+
+        return _shared[key]
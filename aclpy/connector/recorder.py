@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# recorder.py
+"""Recording of the requests sent to Arrowhead Core.
+"""
+
+import gzip
+import json
+import threading
+import time
+
+from typing import Dict, List
+
+
+def _open(filename: str, mode: str):
+    """Open 'filename' as text, compressed by gzip when it ends with '.gz'."""
+    if filename.endswith(".gz"):
+        return gzip.open(filename, mode + "t", encoding = "utf-8")
+
+    return open(filename, mode, encoding = "utf-8")
+
+
+class Recorder(object):
+    """Recorder class for storing requests and responses to a file.
+
+    Each record is stored as a single JSON line with keys:
+    operation (str) -- name of the operation, e.g., 'orchestrate'
+    message (Dict[str, any]) -- message sent to the Core
+    status_code (int) -- HTTP code from the response
+    response (Dict[str, any]) -- message received from the Core
+    duration (float) -- time in seconds from sending the request to receiving the response
+    timestamp (float) -- UNIX time of the response
+
+    Attributes:
+    filename (str) -- path to the recording, gzip compressed when it ends with '.gz'
+
+    Note: Records are appended to an existing file.
+    Note: The connector records each request sent to the Core (a hedged call may send two),
+    but not the errors created by the client, see 'is_local_error'.
+    """
+
+    def __init__(self, filename: str):
+        """Initialize Recorder class."""
+        super(Recorder, self).__init__()
+
+        self.filename = filename
+        self._file = _open(filename, "a")
+        self._lock = threading.Lock()
+
+
+    def record(self, operation: str, message: Dict[str, any], status_code: int, response: Dict[str, any], duration: float):
+        """Store a single request.
+
+        Arguments:
+        operation (str) -- name of the operation
+        message (Dict[str, any]) -- message sent to the Core
+        status_code (int) -- HTTP code from the response
+        response (Dict[str, any]) -- message received from the Core
+        duration (float) -- time in seconds from sending the request to receiving the response
+        """
+        line = json.dumps({
+            "operation": operation,
+            "message": message,
+            "status_code": status_code,
+            "response": response,
+            "duration": round(duration, 6),
+            "timestamp": round(time.time(), 6),
+        }, separators = (",", ":"))
+
+        with self._lock:
+            self._file.write(line + "\n")
+
+
+    def close(self):
+        """Flush and close the recording."""
+        with self._lock:
+            self._file.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def load_records(filename: str) -> List[Dict[str, any]]:
+    """Load all records from a recording.
+
+    Arguments:
+    filename (str) -- path to the recording, gzip compressed when it ends with '.gz'
+
+    Returns:
+    records (List[Dict[str, any]]) -- stored records, see 'Recorder'
+    """
+    with _open(filename, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# tls.py
+"""TLS session resumption for connections to Arrowhead Core.
+"""
+
+import ssl
+import threading
+import time
+import weakref
+
+from typing import Dict
+
+from aclpy.connector import tracing
+
+
+class ResumingSSLContext(object):
+    """ResumingSSLContext class for resuming TLS sessions of a wrapped SSL context.
+
+    Every new connection offers the last session negotiated with the same server,
+    so the Core can skip the full (mutual) handshake.
+
+    Attributes:
+    context (ssl.SSLContext) -- wrapped SSL context
+    handshakes (int) -- number of full handshakes
+    resumed (int) -- number of resumed handshakes
+
+    Note: Other attributes are delegated to the wrapped context.
+    Note: TLS sessions are bound to the SSL context that created them. To share them among
+    multiple connectors, the connectors have to share this object.
+    """
+
+    __slots__ = ["context", "handshakes", "resumed", "_sessions", "_sockets", "_lock"]
+
+    def __init__(self, context: ssl.SSLContext):
+        """Initialize ResumingSSLContext class."""
+        object.__setattr__(self, "context", context)
+        object.__setattr__(self, "handshakes", 0)
+        object.__setattr__(self, "resumed", 0)
+        object.__setattr__(self, "_sessions", {})
+        object.__setattr__(self, "_sockets", {})
+        object.__setattr__(self, "_lock", threading.Lock())
+
+
+    def __getattr__(self, name: str):
+        return getattr(self.context, name)
+
+
+    def __setattr__(self, name: str, value):
+        if name in self.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.context, name, value)
+
+
+    def get_session(self, server_hostname: str) -> ssl.SSLSession:
+        """Get the last known session for 'server_hostname'.
+
+        Arguments:
+        server_hostname (str) -- name of the server
+
+        Returns:
+        session (ssl.SSLSession) -- session to be resumed, None when not available
+        """
+        with self._lock:
+            sock = self._sockets.get(server_hostname, lambda: None)()
+
+            # TLS 1.3 tickets are received after the handshake, so the newest
+            # session is taken from the last opened socket when it still exists.
+            if sock is not None:
+                try:
+                    if sock.session is not None:
+                        self._sessions[server_hostname] = sock.session
+                except (OSError, ValueError):
+                    pass
+
+            return self._sessions.get(server_hostname)
+
+
+    def wrap_socket(self, sock, *args, server_hostname: str = None, session: ssl.SSLSession = None, **kwargs) -> ssl.SSLSocket:
+        """Wrap 'sock' offering the last known session for 'server_hostname'.
+
+        Returns:
+        sslsock (ssl.SSLSocket) -- wrapped socket
+        """
+        if session is None:
+            session = self.get_session(server_hostname)
+
+        start = time.perf_counter()
+
+        sslsock = self.context.wrap_socket(sock, *args, server_hostname = server_hostname, session = session, **kwargs)
+
+        trace = tracing.current()
+
+        if trace is not None:
+            trace.handshake(start, time.perf_counter() - start)
+
+        with self._lock:
+            self._sockets[server_hostname] = weakref.ref(sslsock)
+
+            if sslsock.session is not None:
+                self._sessions[server_hostname] = sslsock.session
+
+            if sslsock.session_reused:
+                object.__setattr__(self, "resumed", self.resumed + 1)
+            else:
+                object.__setattr__(self, "handshakes", self.handshakes + 1)
+
+        return sslsock
+
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of full and resumed handshakes.
+
+        Returns:
+        stats (Dict[str, int]) -- counts under 'handshakes' and 'resumed'
+        """
+        return {
+            "handshakes": self.handshakes,
+            "resumed": self.resumed,
+        }
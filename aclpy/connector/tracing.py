@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# tracing.py
+"""Timing breakdown of the requests sent to Arrowhead Core.
+"""
+
+import collections
+import json
+import logging
+import random
+import threading
+import time
+
+from typing import Dict
+
+
+# Trace of the request being sent by the current thread
+_local = threading.local()
+
+
+def current() -> "Trace":
+    """Get trace of the request sent by the current thread.
+
+    Returns:
+    trace (Trace) -- trace to record the phases into, None when tracing is disabled
+    """
+    return getattr(_local, "trace", None)
+
+
+def set_current(trace: "Trace"):
+    """Set trace of the request sent by the current thread.
+
+    Arguments:
+    trace (Trace) -- trace to record the phases into, None to stop recording
+    """
+    _local.trace = trace
+
+
+class Trace(object):
+    """Trace class storing the duration of each phase of a single request.
+
+    Phases (in seconds):
+    queue -- waiting for the rate limiter
+    certificate -- loading the client certificate (first request only)
+    connect -- name resolution and TCP connection (new connections only)
+    tls -- TLS handshake (new connections only)
+    server -- sending the request and waiting for the response headers
+    download -- receiving the response body
+    decode -- decoding the JSON response
+
+    Attributes:
+    operation (str) -- name of the operation
+    core_system (str) -- name of the core system
+    url (str) -- URL of the core system
+    phases (Dict[str, float]) -- duration of the recorded phases
+    status_code (int) -- HTTP code from the response, None when not finished
+    duration (float) -- total duration in seconds, None when not finished
+    """
+
+    __slots__ = ["operation", "core_system", "url", "phases", "status_code", "duration", "_start", "_sent"]
+
+    def __init__(self, operation: str, core_system: str, url: str):
+        """Initialize Trace class."""
+        self.operation = operation
+        self.core_system = core_system
+        self.url = url
+        self.phases = {}
+        self.status_code = None
+        self.duration = None
+
+        self._start = time.perf_counter()
+        self._sent = None
+
+
+    def add(self, phase: str, duration: float):
+        """Add 'duration' seconds to the 'phase'."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration
+
+
+    def sending(self):
+        """Mark the moment the request is handed to the HTTP library."""
+        self._sent = time.perf_counter()
+
+
+    def handshake(self, start: float, duration: float):
+        """Record a TLS handshake started at 'start' (time.perf_counter()) lasting 'duration' seconds."""
+        if self._sent is not None:
+            self.add("connect", max(start - self._sent, 0.0))
+
+        self.add("tls", duration)
+
+
+    def received(self, elapsed: float):
+        """Record that the response headers arrived 'elapsed' seconds after sending."""
+        self.add("server", max(elapsed - self.phases.get("connect", 0.0) - self.phases.get("tls", 0.0), 0.0))
+
+
+    def to_dict(self) -> Dict[str, any]:
+        """Convert the trace to a dictionary, e.g., for logging.
+
+        Returns:
+        trace (Dict[str, any]) -- trace with durations in milliseconds
+        """
+        return {
+            "operation": self.operation,
+            "core_system": self.core_system,
+            "url": self.url,
+            "status_code": self.status_code,
+            "duration_ms": None if self.duration is None else round(self.duration * 1000, 3),
+            "phases_ms": {phase: round(duration * 1000, 3) for phase, duration in self.phases.items()},
+        }
+
+
+class Tracer(object):
+    """Tracer class for tracing the requests and logging the slow ones.
+
+    Attributes:
+    threshold (float) -- duration in seconds above which a request is logged, 1 by default
+    sample_rate (float) -- fraction of the slow requests that are logged, 1 (all) by default
+    logger (logging.Logger) -- logger of the slow requests, 'aclpy.slow' by default
+    recent (Deque[Trace]) -- last finished traces, up to 'history'
+
+    Note: Each slow request is logged as a single JSON object at the WARNING level.
+    Note: Phases are recorded for the first request only; a second (hedged) request is sent
+    by a pool thread without a trace, so its phases are not recorded.
+    """
+
+    def __init__(self, *,
+            threshold: float = 1.0,
+            sample_rate: float = 1.0,
+            history: int = 100,
+            logger: logging.Logger = None,
+    ):
+        """Initialize Tracer class."""
+        super(Tracer, self).__init__()
+
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.logger = logger if logger is not None else logging.getLogger("aclpy.slow")
+        self.recent = collections.deque(maxlen = history)
+
+
+    def begin(self, operation: str, core_system: str, url: str) -> Trace:
+        """Start tracing a request sent by the current thread.
+
+        Arguments:
+        operation (str) -- name of the operation
+        core_system (str) -- name of the core system
+        url (str) -- URL of the core system
+
+        Returns:
+        trace (Trace) -- trace of the request
+        """
+        trace = Trace(operation, core_system, url)
+        set_current(trace)
+
+        return trace
+
+
+    def end(self, trace: Trace, status_code: int):
+        """Finish tracing a request, logging it when slow.
+
+        Arguments:
+        trace (Trace) -- trace returned by 'begin'
+        status_code (int) -- HTTP code from the response, None when the request raised
+        """
+        trace.duration = time.perf_counter() - trace._start
+        trace.status_code = status_code
+
+        set_current(None)
+        self.recent.append(trace)
+
+        if trace.duration >= self.threshold and random.random() < self.sample_rate:
+            self.logger.warning("Slow request: %s", json.dumps(trace.to_dict(), separators = (",", ":")))
+
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Get mean duration of each phase of the recent requests for each operation.
+
+        Returns:
+        summary (Dict[str, Dict[str, float]]) -- mean durations in seconds, including 'total'
+        """
+        traces = list(self.recent)
+        summary = {}
+
+        for operation in {trace.operation for trace in traces}:
+            selected = [trace for trace in traces if trace.operation == operation]
+            phases = {phase for trace in selected for phase in trace.phases}
+
+            summary[operation] = {
+                phase: sum(trace.phases.get(phase, 0.0) for trace in selected) / len(selected)
+                for phase in phases
+            }
+            summary[operation]["total"] = sum(trace.duration for trace in selected) / len(selected)
+
+        return summary
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# index.py
+"""Local index of the services provided by other Arrowhead systems.
+"""
+
+import bisect
+import threading
+
+from typing import Dict, List, Tuple
+
+
+def match_key(match: Dict[str, any]) -> Tuple[str, str, int, str]:
+    """Create a key identifying a provided service.
+
+    Arguments:
+    match (Dict[str, (ArrowheadSystem, ArrowheadService)]) -- provider, see 'ArrowheadClient.orchestrate'
+
+    Returns:
+    key (Tuple[str, str, int, str]) -- name, address and port of the provider and name of the service
+    """
+    return (match["provider"].name, match["provider"].address, match["provider"].port, match["service"].name)
+
+
+def _version(match: Dict[str, any]) -> int:
+    """Get version of a provided service, 0 when not known."""
+    return match["service"].version if match["service"].version is not None else 0
+
+
+class ServiceIndex(object):
+    """ServiceIndex class for searching providers by service, interface, metadata and version.
+
+    The providers are indexed by hash tables, so a search takes time proportional to
+    the smallest set of matching candidates instead of scanning all providers. Services
+    are refreshed one by one; only the providers that changed are reindexed.
+
+    Note: Metadata values are indexed as they are and have to be hashable.
+    """
+
+    def __init__(self):
+        """Initialize ServiceIndex class."""
+        super(ServiceIndex, self).__init__()
+
+        self._matches = {}
+        self._by_service = {}
+        self._by_interface = {}
+        self._by_metadata = {}
+        self._by_refresh = {}
+        self._versions = []
+        self._lock = threading.Lock()
+
+
+    def __len__(self):
+        return len(self._matches)
+
+
+    def _add(self, key: Tuple, match: Dict[str, any]):
+        """Index a single provider. (Call with the lock held.)"""
+        self._matches[key] = match
+
+        self._by_service.setdefault(key[3], set()).add(key)
+
+        for name in {interface.name for interface in match["provider"].interfaces}:
+            self._by_interface.setdefault(name, set()).add(key)
+
+        for item in (match["service"].metadata or {}).items():
+            self._by_metadata.setdefault(item, set()).add(key)
+
+        bisect.insort(self._versions, (_version(match), key))
+
+
+    def _remove(self, key: Tuple):
+        """Remove a single provider from the indexes. (Call with the lock held.)"""
+        match = self._matches.pop(key)
+
+        def discard(index: Dict[any, set], value: any):
+            keys = index.get(value)
+            keys.discard(key)
+
+            if len(keys) == 0:
+                del index[value]
+
+        discard(self._by_service, key[3])
+
+        for name in {interface.name for interface in match["provider"].interfaces}:
+            discard(self._by_interface, name)
+
+        for item in (match["service"].metadata or {}).items():
+            discard(self._by_metadata, item)
+
+        entry = (_version(match), key)
+        del self._versions[bisect.bisect_left(self._versions, entry)]
+
+
+    def _changed(self, old: Dict[str, any], new: Dict[str, any]) -> bool:
+        """Check whether indexed values of a provider differ."""
+        return _version(old) != _version(new) \
+            or (old["service"].metadata or {}) != (new["service"].metadata or {}) \
+            or [_i.name for _i in old["provider"].interfaces] != [_i.name for _i in new["provider"].interfaces]
+
+
+    def refresh(self, service_name: str, matches: List[Dict[str, any]]):
+        """Replace the providers of a service, reindexing only the changed ones.
+
+        Arguments:
+        service_name (str) -- name of the service as requested, e.g., key of 'ArrowheadClient.required'
+        matches (List[Dict[str, (ArrowheadSystem, ArrowheadService)]]) -- current providers of the service
+
+        Note: Providers are indexed under the service names returned by the Core, which may
+        differ from 'service_name' (e.g., in letter case).
+        """
+        new = {match_key(match): match for match in matches}
+
+        with self._lock:
+            old_keys = self._by_refresh.get(service_name, set())
+
+            # Keep providers that are still refreshed under another requested name
+            others = set().union(*(
+                keys for name, keys in self._by_refresh.items() if name != service_name
+            ))
+
+            for key in old_keys - new.keys() - others:
+                self._remove(key)
+
+            self._by_refresh[service_name] = set(new.keys())
+
+            for key, match in new.items():
+                old = self._matches.get(key)
+
+                if old is None:
+                    self._add(key, match)
+                elif self._changed(old, match):
+                    self._remove(key)
+                    self._add(key, match)
+                else:
+                    # Keep indexes, but serve the latest objects
+                    self._matches[key] = match
+
+
+    def clear(self):
+        """Remove all providers."""
+        with self._lock:
+            self._matches.clear()
+            self._by_service.clear()
+            self._by_interface.clear()
+            self._by_metadata.clear()
+            self._by_refresh.clear()
+            self._versions.clear()
+
+
+    def find(self, *,
+            service: str = None,
+            interface: str = None,
+            metadata: Dict[str, any] = None,
+            min_version: int = None,
+            max_version: int = None,
+    ) -> List[Dict[str, any]]:
+        """Find providers fulfilling all the given requirements.
+
+        Arguments:
+        service (str) -- name of the service, None (any) by default
+        interface (str) -- name of an interface of the provider, None (any) by default
+        metadata (Dict[str, any]) -- items the service metadata has to contain, None (any) by default
+        min_version (int) -- minimal version of the service, None by default
+        max_version (int) -- maximal version of the service, None by default
+
+        Returns:
+        matches (List[Dict[str, (ArrowheadSystem, ArrowheadService)]]) -- matching providers
+        """
+        with self._lock:
+            candidates = []
+
+            if service is not None:
+                candidates.append(self._by_service.get(service, set()))
+
+            if interface is not None:
+                candidates.append(self._by_interface.get(interface, set()))
+
+            for item in (metadata or {}).items():
+                candidates.append(self._by_metadata.get(item, set()))
+
+            if min_version is not None or max_version is not None:
+                lower = 0 if min_version is None else bisect.bisect_left(self._versions, (min_version, ))
+                upper = len(self._versions) if max_version is None else bisect.bisect_left(self._versions, (max_version + 1, ))
+
+                candidates.append({key for _, key in self._versions[lower:upper]})
+
+            if len(candidates) == 0:
+                return list(self._matches.values())
+
+            candidates.sort(key = len)
+            keys = candidates[0].intersection(*candidates[1:])
+
+            return [self._matches[key] for key in keys]
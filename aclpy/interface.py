@@ -3,6 +3,9 @@
 """Arrowhead interface definition for the library.
 """
 
+from typing import Dict, Tuple
+
+
 class ArrowheadInterface(object):
     """ArrowheadInterface class to store configuration about an interface.
 
@@ -94,3 +97,41 @@ class ArrowheadInterface(object):
                 setattr(self, key, value)
             except AttributeError:
                 pass
+
+
+    # Serialization
+    def to_tuple(self) -> Tuple[str, int, str, str]:
+        """Convert the interface to a compact tuple, see 'from_tuple'."""
+        return (self.__name, self.__id, self.__created_at, self.__updated_at)
+
+
+    @classmethod
+    def from_tuple(cls, values: Tuple[str, int, str, str]) -> "ArrowheadInterface":
+        """Create an interface from a tuple created by 'to_tuple'."""
+        name, id, created_at, updated_at = values
+
+        return cls(name = name, id = id, created_at = created_at, updated_at = updated_at)
+
+
+    def to_dict(self) -> Dict[str, any]:
+        """Convert the interface to a dictionary of the constructor arguments, see 'from_dict'."""
+        return {
+            "name": self.__name,
+            "id": self.__id,
+            "created_at": self.__created_at,
+            "updated_at": self.__updated_at,
+        }
+
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, any]) -> "ArrowheadInterface":
+        """Create an interface from a dictionary created by 'to_dict'."""
+        return cls(**values)
+
+
+    def __reduce_ex__(self, protocol: int):
+        # Pickle as a compact tuple instead of the slots of the object
+        if type(self) is not ArrowheadInterface:
+            return super(ArrowheadInterface, self).__reduce_ex__(protocol)
+
+        return (ArrowheadInterface.from_tuple, (self.to_tuple(), ))
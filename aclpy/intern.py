@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# intern.py
+"""Deduplication of the data received from Arrowhead Core.
+"""
+
+import sys
+import threading
+
+from typing import Dict
+
+from aclpy.interface import ArrowheadInterface
+
+
+def _read_only(self, value: any):
+    raise AttributeError("Interface shared by 'Interner' is read-only; copy it using 'from_tuple(interface.to_tuple())'.")
+
+
+class SharedInterface(ArrowheadInterface):
+    """SharedInterface class for read-only interfaces shared among providers by 'Interner'.
+
+    Note: AttributeError is raised when any attribute is set; 'update' ignores all values.
+    """
+
+    __slots__ = []
+
+    id = property(ArrowheadInterface.id.fget, _read_only)
+    created_at = property(ArrowheadInterface.created_at.fget, _read_only)
+    updated_at = property(ArrowheadInterface.updated_at.fget, _read_only)
+
+
+class Interner(object):
+    """Interner class for sharing repeated strings and interfaces among providers.
+
+    Orchestration responses repeat interface names, service definitions, addresses and
+    timestamps for every provider. Interning keeps a single copy of each of them.
+
+    Note: Shared interfaces are the same object for all providers, so they are read-only,
+    see 'SharedInterface'. Copy them to modify them (e.g., 'ArrowheadInterface.from_tuple(interface.to_tuple())').
+    """
+
+    def __init__(self):
+        """Initialize Interner class."""
+        super(Interner, self).__init__()
+
+        self._interfaces = {}
+        self._lock = threading.Lock()
+
+
+    def __len__(self):
+        return len(self._interfaces)
+
+
+    def string(self, value: any) -> any:
+        """Get the shared copy of 'value' when it is a string.
+
+        Arguments:
+        value (any) -- value to be interned
+
+        Returns:
+        value (any) -- interned string, or unchanged 'value' otherwise
+        """
+        if type(value) is str:
+            return sys.intern(value)
+
+        return value
+
+
+    def metadata(self, metadata: Dict[str, any]) -> Dict[str, any]:
+        """Intern keys and string values of 'metadata'.
+
+        Arguments:
+        metadata (Dict[str, any]) -- metadata of a service
+
+        Returns:
+        metadata (Dict[str, any]) -- metadata with interned strings
+        """
+        if not metadata:
+            return metadata
+
+        return {
+            sys.intern(key): self.string(value) for key, value in metadata.items()
+        }
+
+
+    def interface(self, *,
+            name: str,
+            id: int = -1,
+            created_at: str = "",
+            updated_at: str = "",
+    ) -> SharedInterface:
+        """Get the shared interface with the given values.
+
+        Returns:
+        interface (SharedInterface) -- read-only interface shared by all providers
+        """
+        key = (name, id, created_at, updated_at)
+
+        interface = self._interfaces.get(key)
+
+        if interface is None:
+            with self._lock:
+                interface = self._interfaces.setdefault(key, SharedInterface(
+                    name = self.string(name),
+                    id = id,
+                    created_at = self.string(created_at),
+                    updated_at = self.string(updated_at),
+                ))
+
+        return interface
+
+
+    def clear(self):
+        """Forget all shared interfaces."""
+        with self._lock:
+            self._interfaces.clear()
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+# loadgen.py
+"""Load generator simulating a fleet of Arrowhead clients.
+
+Usage: python3 -m aclpy.loadgen --help
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from aclpy.client.client import ArrowheadClient
+from aclpy.interface import ArrowheadInterface
+from aclpy.server import ArrowheadServer
+from aclpy.service import ArrowheadService
+from aclpy.stats import percentile
+
+
+OPERATIONS = ["register_system", "register_service", "orchestrate", "unregister_service"]
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse workload mix given as 'operation=weight,...'.
+
+    Arguments:
+    mix (str) -- workload mix, e.g., 'register_service=1,orchestrate=8'
+
+    Returns:
+    weights (Dict[str, float]) -- weight of each operation
+    """
+    weights = {}
+
+    for part in mix.split(","):
+        operation, _, weight = part.partition("=")
+        operation = operation.strip()
+
+        if operation not in OPERATIONS:
+            raise ValueError("Unknown operation '%s'." % operation)
+
+        weights[operation] = float(weight) if weight else 1.0
+
+    return weights
+
+
+class Fleet(object):
+    """Fleet class holding the virtual systems and their services.
+
+    Attributes:
+    clients (List[ArrowheadClient]) -- virtual systems
+    services (List[List[ArrowheadService]]) -- services of each virtual system
+    """
+
+    def __init__(self, clients: List[ArrowheadClient], service_count: int, service_prefix: str = "loadgen"):
+        """Initialize Fleet class."""
+        super(Fleet, self).__init__()
+
+        self.clients = clients
+        self.services = [
+            [
+                ArrowheadService(name = "%s-%d-%d" % (service_prefix, _i, _j))
+                for _j in range(service_count)
+            ] for _i in range(len(clients))
+        ]
+
+
+    def run(self, operation: str) -> bool:
+        """Run 'operation' on a randomly selected virtual system.
+
+        Arguments:
+        operation (str) -- name of the operation
+
+        Returns:
+        success (bool) -- True when the operation succeeded
+        """
+        index = random.randrange(len(self.clients))
+        client = self.clients[index]
+
+        if operation == "register_system":
+            return client.register_system()
+
+        if len(self.services[index]) == 0:
+            return False
+
+        if operation == "orchestrate":
+            # Look for a service provided by any of the systems
+            services = self.services[random.randrange(len(self.clients))] or self.services[index]
+            return client.orchestrate(random.choice(services))[0]
+
+        return getattr(client, operation)(random.choice(self.services[index]))
+
+
+class Results(object):
+    """Results class for collecting latencies of the operations.
+
+    Attributes:
+    latencies (Dict[str, List[float]]) -- latencies of the operations in seconds
+    errors (Dict[str, int]) -- number of failed operations
+    """
+
+    def __init__(self):
+        """Initialize Results class."""
+        super(Results, self).__init__()
+
+        self.latencies = {}
+        self.errors = {}
+        self._lock = threading.Lock()
+
+
+    def add(self, operation: str, latency: float, success: bool):
+        """Store result of a single operation."""
+        with self._lock:
+            self.latencies.setdefault(operation, []).append(latency)
+            self.errors[operation] = self.errors.get(operation, 0) + (0 if success else 1)
+
+
+    def report(self, elapsed: float) -> Dict[str, Dict[str, float]]:
+        """Summarize the results.
+
+        Arguments:
+        elapsed (float) -- duration of the run in seconds
+
+        Returns:
+        report (Dict[str, Dict[str, float]]) -- throughput, error rate and latency percentiles per operation
+        """
+        with self._lock:
+            return {
+                operation: {
+                    "count": len(latencies),
+                    "throughput": len(latencies) / elapsed if elapsed > 0 else 0.0,
+                    "error_rate": self.errors[operation] / len(latencies),
+                    "p50": percentile(latencies, 50),
+                    "p90": percentile(latencies, 90),
+                    "p99": percentile(latencies, 99),
+                    "max": max(latencies),
+                } for operation, latencies in self.latencies.items()
+            }
+
+
+def run_load(fleet: Fleet, weights: Dict[str, float], *,
+        rate: float = 0,
+        concurrency: int = 1,
+        duration: float = None,
+        count: int = None,
+    ) -> Dict[str, Dict[str, float]]:
+    """Run the workload against the Core.
+
+    Arguments:
+    fleet (Fleet) -- virtual systems
+    weights (Dict[str, float]) -- workload mix, see 'parse_mix'
+    rate (float) -- arrival rate of the operations per second, 0 for as fast as possible
+    concurrency (int) -- number of operations running concurrently
+    duration (float) -- duration of the run in seconds
+    count (int) -- total number of operations
+
+    Returns:
+    report (Dict[str, Dict[str, float]]) -- see 'Results.report'
+
+    Note: The run stops when either 'duration' or 'count' is reached.
+    Note: With 'rate', latencies are measured from the scheduled arrival time, so they include
+    the time spent waiting for a free worker (avoiding coordinated omission).
+    """
+    if duration is None and count is None:
+        raise ValueError("Provide at least one of 'duration' and 'count'.")
+
+    operations = list(weights.keys())
+    results = Results()
+    slots = threading.Semaphore(concurrency) if rate <= 0 else None
+
+    def task(operation: str, scheduled: float):
+        # Measure from the intended send time, so the time spent queued is not hidden
+        start = time.perf_counter() if scheduled is None else scheduled
+        try:
+            success = fleet.run(operation)
+        except Exception:
+            success = False
+        results.add(operation, time.perf_counter() - start, success)
+
+        if slots is not None:
+            slots.release()
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers = concurrency, thread_name_prefix = "aclpy-loadgen") as executor:
+        issued = 0
+
+        while (count is None or issued < count) and (duration is None or time.perf_counter() - start < duration):
+            scheduled = None
+
+            if slots is not None:
+                slots.acquire()
+            else:
+                # Open loop; operations arrive at the given rate regardless of the responses
+                scheduled = start + issued / rate
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+            executor.submit(task, random.choices(operations, weights = [weights[o] for o in operations])[0], scheduled)
+            issued += 1
+
+    return results.report(time.perf_counter() - start)
+
+
+def format_report(report: Dict[str, Dict[str, float]]) -> str:
+    """Format the report as a table.
+
+    Arguments:
+    report (Dict[str, Dict[str, float]]) -- see 'Results.report'
+
+    Returns:
+    table (str) -- report as a table, latencies in milliseconds
+    """
+    lines = ["%-20s %8s %10s %7s %9s %9s %9s %9s" % (
+        "operation", "count", "ops/s", "errors", "p50 ms", "p90 ms", "p99 ms", "max ms"
+    )]
+
+    for operation, row in sorted(report.items()):
+        lines.append("%-20s %8d %10.1f %6.1f%% %9.2f %9.2f %9.2f %9.2f" % (
+            operation, row["count"], row["throughput"], row["error_rate"] * 100,
+            row["p50"] * 1000, row["p90"] * 1000, row["p99"] * 1000, row["max"] * 1000,
+        ))
+
+    return "\n".join(lines)
+
+
+def format_path(template: str, name: str, index: int) -> str:
+    """Create path to a file of a virtual system.
+
+    Arguments:
+    template (str) -- path with optional '{name}' and '{index}' fields, e.g., 'certs/{name}.p12'
+    name (str) -- name of the virtual system
+    index (int) -- index of the virtual system in the fleet
+
+    Returns:
+    path (str) -- path with the fields replaced, None when 'template' is None
+    """
+    if template is None:
+        return None
+
+    return template.replace("{name}", name).replace("{index}", str(index))
+
+
+def create_fleet(args: argparse.Namespace) -> Fleet:
+    """Create virtual systems from the command line arguments.
+
+    Note: When '--p12file' does not contain '{name}' or '{index}', all virtual systems
+    share one certificate (and its public key), so the Core sees them as one identity.
+    """
+    server = ArrowheadServer(
+        address = args.address,
+        orchestrator_port = args.orchestrator_port,
+        serviceregistry_port = args.serviceregistry_port,
+        authorization_port = args.authorization_port,
+    )
+
+    interfaces = [ArrowheadInterface(name = interface) for interface in args.interface]
+    clients = []
+    shared_certificate = args.p12file is None or format_path(args.p12file, "", 0) == args.p12file
+
+    for _i in range(args.systems):
+        name = "%s%d" % (args.system_prefix, _i)
+        port = args.base_port + _i
+
+        if args.replay is not None:
+            from aclpy.connector import connector_replay
+
+            client = ArrowheadClient(name, args.system_address, port, "", connector_replay.ArrowheadConnector(
+                server, args.replay, latency = args.replay_latency
+            ))
+        else:
+            from aclpy.client import client_pkcs12
+
+            # A shared certificate is loaded only by the first system
+            reuse = shared_certificate and len(clients) > 0
+
+            client = client_pkcs12.ArrowheadClient(
+                name = name,
+                address = args.system_address,
+                port = port,
+                pubkey = clients[0].pubkey if reuse else None,
+                pubfile = format_path(args.pubfile, name, _i) if not reuse else None,
+                p12file = format_path(args.p12file, name, _i),
+                p12pass = args.p12pass,
+                cafile = args.cafile,
+                server = server,
+            )
+            client.connector.timeout = args.timeout
+
+        # Interfaces list may be shared among the systems
+        for interface in interfaces:
+            if interface not in client.interfaces:
+                client.interfaces.append(interface)
+
+        clients.append(client)
+
+    return Fleet(clients, args.services, args.system_prefix)
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the load generator from the command line."""
+    parser = argparse.ArgumentParser(
+        prog = "aclpy-loadgen",
+        description = "Simulate a fleet of Arrowhead clients and measure the Core.",
+    )
+
+    core = parser.add_argument_group("Arrowhead Core")
+    core.add_argument("--address", default = "127.0.0.1", help = "address of the Core, %(default)s by default")
+    core.add_argument("--orchestrator-port", type = int, default = 8441)
+    core.add_argument("--serviceregistry-port", type = int, default = 8443)
+    core.add_argument("--authorization-port", type = int, default = 8445)
+
+    identity = parser.add_argument_group("Identity (PKCS#12)")
+    identity.add_argument("--p12file", help = "path to the .p12 certificate; '{name}' or '{index}' (e.g., 'certs/{name}.p12') "
+        + "gives each virtual system its own certificate, otherwise all systems share one")
+    identity.add_argument("--p12pass", help = "password to the .p12 certificate(s)")
+    identity.add_argument("--pubfile", help = "path to the public key (with the same fields as --p12file), obtained from .p12 when omitted")
+    identity.add_argument("--cafile", help = "path to the certificate authority file")
+    identity.add_argument("--timeout", type = float, default = None, help = "timeout of the requests in seconds")
+    identity.add_argument("--replay", metavar = "FILE", help = "replay a recording instead of connecting to the Core")
+    identity.add_argument("--replay-latency", action = "store_true", help = "keep the recorded latencies when replaying")
+
+    fleet = parser.add_argument_group("Fleet")
+    fleet.add_argument("--systems", type = int, default = 10, help = "number of virtual systems, %(default)s by default")
+    fleet.add_argument("--services", type = int, default = 1, help = "services per system, %(default)s by default")
+    fleet.add_argument("--system-prefix", default = "loadgen", help = "prefix of the system and service names")
+    fleet.add_argument("--system-address", default = "127.0.0.1", help = "address of the virtual systems")
+    fleet.add_argument("--base-port", type = int, default = 20000, help = "port of the first virtual system")
+    fleet.add_argument("--interface", action = "append", default = [], help = "interface of the systems, can be repeated")
+
+    workload = parser.add_argument_group("Workload")
+    workload.add_argument("--mix", default = "register_service=1,orchestrate=8,unregister_service=1",
+        help = "weights of the operations, %(default)s by default")
+    workload.add_argument("--rate", type = float, default = 0, help = "operations per second, 0 (unlimited) by default")
+    workload.add_argument("--concurrency", type = int, default = 4, help = "operations in flight, %(default)s by default")
+    workload.add_argument("--duration", type = float, default = None, help = "duration of the run in seconds")
+    workload.add_argument("--requests", type = int, default = None, help = "total number of operations")
+    workload.add_argument("--json", action = "store_true", help = "print the report as JSON")
+
+    args = parser.parse_args(argv)
+
+    if args.replay is None and (args.p12file is None or args.cafile is None):
+        parser.error("--p12file and --cafile are required unless --replay is used")
+
+    if args.duration is None and args.requests is None:
+        args.duration = 10
+
+    report = run_load(
+        create_fleet(args),
+        parse_mix(args.mix),
+        rate = args.rate,
+        concurrency = args.concurrency,
+        duration = args.duration,
+        count = args.requests,
+    )
+
+    print (json.dumps(report, indent = 2) if args.json else format_report(report))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
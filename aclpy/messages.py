@@ -3,7 +3,7 @@
 """Definition of various Arrowhead-related messages.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from aclpy.interface import ArrowheadInterface
 from aclpy.system import ArrowheadSystem
@@ -58,10 +58,10 @@ def build_register_service(*,
         # Version of the service
         "version": service.version,
 
-        ## Other parts we do not use (even though some of them are mandatory*):
-
         # *URI of the service
-        # "serviceUri": "string",
+        "serviceUri": service.uri,
+
+        ## Other parts we do not use (even though some of them are mandatory*):
 
         # Service is available until this UTC timestamp
         # "endOfValidity": "string",
@@ -132,6 +132,19 @@ def build_orchestration_request(*,
         interfaces: List[ArrowheadInterface],
         system: ArrowheadSystem,
         service: ArrowheadService,
+        matchmaking: bool = False,
+        metadata_search: Optional[bool] = None,
+        ping_providers: bool = False,
+        only_preferred: bool = False,
+        enable_inter_cloud: bool = False,
+        trigger_inter_cloud: bool = False,
+        version: Optional[int] = None,
+        min_version: Optional[int] = None,
+        max_version: Optional[int] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        security: Optional[List[str]] = None,
+        preferred_providers: Optional[List[ArrowheadSystem]] = None,
+        preferred_clouds: Optional[List[Tuple[str, str]]] = None,
     ) -> Dict[str, any]:
     """Build a message for locating providers via orchestration.
 
@@ -139,11 +152,53 @@ def build_orchestration_request(*,
     interface (List[ArrowheadInterface]) -- list of the interfaces requested for the communication
     system (ArrowheadSystem) -- system requesting the orchestration
     service (ArrowheadService) -- service to be located
+    matchmaking (bool) -- let the Orchestrator return only one provider, False by default
+    metadata_search (bool) -- filter providers by 'metadata', enabled when 'metadata' is given
+    ping_providers (bool) -- let the Orchestrator check that the providers are alive, False by default
+    only_preferred (bool) -- return only preferred providers, False by default
+    enable_inter_cloud (bool) -- allow providers from other clouds, False by default
+    trigger_inter_cloud (bool) -- look for providers in other clouds right away, False by default
+    version (int) -- exact version of the service, None (any) by default
+    min_version (int) -- minimal version of the service, None by default
+    max_version (int) -- maximal version of the service, None by default
+    metadata (Dict[str, str]) -- required metadata of the service, None by default
+    security (List[str]) -- allowed security types, e.g., ["CERTIFICATE"], None (any) by default
+    preferred_providers (List[ArrowheadSystem]) -- providers preferred by the requester, None by default
+    preferred_clouds (List[Tuple[str, str]]) -- operators and names of the preferred clouds,
+                                                e.g., for 'trigger_inter_cloud', None by default
 
     Returns:
     message (Dict[str, any])
+
+    Note: Unset flags and requirements are not sent.
+    Note: ValueError is raised when 'only_preferred' is set without any preferred provider or cloud,
+    as the Orchestrator rejects such request.
     """
-    return {
+    if only_preferred and not preferred_providers and not preferred_clouds:
+        raise ValueError("Flag 'only_preferred' requires 'preferred_providers' or 'preferred_clouds'.")
+
+    if metadata_search is None:
+        metadata_search = metadata is not None and len(metadata) > 0
+
+    flags = {
+        "matchmaking": matchmaking,
+        "metadataSearch": metadata_search,
+        "pingProviders": ping_providers,
+        "onlyPreferred": only_preferred,
+        "enableInterCloud": enable_inter_cloud,
+        "triggerInterCloud": trigger_inter_cloud,
+    }
+
+    requirements = {
+        "versionRequirement": version,
+        "minVersionRequirement": min_version,
+        "maxVersionRequirement": max_version,
+        "metadataRequirements": metadata,
+        "securityRequirements": security,
+        "pingProviders": ping_providers or None,
+    }
+
+    return {**{
         # *Who are we?
         # Here we introduce the system asking the service.
         # 'systemName' should be same as the name in the certificate.
@@ -162,9 +217,12 @@ def build_orchestration_request(*,
         # Dynamic Orchestration
         #  - By passing this value we say that we want to find the counterpart dynamically,
         #  skipping any pre-set configuration in the Orchestrator.
-        "orchestrationFlags": {
+        "orchestrationFlags": {**{
             "overrideStore": "true"
-        },
+        }, **{
+            # Other flags are sent only when enabled
+            flag: "true" for flag, value in flags.items() if value
+        }},
 
         # Which service do we want?
         # Since the dynamic orchestration is enabled, this is mandatory*.
@@ -178,5 +236,46 @@ def build_orchestration_request(*,
 
             # *What is the name of the service?
             "serviceDefinitionRequirement": service.name,
+
+            # Other requirements are sent only when given
+            **{
+                key: value for key, value in requirements.items() if value is not None
+            },
         }
+    }, **({} if not preferred_providers and not preferred_clouds else {
+        # Providers (local or from other clouds) the requester prefers
+        "preferredProviders": [
+            {
+                "providerSystem": {
+                    "systemName": provider.name,
+                    "address": provider.address,
+                    "port": provider.port,
+                },
+            } for provider in (preferred_providers or [])
+        ] + [
+            {
+                "providerCloud": {
+                    "operator": operator,
+                    "name": name,
+                },
+            } for operator, name in (preferred_clouds or [])
+        ],
+    }),
+    }
+
+
+def build_service_query(*,
+        service: ArrowheadService,
+    ) -> Dict[str, any]:
+    """Build a message for querying registered providers of a service.
+
+    Arguments:
+    service (ArrowheadService) -- service to be queried
+
+    Returns:
+    message (Dict[str, any])
+    """
+    return {
+        # *What is the name of the service?
+        "serviceDefinitionRequirement": service.name,
     }
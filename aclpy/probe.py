@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# probe.py
+"""Liveness probing of the providers returned by the Orchestrator.
+"""
+
+import socket
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Tuple
+
+
+class Prober(object):
+    """Prober class for checking that the providers accept connections.
+
+    Each provider is probed by opening a TCP connection to its address and port. The time
+    needed to connect (RTT) is stored for 'ttl' seconds, so repeated orchestrations do not
+    probe the same providers again.
+
+    Attributes:
+    timeout (float) -- time in seconds to wait for each connection, 0.5 by default
+    ttl (float) -- time in seconds for which the results are valid, 30 by default
+    drop_unreachable (bool) -- remove unreachable providers instead of moving them to the end, False by default
+    max_workers (int) -- maximum number of concurrent probes, 32 by default
+
+    Note: A successful probe only means that the port is open, not that the service works.
+    Note: When no provider is reachable (e.g., the probes are blocked by a firewall), all of them
+    are kept in the order given by the Orchestrator, even with 'drop_unreachable'.
+    """
+
+    def __init__(self, *,
+            timeout: float = 0.5,
+            ttl: float = 30,
+            drop_unreachable: bool = False,
+            max_workers: int = 32,
+    ):
+        """Initialize Prober class."""
+        super(Prober, self).__init__()
+
+        self.timeout = timeout
+        self.ttl = ttl
+        self.drop_unreachable = drop_unreachable
+        self.max_workers = max_workers
+
+        self._results = {}
+        self._lock = threading.Lock()
+
+
+    def _connect(self, address: str, port: int) -> float:
+        """Open and close a connection to 'address':'port', measuring the time."""
+        start = time.perf_counter()
+
+        try:
+            with socket.create_connection((address, port), timeout = self.timeout):
+                rtt = time.perf_counter() - start
+        except OSError:
+            rtt = None
+
+        with self._lock:
+            self._results[(address, port)] = (time.monotonic() + self.ttl, rtt)
+
+        return rtt
+
+
+    def get(self, address: str, port: int) -> Tuple[bool, float]:
+        """Get a stored result of the probe.
+
+        Arguments:
+        address (str) -- address of the provider
+        port (int) -- port of the provider
+
+        Returns:
+        known (bool) -- True when the provider was probed within 'ttl'
+        rtt (float) -- time to connect in seconds, None when unreachable
+        """
+        with self._lock:
+            entry = self._results.get((address, port))
+
+        if entry is None or entry[0] < time.monotonic():
+            return False, None
+
+        return True, entry[1]
+
+
+    def probe(self, targets: List[Tuple[str, int]]) -> Dict[Tuple[str, int], float]:
+        """Probe 'targets' concurrently, reusing results stored within 'ttl'.
+
+        Arguments:
+        targets (List[Tuple[str, int]]) -- addresses and ports of the providers
+
+        Returns:
+        rtts (Dict[Tuple[str, int], float]) -- time to connect in seconds, None when unreachable
+        """
+        self._prune()
+
+        rtts = {}
+        missing = []
+
+        for target in set(targets):
+            known, rtt = self.get(*target)
+
+            if known:
+                rtts[target] = rtt
+            else:
+                missing.append(target)
+
+        if len(missing) > 0:
+            executor = ThreadPoolExecutor(
+                max_workers = min(len(missing), self.max_workers),
+                thread_name_prefix = "aclpy-probe",
+            )
+
+            futures = {executor.submit(self._connect, *target): target for target in missing}
+
+            executor.shutdown(wait = False)
+
+            # Name resolution is not limited by the timeout; do not wait for it longer
+            wait(futures, timeout = self.timeout * (len(missing) // self.max_workers + 1) + 0.1)
+
+            for future, target in futures.items():
+                rtts[target] = future.result() if future.done() else None
+
+        return rtts
+
+
+    def sort(self, matches: List[Dict[str, any]]) -> List[Dict[str, any]]:
+        """Order orchestration results by the reachability and RTT of the providers.
+
+        Arguments:
+        matches (List[Dict[str, (ArrowheadSystem, ArrowheadService)]]) -- providers, see 'ArrowheadClient.orchestrate'
+
+        Returns:
+        matches (List[Dict[str, (ArrowheadSystem, ArrowheadService)]]) -- reachable providers first,
+                                                                        fastest to connect first
+
+        Note: Providers with the same RTT keep the order given by the Orchestrator.
+        """
+        rtts = self.probe([
+            (match["provider"].address, match["provider"].port) for match in matches
+        ])
+
+        ranked = [
+            (rtts[(match["provider"].address, match["provider"].port)], match) for match in matches
+        ]
+
+        if all(rtt is None for rtt, _ in ranked):
+            return list(matches)
+
+        if self.drop_unreachable:
+            ranked = [(rtt, match) for rtt, match in ranked if rtt is not None]
+
+        ranked.sort(key = lambda item: float("inf") if item[0] is None else item[0])
+
+        return [match for _, match in ranked]
+
+
+    def _prune(self):
+        """Forget the expired results."""
+        now = time.monotonic()
+
+        with self._lock:
+            for target in [target for target, entry in self._results.items() if entry[0] < now]:
+                del self._results[target]
+
+
+    def clear(self):
+        """Forget all results."""
+        with self._lock:
+            self._results.clear()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# serialization.py
+"""Compact serialization of the orchestration results for passing them between processes.
+"""
+
+import marshal
+
+from typing import Dict, List
+
+from aclpy.service import ArrowheadService
+from aclpy.system import ArrowheadSystem
+
+
+# Version of the format, stored as the first item
+FORMAT = 1
+
+
+def dump_matches(matches: List[Dict[str, any]]) -> bytes:
+    """Serialize orchestration results.
+
+    Arguments:
+    matches (List[Dict[str, (ArrowheadSystem, ArrowheadService)]]) -- providers, see 'ArrowheadClient.orchestrate'
+
+    Returns:
+    data (bytes) -- serialized providers, see 'load_matches'
+
+    Note: Models are stored as tuples using 'marshal', so the service metadata
+    have to contain only the built-in types.
+    """
+    return marshal.dumps((
+        FORMAT,
+        tuple(
+            (match["provider"].to_tuple(), match["service"].to_tuple(), match.get("stale", False))
+            for match in matches
+        ),
+    ))
+
+
+def load_matches(data: bytes) -> List[Dict[str, any]]:
+    """Deserialize orchestration results.
+
+    Arguments:
+    data (bytes) -- providers serialized by 'dump_matches'
+
+    Returns:
+    matches (List[Dict[str, (ArrowheadSystem, ArrowheadService)]]) -- providers, see 'ArrowheadClient.orchestrate'
+
+    Note: ValueError is raised when the data are not serialized providers.
+    """
+    try:
+        version, matches = marshal.loads(data)
+    except (EOFError, TypeError, ValueError):
+        raise ValueError("Data are not serialized providers.")
+
+    if version != FORMAT:
+        raise ValueError("Unsupported format version %s." % version)
+
+    result = []
+
+    for provider, service, stale in matches:
+        match = {
+            "provider": ArrowheadSystem.from_tuple(provider),
+            "service": ArrowheadService.from_tuple(service),
+        }
+
+        if stale:
+            match["stale"] = True
+
+        result.append(match)
+
+    return result
@@ -3,31 +3,52 @@
 """Arrowhead server configuration for the library.
 """
 
+import time
+
+from typing import List
+
+
 class ArrowheadServer(object):
     """ArrowheadServer class for storing configuration about used Arrowhead Core server.
 
     Attributes:
     address (str) -- IP address of the core server, localhost by default
     orchestrator_port (int) -- port of the Orchestrator system, 8441 by default
+    orchestrator_endpoint (str) -- path of the Orchestrator system, 'orchestrator' by default
     orchestrator_url (str) -- direct url to the Orchestrator master endpoint, None
     serviceregistry_port (int) -- port of the Service Registry system, 8443 by default
+    serviceregistry_endpoint (str) -- path of the Service Registry system, 'serviceregistry' by default
     serviceregistry_url (str) -- direct url to the Service Registry master endpoint, None
     authorization_port (int) -- port of the Authorization system, 8445 by default
+    authorization_endpoint (str) -- path of the Authorization system, 'authorization' by default
     authorization_url (str) -- direct url to the Authorization master endpoint, None
+    *_rate_limit (float) -- maximum requests per second sent to the core system, None (unlimited)
+    *_max_in_flight (int) -- maximum concurrent requests sent to the core system, None (unlimited)
 
-    Note: When '_url' is not provided, it is generated from 'address' and '_port'.
+    Note: When '_url' is not provided, it is generated from 'address', '_port' and '_endpoint'.
+    Note: URLs are computed once. Call 'reset' after changing the configuration of a core system.
+    Note: Limits are shared by all connectors in the process using the same configured URL of a core system.
     """
 
-    __slots__ = ["address", "orchestrator", "serviceregistry", "authorization"]
+    __slots__ = ["address", "orchestrator", "serviceregistry", "authorization", "_urls", "_expires"]
 
     def __init__(self, *,
             address: str = "127.0.0.1",
             orchestrator_port: int = 8441,
+            orchestrator_endpoint: str = "orchestrator",
             orchestrator_url: str = None,
             serviceregistry_port: int = 8443,
+            serviceregistry_endpoint: str = "serviceregistry",
             serviceregistry_url: str = None,
             authorization_port: int = 8445,
+            authorization_endpoint: str = "authorization",
             authorization_url: str = None,
+            orchestrator_rate_limit: float = None,
+            orchestrator_max_in_flight: int = None,
+            serviceregistry_rate_limit: float = None,
+            serviceregistry_max_in_flight: int = None,
+            authorization_rate_limit: float = None,
+            authorization_max_in_flight: int = None,
         ):
         """Initialize ArrowheadServer class."""
         super(ArrowheadServer, self).__init__()
@@ -39,35 +60,140 @@ class ArrowheadServer(object):
         # Core Systems
         self.orchestrator = {
             "port": orchestrator_port,
-            "endpoint": "orchestrator",
+            "endpoint": orchestrator_endpoint,
             "url": orchestrator_url,
+            "rate_limit": orchestrator_rate_limit,
+            "max_in_flight": orchestrator_max_in_flight,
         }
         self.serviceregistry = {
             "port": serviceregistry_port,
-            "endpoint": "serviceregistry",
+            "endpoint": serviceregistry_endpoint,
             "url": serviceregistry_url,
+            "rate_limit": serviceregistry_rate_limit,
+            "max_in_flight": serviceregistry_max_in_flight,
         }
         self.authorization = {
             "port": authorization_port,
-            "endpoint": "authorization",
+            "endpoint": authorization_endpoint,
             "url": authorization_url,
+            "rate_limit": authorization_rate_limit,
+            "max_in_flight": authorization_max_in_flight,
         }
 
 
-    def get_url(self, core_system: str):
+        # Resolved URLs and expiration of the discovered ones
+        self._urls = {}
+        self._expires = {}
+
+        for core_system in self.core_systems:
+            self.reset(core_system)
+
+
+    @property
+    def core_systems(self) -> List[str]:
+        """List names of the configured core systems.
+
+        Returns:
+        core_systems (List[str]) -- names usable with 'get_url'
+        """
+        return ["orchestrator", "serviceregistry", "authorization"]
+
+
+    def get_url(self, core_system: str) -> str:
         """Get URL for the 'core_system'.
 
         Arguments:
-        core_system -- name of the system, str
+        core_system (str) -- name of the system
+
+        Returns:
+        url (str) -- URL to the system (with trailing slash)
+        """
+        try:
+            return self._urls[core_system]
+        except KeyError:
+            raise ValueError("Undefined core system '%s'." % core_system) from None
+
+
+    def get_configured_url(self, core_system: str) -> str:
+        """Get URL for the 'core_system' from the configuration, ignoring the discovered one.
+
+        Arguments:
+        core_system (str) -- name of the system
+
+        Returns:
+        url (str) -- URL to the system (with trailing slash)
+        """
+        if core_system not in self.core_systems:
+            raise ValueError("Undefined core system '%s'." % core_system)
+
+        system = getattr(self, core_system)
+
+        if system.get("url"):
+            return system.get("url")
+
+        return "https://%s:%s/%s/" % (self.address, system.get("port"), system.get("endpoint"))
+
+
+    def set_url(self, core_system: str, url: str, ttl: float = None):
+        """Use discovered 'url' for the 'core_system'.
+
+        Arguments:
+        core_system (str) -- name of the system
+        url (str) -- URL to the system (with trailing slash)
+        ttl (float) -- time in seconds after which the URL should be discovered again, None (never) by default
+        """
+        if core_system not in self._urls:
+            raise ValueError("Undefined core system '%s'." % core_system)
+
+        self._urls[core_system] = url
+        self._expires[core_system] = float("inf") if ttl is None else time.monotonic() + ttl
+
+
+    def is_fresh(self, core_system: str) -> bool:
+        """Check whether the URL of the 'core_system' was discovered and has not expired.
+
+        Arguments:
+        core_system (str) -- name of the system
 
         Returns:
-        url -- URL to the system (with trailing slash), str
+        fresh (bool) -- True when the discovered URL can be used
         """
+        return self._expires.get(core_system, 0) > time.monotonic()
+
+
+    def defer(self, core_system: str, ttl: float):
+        """Keep using the current URL of the 'core_system' for 'ttl' seconds, e.g., after a failed discovery.
 
-        if hasattr(self, core_system):
-            system = getattr(self, core_system)
-            if system.get("url"):
-                return system.get("url")
-            return "https://" + self.address + ":" + str(system.get("port")) + "/" + system.get("endpoint") + "/"
-        else:
+        Arguments:
+        core_system (str) -- name of the system
+        ttl (float) -- time in seconds after which the URL should be discovered again
+        """
+        if core_system not in self._urls:
             raise ValueError("Undefined core system '%s'." % core_system)
+
+        self._expires[core_system] = time.monotonic() + ttl
+
+
+    def expire(self, core_system: str):
+        """Mark the URL of the 'core_system' to be discovered again.
+
+        The URL is still used until a new one is discovered.
+
+        Arguments:
+        core_system (str) -- name of the system
+        """
+        if core_system in self._expires:
+            self._expires[core_system] = 0
+
+
+    def reset(self, core_system: str):
+        """Compute the URL of the 'core_system' from the configuration, dropping the discovered one.
+
+        Arguments:
+        core_system (str) -- name of the system
+        """
+        if core_system not in self.core_systems:
+            raise ValueError("Undefined core system '%s'." % core_system)
+
+        self._urls[core_system] = self.get_configured_url(core_system)
+        self._expires.pop(core_system, None)
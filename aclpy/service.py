@@ -3,7 +3,7 @@
 """Arrowhead service definition for the library.
 """
 
-from typing import Dict
+from typing import Dict, Tuple
 
 
 class ArrowheadService(object):
@@ -16,11 +16,12 @@ class ArrowheadService(object):
     created_at (str) -- timestamp of service creation, default ""
     updated_at (str) -- timestamp of the last service update, default ""
     metadata (Dict[str, any]) -- additional information about the service
+    uri (str) -- path of the service at its provider, default ""
 
     Note: Timestamp is given as '%Y-%m-%d %H-%M-%S'.
     """
 
-    __slots__ = ["__name", "__version", "__id", "__created_at", "__updated_at", "__metadata"]
+    __slots__ = ["__name", "__version", "__id", "__created_at", "__updated_at", "__metadata", "__uri"]
 
     def __init__(self, *,
             name: str,
@@ -29,6 +30,7 @@ class ArrowheadService(object):
             created_at: str = "",
             updated_at: str = "",
             metadata: Dict[str, any] = {},
+            uri: str = "",
     ):
         """Initialize ArrowheadService class."""
         super(ArrowheadService, self).__init__()
@@ -39,6 +41,7 @@ class ArrowheadService(object):
         self.__created_at = created_at
         self.__updated_at = updated_at
         self.__metadata = metadata
+        self.__uri = uri
 
 
     # Attributes RO
@@ -84,12 +87,28 @@ class ArrowheadService(object):
     def metadata(self, new_value):
         self.__metadata = new_value
 
+    @property
+    def uri(self):
+        return self.__uri
+
+    @uri.setter
+    def uri(self, new_value: str):
+        self.__uri = new_value
+
 
     # Attributes AHCore
     @property
     def serviceDefinition(self):
         return self.name
 
+    @property
+    def serviceUri(self):
+        return self.uri
+
+    @serviceUri.setter
+    def serviceUri(self, new_value: str):
+        self.uri = new_value
+
     @property
     def createdAt(self):
         return self.created_at
@@ -119,3 +138,52 @@ class ArrowheadService(object):
                 setattr(self, key, value)
             except AttributeError:
                 pass
+
+
+    # Serialization
+    def to_tuple(self) -> Tuple[str, int, int, str, str, Dict[str, any], str]:
+        """Convert the service to a compact tuple, see 'from_tuple'."""
+        return (self.__name, self.__version, self.__id, self.__created_at, self.__updated_at, self.__metadata, self.__uri)
+
+
+    @classmethod
+    def from_tuple(cls, values: Tuple[str, int, int, str, str, Dict[str, any], str]) -> "ArrowheadService":
+        """Create a service from a tuple created by 'to_tuple'."""
+        name, version, id, created_at, updated_at, metadata, uri = values
+
+        return cls(
+            name = name,
+            version = version,
+            id = id,
+            created_at = created_at,
+            updated_at = updated_at,
+            metadata = metadata,
+            uri = uri,
+        )
+
+
+    def to_dict(self) -> Dict[str, any]:
+        """Convert the service to a dictionary of the constructor arguments, see 'from_dict'."""
+        return {
+            "name": self.__name,
+            "version": self.__version,
+            "id": self.__id,
+            "created_at": self.__created_at,
+            "updated_at": self.__updated_at,
+            "metadata": self.__metadata,
+            "uri": self.__uri,
+        }
+
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, any]) -> "ArrowheadService":
+        """Create a service from a dictionary created by 'to_dict'."""
+        return cls(**values)
+
+
+    def __reduce_ex__(self, protocol: int):
+        # Pickle as a compact tuple instead of the slots of the object
+        if type(self) is not ArrowheadService:
+            return super(ArrowheadService, self).__reduce_ex__(protocol)
+
+        return (ArrowheadService.from_tuple, (self.to_tuple(), ))
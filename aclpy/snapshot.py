@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# snapshot.py
+"""Snapshot of the last results received from Arrowhead Core, stored on the disk.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+
+from typing import Dict
+
+
+def _open(filename: str, mode: str):
+    """Open 'filename' as text, compressed by gzip when it ends with '.gz'."""
+    if filename.endswith(".gz"):
+        return gzip.open(filename, mode + "t", encoding = "utf-8")
+
+    return open(filename, mode, encoding = "utf-8")
+
+
+class Snapshot(object):
+    """Snapshot class for keeping the last successful results across restarts.
+
+    The snapshot contains the id of the system, ids of its registered services and the last
+    successful orchestration responses. It is written to the disk whenever it changes, so a
+    restarted client can use it right away, even when the Core is not reachable.
+
+    Attributes:
+    filename (str) -- path to the snapshot, gzip compressed when it ends with '.gz'
+    system_id (int) -- id of the system, None when not known
+    services (Dict[str, int]) -- ids of the registered services by their names
+    orchestrations (Dict[str, Dict[str, any]]) -- orchestration responses by their keys, see 'cache_key'
+    saved_at (float) -- UNIX time of the last change, None when empty
+
+    Note: The file is replaced atomically, so it is never read half-written.
+    """
+
+    def __init__(self, filename: str):
+        """Initialize Snapshot class."""
+        super(Snapshot, self).__init__()
+
+        self.filename = filename
+        self.system_id = None
+        self.services = {}
+        self.orchestrations = {}
+        self.saved_at = None
+
+        self._lock = threading.Lock()
+
+        self.load()
+
+
+    def load(self) -> bool:
+        """Read the snapshot from the disk.
+
+        Returns:
+        success (bool) -- True when the snapshot was read, False when missing or damaged
+        """
+        try:
+            with _open(self.filename, "r") as f:
+                data = json.load(f)
+        except (OSError, EOFError, ValueError):
+            return False
+
+        with self._lock:
+            self.system_id = data.get("system_id")
+            self.services = data.get("services", {})
+            self.orchestrations = data.get("orchestrations", {})
+            self.saved_at = data.get("saved_at")
+
+        return True
+
+
+    def save(self):
+        """Write the snapshot to the disk."""
+        with self._lock:
+            self.saved_at = time.time()
+
+            data = json.dumps({
+                "system_id": self.system_id,
+                "services": self.services,
+                "orchestrations": self.orchestrations,
+                "saved_at": self.saved_at,
+            }, separators = (",", ":"))
+
+            directory = os.path.dirname(os.path.abspath(self.filename))
+            # Keep the suffix, so the temporary file is compressed the same way
+            fd, temporary = tempfile.mkstemp(
+                dir = directory,
+                prefix = ".aclpy-snapshot-",
+                suffix = ".gz" if self.filename.endswith(".gz") else "",
+            )
+            os.close(fd)
+
+            try:
+                with _open(temporary, "w") as f:
+                    f.write(data)
+
+                os.replace(temporary, self.filename)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+
+
+    def get_orchestration(self, key: str) -> Dict[str, any]:
+        """Get the last successful orchestration response.
+
+        Arguments:
+        key (str) -- key of the orchestration request, see 'cache_key'
+
+        Returns:
+        response (Dict[str, any]) -- stored response, None when missing
+        """
+        return self.orchestrations.get(key)
+
+
+    def put_orchestration(self, key: str, response: Dict[str, any]):
+        """Store a successful orchestration response, writing the snapshot when it changed.
+
+        Arguments:
+        key (str) -- key of the orchestration request, see 'cache_key'
+        response (Dict[str, any]) -- message received from the Orchestrator
+        """
+        if self.orchestrations.get(key) == response:
+            return
+
+        with self._lock:
+            self.orchestrations[key] = response
+
+        self.save()
+
+
+    def put_system(self, system_id: int):
+        """Store the id of the system, writing the snapshot when it changed.
+
+        Arguments:
+        system_id (int) -- id assigned by the Service Registry
+        """
+        if self.system_id == system_id:
+            return
+
+        self.system_id = system_id
+
+        self.save()
+
+
+    def put_service(self, name: str, service_id: int):
+        """Store the id of a registered service, writing the snapshot when it changed.
+
+        Arguments:
+        name (str) -- name of the service
+        service_id (int) -- id assigned by the Service Registry
+        """
+        if self.services.get(name) == service_id:
+            return
+
+        with self._lock:
+            self.services[name] = service_id
+
+        self.save()
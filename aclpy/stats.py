@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# stats.py
+"""Statistics helpers for measuring the requests.
+"""
+
+import collections
+import threading
+
+from typing import List
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Compute the 'q'-th percentile of 'values' using linear interpolation.
+
+    Arguments:
+    values (List[float]) -- measured values, does not have to be sorted
+    q (float) -- percentile in range [0, 100]
+
+    Returns:
+    value (float) -- percentile of the values, None when 'values' is empty
+    """
+    if len(values) == 0:
+        return None
+
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * min(max(q, 0), 100) / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class LatencyWindow(object):
+    """LatencyWindow class for tracking recent latencies.
+
+    Attributes:
+    size (int) -- number of the latest values kept, 200 by default
+    """
+
+    def __init__(self, size: int = 200):
+        """Initialize LatencyWindow class."""
+        super(LatencyWindow, self).__init__()
+
+        self.size = size
+        self._values = collections.deque(maxlen = size)
+        self._lock = threading.Lock()
+
+
+    def __len__(self):
+        return len(self._values)
+
+
+    def add(self, value: float):
+        """Store a new value.
+
+        Arguments:
+        value (float) -- measured latency in seconds
+        """
+        with self._lock:
+            self._values.append(value)
+
+
+    def percentile(self, q: float) -> float:
+        """Compute the 'q'-th percentile of the stored values.
+
+        Arguments:
+        q (float) -- percentile in range [0, 100]
+
+        Returns:
+        value (float) -- percentile of the values, None when empty
+        """
+        with self._lock:
+            values = list(self._values)
+
+        return percentile(values, q)
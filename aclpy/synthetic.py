@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# synthetic.py
+"""Synthetic messages of the Arrowhead Core for benchmarks and tests.
+"""
+
+import base64
+import random
+
+from typing import Dict
+
+
+def public_key(seed: int) -> str:
+    """Create a distinct, deterministic stand-in for a base64 encoded RSA public key.
+
+    Arguments:
+    seed (int) -- seed of the key, e.g., index of the provider
+
+    Returns:
+    pubkey (str) -- key of the same length as a 2048-bit RSA public key
+    """
+    return "MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA" + base64.b64encode(random.Random(seed).randbytes(225)).decode("ascii")
+
+
+def orchestration_response(providers: int) -> Dict[str, any]:
+    """Create an orchestration response with 'providers' entries, each with its own public key.
+
+    Arguments:
+    providers (int) -- number of providers in the response
+
+    Returns:
+    response (Dict[str, any]) -- decoded response of the Orchestrator
+    """
+    return {"response": [{
+        "provider": {
+            "id": 1000 + _i,
+            "systemName": "provider%d" % _i,
+            "address": "10.0.%d.%d" % (_i // 256, _i % 256),
+            "port": 8080,
+            "authenticationInfo": public_key(_i),
+            "createdAt": "2022-04-08 10:00:00",
+            "updatedAt": "2022-04-08 10:00:00",
+        },
+        "service": {
+            "id": 7,
+            "serviceDefinition": "temperature",
+            "createdAt": "2022-04-08 10:00:00",
+            "updatedAt": "2022-04-08 10:00:00",
+        },
+        "serviceUri": "/temperature",
+        "secure": "CERTIFICATE",
+        "metadata": {"unit": "celsius", "room": str(_i % 40)},
+        "interfaces": [{
+            "id": 1,
+            "interfaceName": "HTTP-SECURE-JSON",
+            "createdAt": "2022-04-08 10:00:00",
+            "updatedAt": "2022-04-08 10:00:00",
+        }],
+        "version": 1,
+        "authorizationTokens": None,
+        "warnings": [],
+    } for _i in range(providers)]}
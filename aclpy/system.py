@@ -3,7 +3,7 @@
 """Arrowhead system definition for the library.
 """
 
-from typing import List
+from typing import Dict, List, Tuple
 
 from aclpy.interface import ArrowheadInterface
 
@@ -131,3 +131,62 @@ class ArrowheadSystem(object):
                 setattr(self, key, value)
             except AttributeError:
                 pass
+
+
+    # Serialization
+    def to_tuple(self) -> Tuple[any, ...]:
+        """Convert the system to a compact tuple, see 'from_tuple'.
+
+        Note: Interfaces are converted as well.
+        """
+        return (
+            self.__name, self.__address, self.__port, self.__pubkey, self.__id, self.__created_at, self.__updated_at,
+            tuple(interface.to_tuple() for interface in self.__interfaces),
+        )
+
+
+    @classmethod
+    def from_tuple(cls, values: Tuple[any, ...]) -> "ArrowheadSystem":
+        """Create a system from a tuple created by 'to_tuple'."""
+        name, address, port, pubkey, id, created_at, updated_at, interfaces = values
+
+        return cls(
+            name = name,
+            address = address,
+            port = port,
+            pubkey = pubkey,
+            id = id,
+            created_at = created_at,
+            updated_at = updated_at,
+            interfaces = [ArrowheadInterface.from_tuple(interface) for interface in interfaces],
+        )
+
+
+    def to_dict(self) -> Dict[str, any]:
+        """Convert the system to a dictionary of the constructor arguments, see 'from_dict'."""
+        return {
+            "name": self.__name,
+            "address": self.__address,
+            "port": self.__port,
+            "pubkey": self.__pubkey,
+            "id": self.__id,
+            "created_at": self.__created_at,
+            "updated_at": self.__updated_at,
+            "interfaces": [interface.to_dict() for interface in self.__interfaces],
+        }
+
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, any]) -> "ArrowheadSystem":
+        """Create a system from a dictionary created by 'to_dict'."""
+        return cls(**dict(values, interfaces = [
+            ArrowheadInterface.from_dict(interface) for interface in values.get("interfaces", [])
+        ]))
+
+
+    def __reduce_ex__(self, protocol: int):
+        # Pickle as a compact tuple instead of the slots of the object
+        if type(self) is not ArrowheadSystem:
+            return super(ArrowheadSystem, self).__reduce_ex__(protocol)
+
+        return (ArrowheadSystem.from_tuple, (self.to_tuple(), ))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# compression.py
+"""Benchmark the size/time tradeoff of compressing messages exchanged with the Core.
+
+Usage:
+    python3 benchmarks/compression.py [--providers N]
+    python3 benchmarks/compression.py --core --p12file F --p12pass P --cafile C --service NAME
+"""
+
+import argparse
+import gzip
+import json
+import os
+import statistics
+import sys
+import time
+import zlib
+
+# Allow running from the repository without installing the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from aclpy.connector.compression import CODECS, brotli
+from aclpy.synthetic import orchestration_response
+
+
+DECODERS = {
+    "gzip": gzip.decompress,
+    "deflate": zlib.decompress,
+}
+
+if brotli is not None:
+    DECODERS["br"] = brotli.decompress
+
+
+def synthetic_response(providers: int) -> bytes:
+    """Create an encoded orchestration response with 'providers' entries."""
+    return json.dumps(orchestration_response(providers)).encode("utf-8")
+
+
+def measure(function, repeat: int) -> float:
+    """Get median duration of 'function' in milliseconds."""
+    durations = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations) * 1000
+
+
+def bench_codecs(providers: int, repeat: int):
+    """Compare codecs on a synthetic orchestration response."""
+    data = synthetic_response(providers)
+
+    print ("Synthetic response with %d providers: %d bytes" % (providers, len(data)))
+    print ("%-8s %10s %7s %13s %15s" % ("codec", "bytes", "ratio", "compress ms", "decompress ms"))
+
+    for codec, compress in CODECS.items():
+        compressed = compress(data)
+        print ("%-8s %10d %6.1f%% %13.3f %15.3f" % (
+            codec, len(compressed), len(compressed) / len(data) * 100,
+            measure(lambda: compress(data), repeat),
+            measure(lambda: DECODERS[codec](compressed), repeat),
+        ))
+
+
+def bench_core(args: argparse.Namespace):
+    """Compare orchestration with and without compressed responses against the Core."""
+    from aclpy.client.client_pkcs12 import ArrowheadClient
+    from aclpy.messages import build_orchestration_request
+    from aclpy.server import ArrowheadServer
+    from aclpy.service import ArrowheadService
+
+    print ("%-10s %10s %12s %12s" % ("encoding", "wire bytes", "p50 ms", "mean ms"))
+
+    for compressed in (False, True):
+        client = ArrowheadClient(
+            name = args.name,
+            address = "127.0.0.1",
+            port = 0,
+            p12file = args.p12file,
+            p12pass = args.p12pass,
+            cafile = args.cafile,
+            server = ArrowheadServer(address = args.address),
+        )
+        client.connector.compress_responses = compressed
+        client.connector.share_sessions = False
+
+        session = client.connector._get_session(client)
+        url = client.connector.server.get_url("orchestrator") + "orchestration"
+        msg = build_orchestration_request(
+            interfaces = client.interfaces, system = client, service = ArrowheadService(name = args.service)
+        )
+
+        sizes = []
+        durations = []
+
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            res = session.post(url, json = msg, stream = True, timeout = client.connector.get_timeout("orchestrate"))
+            raw = res.raw.read(decode_content = False)
+            encoding = res.headers.get("Content-Encoding")
+            json.loads(DECODERS[encoding](raw) if encoding in DECODERS else raw)
+            durations.append(time.perf_counter() - start)
+            sizes.append(len(raw))
+
+        print ("%-10s %10d %12.3f %12.3f" % (
+            "compressed" if compressed else "identity",
+            statistics.median(sizes),
+            statistics.median(durations) * 1000,
+            statistics.mean(durations) * 1000,
+        ))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--providers", type = int, default = 1000, help = "providers in the synthetic response")
+    parser.add_argument("--repeat", type = int, default = 20)
+    parser.add_argument("--core", action = "store_true", help = "run against the Core instead")
+    parser.add_argument("--address", default = "127.0.0.1")
+    parser.add_argument("--name", default = "sysop")
+    parser.add_argument("--p12file")
+    parser.add_argument("--p12pass")
+    parser.add_argument("--cafile")
+    parser.add_argument("--service", default = "echo")
+
+    args = parser.parse_args()
+
+    if args.core:
+        bench_core(args)
+    else:
+        bench_codecs(args.providers, args.repeat)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# interning.py
+"""Benchmark memory used by parsed orchestration results with and without interning.
+
+Each provider has its own public key, so a single response gains only from the repeated
+names, addresses, timestamps and interfaces (about 17 % for 1000 providers). Responses
+kept for the same providers, e.g., by repeated refreshes, also share their public keys
+(about 60 % for 10 responses).
+
+Usage:
+    python3 benchmarks/interning.py [--providers N] [--responses N]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from compression import synthetic_response
+
+from aclpy.client.client import ArrowheadClient
+from aclpy.intern import Interner
+
+
+def bench_parse(providers: int, responses: int, interner: Interner = None):
+    """Parse 'responses' orchestration responses and report retained memory."""
+    client = ArrowheadClient("bench", "127.0.0.1", 0, "", None)
+    client.interner = interner
+
+    data = synthetic_response(providers)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    # Keep all results alive, as a client refreshing many services does
+    results = [client._parse_orchestration(json.loads(data)) for _ in range(responses)]
+
+    duration = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print ("%-10s %12.1f %12.1f %10.1f" % (
+        "interned" if interner is not None else "plain",
+        current / 1024,
+        peak / 1024,
+        duration * 1000,
+    ))
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--providers", type = int, default = 1000, help = "providers in each response")
+    parser.add_argument("--responses", type = int, default = 10, help = "responses kept in memory")
+
+    args = parser.parse_args()
+
+    print ("%d responses with %d providers each" % (args.responses, args.providers))
+    print ("%-10s %12s %12s %10s" % ("mode", "retained KiB", "peak KiB", "parse ms"))
+
+    bench_parse(args.providers, args.responses)
+    bench_parse(args.providers, args.responses, Interner())
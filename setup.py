@@ -36,7 +36,13 @@ setup(
         "Topic :: Scientific/Engineering",
     ],
     install_requires=[
-        "requests_pkcs12"
+        "requests",
+        "requests_pkcs12",
     ],
     python_requires=">3",
+    entry_points={
+        "console_scripts": [
+            "aclpy-loadgen=aclpy.loadgen:main",
+        ],
+    },
 )
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# helpers.py
+"""Helpers shared by the tests.
+"""
+
+from typing import Dict
+
+from aclpy.interface import ArrowheadInterface
+from aclpy.service import ArrowheadService
+from aclpy.system import ArrowheadSystem
+
+
+def create_match(port: int,
+        version: int = 1,
+        metadata: Dict[str, str] = None,
+        interface: str = "HTTP-SECURE-JSON",
+        service: str = "temperature",
+        uri: str = "/temperature",
+) -> Dict[str, any]:
+    """Create an orchestrated provider listening on 'port' of localhost, see 'ArrowheadClient.orchestrate'."""
+    return {
+        "provider": ArrowheadSystem(
+            name = "provider%d" % port,
+            address = "127.0.0.1",
+            port = port,
+            pubkey = "MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA",
+            id = port,
+            created_at = "2024-01-01 00:00:00",
+            updated_at = "2024-01-02 00:00:00",
+            interfaces = [ArrowheadInterface(name = interface, id = 1)],
+        ),
+        "service": ArrowheadService(
+            name = service,
+            version = version,
+            id = 7,
+            metadata = {} if metadata is None else metadata,
+            uri = uri,
+        ),
+    }
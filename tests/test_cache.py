@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# test_cache.py
+"""Test orchestration caches.
+"""
+
+import os
+import tempfile
+import unittest
+
+from aclpy.cache import OrchestrationCache, SharedOrchestrationCache, cache_key, is_failure
+
+
+class TestCache(unittest.TestCase):
+
+    def test_key(self):
+        self.assertEqual(cache_key({"a": 1, "b": [2]}), cache_key({"b": [2], "a": 1}))
+
+
+    def test_cache(self):
+        cache = OrchestrationCache(ttl = 60)
+
+        cache.put("key", {"response": []})
+        cache.put("expired", {"response": []}, ttl = -1)
+
+        self.assertEqual(cache.get("key"), {"response": []})
+        self.assertIsNone(cache.get("expired"))
+        self.assertIsNone(cache.get("missing"))
+
+
+    def test_max_entries(self):
+        cache = OrchestrationCache(ttl = 60, max_entries = 3)
+
+        cache.put("expired", {"response": []}, ttl = -1)
+        cache.put("a", {"response": ["a"]})
+        cache.put("b", {"response": ["b"]})
+
+        # Expired responses are removed first, then the least recently stored ones
+        cache.put("c", {"response": ["c"]})
+        self.assertEqual(len(cache._entries), 3)
+        self.assertEqual(cache.get("a"), {"response": ["a"]})
+
+        cache.put("a", {"response": ["a"]})
+        cache.put("d", {"response": ["d"]})
+        self.assertEqual(len(cache._entries), 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"response": ["a"]})
+
+
+    def test_failure(self):
+        cache = OrchestrationCache(negative_ttl = 60)
+
+        cache.put_failure("invalid", 400, {"errorMessage": "Invalid."})
+        cache.put_failure("timeout", 408, {"errorCode": 408})
+        cache.put_failure("unavailable", 503, {"errorCode": 503})
+
+        self.assertTrue(is_failure(cache.get("invalid")))
+        self.assertEqual(cache.get("invalid")["errorCode"], 400)
+        self.assertIsNone(cache.get("timeout"))
+        self.assertIsNone(cache.get("unavailable"))
+
+
+    def test_shared_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "cache.db")
+
+            writer = SharedOrchestrationCache(filename)
+            reader = SharedOrchestrationCache(filename)
+
+            writer.put("key", {"response": [{"version": 1}]})
+            writer.put("expired", {"response": []}, ttl = -1)
+
+            self.assertEqual(reader.get("key"), {"response": [{"version": 1}]})
+            self.assertIsNone(reader.get("expired"))
+
+            reader.clear()
+
+            self.assertIsNone(writer.get("key"))
+
+
+if __name__ == "__main__":
+    unittest.main()
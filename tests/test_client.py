@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# test_client.py
+"""Test Arrowhead Client.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from aclpy.cache import OrchestrationCache
+from aclpy.client.client import ArrowheadClient
+from aclpy.connector.connector import ArrowheadConnector, unavailable_error
+from aclpy.interface import ArrowheadInterface
+from aclpy.intern import Interner
+from aclpy.server import ArrowheadServer
+from aclpy.service import ArrowheadService
+from aclpy.snapshot import Snapshot
+
+
+PROVIDER = {
+    "provider": {
+        "id": 5,
+        "systemName": "provider",
+        "address": "127.0.0.1",
+        "port": 8080,
+        "authenticationInfo": "",
+        "createdAt": "2022-04-08 10:00:00",
+        "updatedAt": "2022-04-08 10:00:00",
+    },
+    "service": {
+        "id": 7,
+        "serviceDefinition": "echo",
+        "createdAt": "2022-04-08 10:00:00",
+        "updatedAt": "2022-04-08 10:00:00",
+    },
+    "interfaces": [{
+        "id": 1,
+        "interfaceName": "HTTP-SECURE-JSON",
+        "createdAt": "2022-04-08 10:00:00",
+        "updatedAt": "2022-04-08 10:00:00",
+    }],
+    "version": 1,
+    "metadata": {"unit": "m"},
+}
+
+
+class DummyConnector(ArrowheadConnector):
+
+    def __init__(self, server):
+        super(DummyConnector, self).__init__(server)
+
+        self.requests = []
+        self.registry = {}
+        self.down = False
+
+
+    def _orchestrate(self, system, message, timeout = None):
+        self.requests.append(("orchestrate", message))
+
+        if self.down:
+            return unavailable_error("orchestrate")
+
+        if message["requestedService"]["serviceDefinitionRequirement"] == "invalid":
+            return (400, {"errorCode": 400, "exceptionType": "BAD_PAYLOAD", "errorMessage": "Invalid."})
+
+        if message["requestedService"]["serviceDefinitionRequirement"] == "missing":
+            return (200, {"response": []})
+
+        return (200, {"response": [PROVIDER]})
+
+
+    def _register_service(self, system, message, timeout = None):
+        self.requests.append(("register_service", message))
+        self.registry[message["serviceDefinition"]] = {
+            "serviceDefinition": {"id": len(self.requests), "serviceDefinition": message["serviceDefinition"]},
+            "provider": dict(message["providerSystem"], id = 3),
+            "interfaces": [{"interfaceName": interface} for interface in message["interfaces"]],
+            "version": message["version"],
+            "metadata": message.get("metadata"),
+        }
+
+        return (201, self.registry[message["serviceDefinition"]])
+
+
+    def _unregister_service(self, system, message, timeout = None):
+        self.requests.append(("unregister_service", message))
+        self.registry.pop(message["service_definition"], None)
+
+        return (200, {})
+
+
+    def _query_service(self, system, message, timeout = None):
+        entry = self.registry.get(message["serviceDefinitionRequirement"])
+
+        return (200, {"serviceQueryData": [entry] if entry else [], "unfilteredHits": 0})
+
+
+def create_client():
+    return ArrowheadClient(
+        name = "client",
+        address = "127.0.0.1",
+        port = 0,
+        pubkey = "",
+        connector = DummyConnector(ArrowheadServer()),
+    )
+
+
+class TestClient(unittest.TestCase):
+
+    def test_read_pubkey(self):
+        pem = b"-----BEGIN PUBLIC KEY-----\nMIIBIjANBgkq\nhkiG9w0BAQEF\n-----END PUBLIC KEY-----\n"
+
+        self.assertEqual(ArrowheadClient._read_pubkey(None, None, lambda: pem), "MIIBIjANBgkqhkiG9w0BAQEF")
+        self.assertEqual(ArrowheadClient._read_pubkey("MIIBIjANBgkq", None, None), "MIIBIjANBgkq")
+
+        with tempfile.TemporaryDirectory() as directory:
+            pubfile = os.path.join(directory, "client.pub")
+
+            with open(pubfile, "wb") as f:
+                f.write(pem)
+
+            self.assertEqual(ArrowheadClient._read_pubkey(None, pubfile, None), "MIIBIjANBgkqhkiG9w0BAQEF")
+
+            with self.assertRaises(ValueError):
+                ArrowheadClient._read_pubkey("MIIBIjANBgkq", pubfile, None)
+
+
+    def test_orchestrate(self):
+        client = create_client()
+
+        success, matches = client.orchestrate(ArrowheadService(name = "echo"))
+
+        self.assertTrue(success)
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0]["provider"].port, 8080)
+        self.assertEqual(matches[0]["provider"].interfaces[0].name, "HTTP-SECURE-JSON")
+        self.assertEqual(matches[0]["service"].id, 7)
+
+
+    def test_orchestrate_cache(self):
+        client = create_client()
+        client.cache = OrchestrationCache()
+
+        for _ in range(3):
+            success, matches = client.orchestrate(ArrowheadService(name = "echo"))
+            self.assertTrue(success)
+            self.assertEqual(len(matches), 1)
+
+        self.assertEqual(len(client.connector.requests), 1)
+
+
+    def test_orchestrate_negative_cache(self):
+        client = create_client()
+        client.cache = OrchestrationCache(ttl = 60, negative_ttl = 60)
+
+        for _ in range(3):
+            self.assertEqual(client.orchestrate(ArrowheadService(name = "invalid")), (False, []))
+            self.assertEqual(client.orchestrate(ArrowheadService(name = "missing")), (True, []))
+
+        self.assertEqual(len(client.connector.requests), 2)
+        self.assertEqual(client.connector.last_error.error_code, 400)
+
+        client.cache.negative_ttl = None
+        client.cache.clear()
+
+        client.orchestrate(ArrowheadService(name = "invalid"))
+        client.orchestrate(ArrowheadService(name = "invalid"))
+        self.assertEqual(len(client.connector.requests), 4)
+
+
+    def test_orchestrate_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "snapshot.json.gz")
+
+            client = create_client()
+            client.snapshot = Snapshot(filename)
+
+            self.assertTrue(client.register_service(ArrowheadService(name = "echo")))
+            self.assertEqual(client.orchestrate(ArrowheadService(name = "echo"))[1][0].get("stale"), None)
+
+            # Restarted client while the Core is down
+            client = create_client()
+            client.snapshot = Snapshot(filename)
+            client.connector.down = True
+
+            self.assertTrue(client.restore())
+            self.assertEqual(client.id, 3)
+
+            success, matches = client.orchestrate(ArrowheadService(name = "echo"))
+            self.assertTrue(success)
+            self.assertEqual(matches[0]["provider"].port, 8080)
+            self.assertTrue(matches[0]["stale"])
+
+            self.assertEqual(client.orchestrate(ArrowheadService(name = "other")), (False, []))
+
+            # Within 'outage_backoff', the Core is not contacted
+            requests = len(client.connector.requests)
+            self.assertTrue(client.orchestrate(ArrowheadService(name = "echo"))[1][0]["stale"])
+            self.assertEqual(client.orchestrate(ArrowheadService(name = "other")), (False, []))
+            self.assertEqual(client.last_error.error_code, 503)
+            self.assertEqual(len(client.connector.requests), requests)
+
+            # After it, the Core is tried again
+            client.connector.down = False
+            client.outage_backoff = 0
+            client._set_outage(True)
+            self.assertIsNone(client.orchestrate(ArrowheadService(name = "echo"))[1][0].get("stale"))
+            self.assertEqual(len(client.connector.requests), requests + 1)
+
+
+    def test_orchestrate_interner(self):
+        client = create_client()
+        client.interner = Interner()
+
+        _, first = client.orchestrate(ArrowheadService(name = "echo"))
+        _, second = client.orchestrate(ArrowheadService(name = "echo"))
+
+        self.assertIs(first[0]["provider"].interfaces[0], second[0]["provider"].interfaces[0])
+        self.assertIs(first[0]["service"].created_at, second[0]["provider"].created_at)
+        self.assertEqual(len(client.interner), 1)
+
+        # Shared interfaces are read-only; a copy can be modified
+        with self.assertRaises(AttributeError):
+            first[0]["provider"].interfaces[0].id = 2
+
+        copy = ArrowheadInterface.from_tuple(first[0]["provider"].interfaces[0].to_tuple())
+        copy.id = 2
+        self.assertEqual(copy.id, 2)
+
+
+    def test_reconcile(self):
+        client = create_client()
+        writes = lambda: [operation for operation, _ in client.connector.requests]
+
+        services = [ArrowheadService(name = "a"), ArrowheadService(name = "b", metadata = {"unit": "m"})]
+
+        self.assertTrue(client.reconcile(services))
+        self.assertEqual(writes(), ["register_service", "register_service"])
+        self.assertEqual(client.id, 3)
+
+        # Nothing has changed
+        client.connector.requests.clear()
+        self.assertTrue(client.reconcile([ArrowheadService(name = "a"), ArrowheadService(name = "b", metadata = {"unit": "m"})]))
+        self.assertEqual(writes(), [])
+
+        # Version of 'b' has changed and 'a' is not desired anymore
+        self.assertTrue(client.reconcile([ArrowheadService(name = "b", version = 2, metadata = {"unit": "m"})], remove = [ArrowheadService(name = "a")]))
+        self.assertEqual(sorted(writes()), ["register_service", "unregister_service", "unregister_service"])
+        self.assertEqual(sorted(client.connector.registry.keys()), ["b"])
+
+
+    def test_prefetch(self):
+        client = create_client()
+        client.require(ArrowheadService(name = "echo"), ArrowheadService(name = "time"))
+
+        self.assertTrue(client.prefetch())
+        self.assertEqual(len(client.connector.requests), 2)
+        self.assertEqual(len(client.get_providers(ArrowheadService(name = "time"))), 1)
+        self.assertEqual(client.get_providers(ArrowheadService(name = "unknown")), [])
+
+        client.start_refresh(0.01)
+        time.sleep(0.1)
+        client.stop_refresh()
+
+        self.assertGreater(len(client.connector.requests), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
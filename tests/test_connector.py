@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# test_connector.py
+"""Test Arrowhead Connector.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from aclpy.connector import connector_replay
+from aclpy.connector.adaptive import AdaptiveTimeouts
+from aclpy.connector.connector import ArrowheadConnector, timeout_error
+from aclpy.connector.hedging import Hedging
+from aclpy.connector.recorder import Recorder, load_records
+from aclpy.server import ArrowheadServer
+from aclpy.system import ArrowheadSystem
+
+
+class DummyConnector(ArrowheadConnector):
+
+    queries = 0
+
+
+    def _orchestrate(self, system, message, timeout = None):
+        if message.get("service") == "missing":
+            return (400, {"errorCode": 400, "exceptionType": "BAD_PAYLOAD", "errorMessage": "Missing."})
+
+        self.url = self.server.get_url("orchestrator")
+
+        return (200, {"response": [message.get("service")]})
+
+
+    def _query_service(self, system, message, timeout = None):
+        self.queries += 1
+
+        if message.get("serviceDefinitionRequirement") != "orchestration-service":
+            return (200, {"serviceQueryData": [], "unfilteredHits": 0})
+
+        return (200, {"serviceQueryData": [{
+            "provider": {"systemName": "orchestrator", "address": "10.0.0.2", "port": 9441},
+            "serviceUri": "/orchestrator/orchestration",
+            "secure": "CERTIFICATE",
+        }], "unfilteredHits": 1})
+
+
+    def _warmup(self, system, core_system):
+        if core_system == "authorization":
+            raise ConnectionError
+
+        return True
+
+
+class TestConnector(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = DummyConnector(ArrowheadServer())
+        self.system = ArrowheadSystem(name = "test", address = "127.0.0.1", port = 0)
+
+
+    def test_warmup(self):
+        futures = self.connector.warmup(self.system, wait = True)
+
+        self.assertEqual(
+            {core_system: future.result() for core_system, future in futures.items()},
+            {"orchestrator": True, "serviceregistry": True, "authorization": False}
+        )
+
+
+    def test_discovery(self):
+        self.connector.discovery = True
+
+        self.assertTrue(self.connector.orchestrate(self.system, {"service": "a"})[0])
+        self.assertEqual(self.connector.url, "https://10.0.0.2:9441/orchestrator/")
+
+        # Discovered URL is reused until it expires
+        self.connector.orchestrate(self.system, {"service": "a"})
+        self.assertEqual(self.connector.queries, 1)
+
+        self.connector.server.expire("orchestrator")
+        self.connector.orchestrate(self.system, {"service": "a"})
+        self.assertEqual(self.connector.queries, 2)
+
+        # Unknown core systems keep the configured URL
+        self.assertEqual(self.connector.discover(self.system, ["authorization"]), {"authorization": False})
+        self.assertEqual(self.connector.server.get_url("authorization"), "https://127.0.0.1:8445/authorization/")
+
+
+    def test_discovery_failure(self):
+        self.connector.discovery = True
+        self.connector._query_service = lambda *args: (500, {"errorCode": 500, "exceptionType": "GENERIC", "errorMessage": "Down."})
+
+        queries = []
+        query_service = self.connector.query_service
+        self.connector.query_service = lambda *args: queries.append(args) or query_service(*args)
+
+        # Failed discovery is not repeated before 'discovery_retry'
+        for _ in range(3):
+            self.assertTrue(self.connector.orchestrate(self.system, {"service": "a"})[0])
+
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(self.connector.url, "https://127.0.0.1:8441/orchestrator/")
+
+        self.connector.server.expire("orchestrator")
+        self.connector.orchestrate(self.system, {"service": "a"})
+        self.assertEqual(len(queries), 2)
+
+
+    def test_record_replay(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "recording.jsonl.gz")
+
+            with Recorder(filename) as recorder:
+                self.connector.recorder = recorder
+
+                self.connector.orchestrate(self.system, {"service": "a"})
+                self.connector.orchestrate(self.system, {"service": "b"})
+                self.connector.orchestrate(self.system, {"service": "missing"})
+
+                # Local errors are not responses of the Core
+                self.connector.orchestrate(self.system, {"service": "a"}, time.monotonic() - 1)
+
+            self.assertEqual(len(load_records(filename)), 3)
+            self.assertTrue(all(record["duration"] < 1 for record in load_records(filename)))
+
+            replay = connector_replay.ArrowheadConnector(ArrowheadServer(), filename)
+
+            self.assertEqual(replay.orchestrate(self.system, {"service": "b"}), (True, 200, {"response": ["b"]}))
+            self.assertEqual(replay.orchestrate(self.system, {"service": "other"})[2], {"response": ["a"]})
+
+            success, status_code, payload = replay.orchestrate(self.system, {"service": "missing"})
+            self.assertFalse(success)
+            self.assertEqual(replay.last_error.error_code, 400)
+
+            self.assertEqual(replay.register_system(self.system, {})[1], 404)
+
+
+    def test_timeouts(self):
+        self.connector.connect_timeout = 2
+        self.connector.read_timeout = None
+
+        self.assertEqual(self.connector.get_timeout("orchestrate"), (2, 8))
+
+        # Connecting and waiting for the response together fit into the budget
+        expires_at = time.monotonic() + 1
+        timeouts = self.connector.get_timeout("orchestrate", expires_at)
+        connect_timeout, read_timeout = timeouts
+        self.assertLessEqual(connect_timeout, 0.5)
+        self.assertLessEqual(connect_timeout + read_timeout, 1)
+        self.assertEqual(timeouts.expires_at, expires_at)
+
+        self.connector.read_timeout = 30
+        timeouts = self.connector.get_timeout("query_service")
+        self.assertEqual(timeouts, (2, 8))
+        self.assertLessEqual(timeouts.expires_at, time.monotonic() + 10)
+
+        self.connector.timeout = 4
+        self.assertEqual(self.connector.get_timeout("register_system"), (4, 4))
+
+
+    def test_adaptive_timeouts(self):
+        adaptive = AdaptiveTimeouts(multiplier = 2, floor = 0.5, ceiling = 8, min_samples = 20)
+
+        for _ in range(19):
+            adaptive.record("orchestrator", "orchestrate", 1.0)
+
+        self.assertIsNone(adaptive.get("orchestrator", "orchestrate"))
+
+        adaptive.record("orchestrator", "orchestrate", 1.0)
+        self.assertEqual(adaptive.get("orchestrator", "orchestrate"), 2.0)
+
+        for _ in range(20):
+            adaptive.record("serviceregistry", "register_system", 0.01)
+            adaptive.record("serviceregistry", "query_service", 100)
+
+        self.assertEqual(adaptive.get("serviceregistry", "register_system"), 0.5)
+        self.assertEqual(adaptive.get("serviceregistry", "query_service"), 8)
+
+        self.connector.connect_timeout = 2
+        self.connector.read_timeout = None
+        self.connector.adaptive = adaptive
+
+        self.assertEqual(self.connector.get_timeout("orchestrate"), (2, 2.0))
+        self.assertEqual(self.connector.get_timeout("register_service"), (2, 28))
+        self.assertEqual(self.connector.adaptive_timeouts()["serviceregistry"]["query_service"], 8)
+
+        # Timeouts extend the timeout by a bounded step, a response resets it
+        for _ in range(10):
+            adaptive.timed_out("orchestrator", "orchestrate")
+
+        self.assertEqual(adaptive.get("orchestrator", "orchestrate"), 4.0)
+
+        adaptive.record("orchestrator", "orchestrate", 1.0)
+        self.assertEqual(adaptive.get("orchestrator", "orchestrate"), 2.0)
+
+        # Operations outside of 'OPERATIONS' keep the static timeouts, limited by their deadline
+        self.assertEqual(self.connector.get_timeout("warmup"), (2, 8))
+        self.assertTrue(self.connector.warmup(self.system, ["orchestrator"], wait = True)["orchestrator"].result())
+
+        # Latencies of the sent requests are recorded
+        self.connector.orchestrate(self.system, {"service": "a"})
+        self.assertEqual(len(adaptive._latencies[("orchestrator", "orchestrate")]), 22)
+
+        # Local errors are not latency samples
+        self.connector._orchestrate = lambda *args: timeout_error("orchestrate")
+        self.connector.orchestrate(self.system, {"service": "a"})
+        self.assertEqual(len(adaptive._latencies[("orchestrator", "orchestrate")]), 22)
+        self.assertEqual(adaptive.get("orchestrator", "orchestrate"), 2.5)
+
+
+    def test_deadline_exceeded(self):
+        success, status_code, payload = self.connector.orchestrate(self.system, {"service": "a"}, time.monotonic() - 1)
+
+        self.assertFalse(success)
+        self.assertEqual(status_code, 408)
+        self.assertEqual(self.connector.last_error.exception_type, "TIMEOUT")
+
+
+    def test_hedging(self):
+        for budget, hedged in ((0.1, 1), (0, 0)):
+            calls = []
+
+            def request():
+                calls.append(None)
+
+                # The first request after the warm-up is slow and fails
+                if len(calls) == 21:
+                    time.sleep(0.3)
+                    return (503, {"response": ["slow"]})
+
+                return (200, {"response": ["fast"]})
+
+            hedging = Hedging(min_samples = 20, budget = budget)
+
+            for _ in range(20):
+                hedging.run(request)
+
+            self.assertEqual(hedging.run(request)[1], {"response": ["fast" if hedged else "slow"]})
+            self.assertEqual(hedging.hedged, hedged)
+
+            hedging.close()
+
+
+    def test_hedging_concurrency(self):
+        def request():
+            time.sleep(0.2)
+            return (200, {"response": []})
+
+        with Hedging(min_samples = 1, min_delay = 0.05, budget = 0.1, max_workers = 2) as hedging:
+            hedging.latencies.add(0.01)
+
+            # Hedged calls are not limited by the pool of the second requests
+            threads = [threading.Thread(target = hedging.run, args = (request, )) for _ in range(40)]
+            start = time.perf_counter()
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            self.assertLess(time.perf_counter() - start, 0.35)
+            self.assertEqual(hedging.requests, 40)
+
+
+    def test_hedging_limits(self):
+        connector = DummyConnector(ArrowheadServer(address = "10.0.0.99", orchestrator_max_in_flight = 1))
+        lock = threading.Lock()
+        in_flight = []
+        timeouts = []
+
+        def orchestrate(system, message, timeout = None):
+            with lock:
+                in_flight.append(connector.get_limiter("orchestrator").in_flight)
+
+            timeouts.append(timeout)
+
+            # The first request after the warm-up is slow
+            if len(timeouts) == 21:
+                time.sleep(0.3)
+
+            return (200, {"response": []})
+
+        connector._orchestrate = orchestrate
+
+        with Hedging(min_samples = 20, budget = 1) as hedging:
+            connector.hedging = hedging
+
+            for _ in range(21):
+                connector.orchestrate(self.system, {}, time.monotonic() + 5)
+
+        # The hedged request waited for the limiter and got only the remaining time
+        self.assertEqual(max(in_flight), 1)
+        self.assertEqual(hedging.hedged, 1)
+        self.assertEqual(len(timeouts), 22)
+        self.assertLess(timeouts[-1][1], timeouts[-2][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
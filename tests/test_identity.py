@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# test_identity.py
+"""Test registry of the identities.
+"""
+
+import unittest
+
+from aclpy.connector.identity import IdentityRegistry
+
+
+class DummyAdapter(object):
+
+    created = 0
+
+    def __init__(self):
+        DummyAdapter.created += 1
+        self.closed = False
+
+
+    def close(self):
+        self.closed = True
+
+
+class TestIdentityRegistry(unittest.TestCase):
+
+    def test_shared(self):
+        registry = IdentityRegistry()
+
+        first = registry.get("a", DummyAdapter)
+
+        self.assertIs(registry.get("a", DummyAdapter), first)
+        self.assertEqual(registry.stats(), {"identities": 1, "hits": 1, "misses": 1, "evictions": 0})
+
+
+    def test_lru(self):
+        registry = IdentityRegistry(max_identities = 2)
+
+        a = registry.get("a", DummyAdapter)
+        b = registry.get("b", DummyAdapter)
+
+        # 'a' was used recently, so 'b' is evicted
+        registry.get("a", DummyAdapter)
+        registry.get("c", DummyAdapter)
+
+        self.assertIn("a", registry)
+        self.assertNotIn("b", registry)
+        self.assertTrue(b.closed)
+        self.assertFalse(a.closed)
+        self.assertEqual(registry.evictions, 1)
+
+        registry.clear()
+
+        self.assertEqual(len(registry), 0)
+        self.assertTrue(a.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# test_index.py
+"""Test local index of the services.
+"""
+
+import unittest
+
+from aclpy.index import ServiceIndex
+
+from helpers import create_match
+
+
+def ports(matches):
+    return sorted(match["provider"].port for match in matches)
+
+
+class TestServiceIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = ServiceIndex()
+        self.index.refresh("temperature", [
+            create_match(1, 1, {"room": "a"}),
+            create_match(2, 2, {"room": "a"}, "HTTP-SECURE-CBOR"),
+            create_match(3, 3, {"room": "b"}),
+        ])
+        self.index.refresh("humidity", [create_match(4, 1, {"room": "a"}, service = "humidity")])
+
+
+    def test_find(self):
+        self.assertEqual(ports(self.index.find(service = "temperature")), [1, 2, 3])
+        self.assertEqual(ports(self.index.find(metadata = {"room": "a"})), [1, 2, 4])
+        self.assertEqual(ports(self.index.find(service = "temperature", interface = "HTTP-SECURE-JSON", metadata = {"room": "a"})), [1])
+        self.assertEqual(ports(self.index.find(service = "temperature", min_version = 2)), [2, 3])
+        self.assertEqual(ports(self.index.find(min_version = 1, max_version = 2)), [1, 2, 4])
+        self.assertEqual(ports(self.index.find(metadata = {"room": "c"})), [])
+        self.assertEqual(len(self.index.find()), 4)
+
+
+    def test_refresh(self):
+        self.index.refresh("temperature", [
+            create_match(2, 2, {"room": "b"}, "HTTP-SECURE-CBOR"),
+            create_match(5, 1, {"room": "a"}),
+        ])
+
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(ports(self.index.find(metadata = {"room": "a"})), [4, 5])
+        self.assertEqual(ports(self.index.find(service = "temperature", metadata = {"room": "b"})), [2])
+        self.assertEqual(ports(self.index.find(interface = "HTTP-SECURE-CBOR", max_version = 2)), [2])
+
+        self.index.refresh("temperature", [])
+
+        self.assertEqual(ports(self.index.find()), [4])
+
+
+    def test_refresh_normalized_name(self):
+        # The Core returns normalized service definitions
+        self.index.refresh("Temperature", [create_match(6)])
+        self.index.refresh("Temperature", [create_match(7)])
+
+        self.assertEqual(ports(self.index.find(service = "temperature")), [1, 2, 3, 7])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# test_invoker.py
+"""Test invocation of the provided services.
+"""
+
+import http.server
+import socket
+import threading
+import unittest
+
+from aclpy.client.client import ArrowheadClient
+from aclpy.connector.connector import ArrowheadConnector
+from aclpy.server import ArrowheadServer
+
+from helpers import create_match
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+
+class EchoHandler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+
+    def do_GET(self):
+        data = self.path.encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class SessionConnector(ArrowheadConnector):
+
+    def __init__(self, server):
+        super(SessionConnector, self).__init__(server)
+
+        self.session = requests.Session()
+
+
+    def _get_session(self, system):
+        return self.session
+
+
+@unittest.skipIf(requests is None, "requests is not installed")
+class TestServiceInvoker(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = http.server.ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        threading.Thread(target = self.provider.serve_forever, daemon = True).start()
+
+        closed = socket.socket()
+        closed.bind(("127.0.0.1", 0))
+        self.dead = closed.getsockname()[1]
+        closed.close()
+
+
+    def tearDown(self):
+        self.provider.shutdown()
+        self.provider.server_close()
+
+
+    def test_failover(self):
+        from aclpy.client.invoker import ServiceInvoker
+
+        client = ArrowheadClient("client", "127.0.0.1", 0, "", SessionConnector(ArrowheadServer()))
+        invoker = ServiceInvoker(
+            client,
+            [
+                create_match(self.dead, service = "echo", uri = "/echo"),
+                create_match(self.provider.server_address[1], service = "echo", uri = "/echo"),
+            ],
+            scheme = "http",
+        )
+
+        success, response = invoker.get("/value")
+
+        self.assertTrue(success)
+        self.assertEqual(response.text, "/echo/value")
+
+        # Working provider is used first from now on
+        self.assertEqual(invoker.get_url(), "http://127.0.0.1:%d/echo" % self.provider.server_address[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# test_loadgen.py
+"""Test the load generator.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from aclpy.client.client import ArrowheadClient
+from aclpy.connector import connector_replay
+from aclpy.connector.recorder import Recorder
+from aclpy.loadgen import Fleet, format_path, parse_mix, run_load
+from aclpy.server import ArrowheadServer
+from aclpy.stats import percentile
+
+
+class TestLoadgen(unittest.TestCase):
+
+    def test_percentile(self):
+        self.assertIsNone(percentile([], 50))
+        self.assertEqual(percentile([3, 1, 2], 50), 2)
+        self.assertEqual(percentile([1, 2], 50), 1.5)
+        self.assertEqual(percentile([1, 2, 3, 4], 100), 4)
+
+
+    def test_parse_mix(self):
+        self.assertEqual(parse_mix("orchestrate=8,register_service"), {"orchestrate": 8.0, "register_service": 1.0})
+
+        with self.assertRaises(ValueError):
+            parse_mix("unknown=1")
+
+
+    def test_run_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "recording.jsonl")
+
+            with Recorder(filename) as recorder:
+                recorder.record("orchestrate", {}, 200, {"response": []}, 0.001)
+
+            server = ArrowheadServer()
+            fleet = Fleet([
+                ArrowheadClient("system%d" % _i, "127.0.0.1", 20000 + _i, "", connector_replay.ArrowheadConnector(server, filename))
+                for _i in range(3)
+            ], 2)
+
+            report = run_load(fleet, parse_mix("orchestrate=3,register_system=1"), concurrency = 2, count = 40)
+
+            self.assertEqual(sum(row["count"] for row in report.values()), 40)
+            self.assertEqual(report["orchestrate"]["error_rate"], 0.0)
+            self.assertEqual(report["register_system"]["error_rate"], 1.0)
+
+
+
+    def test_open_loop_queueing(self):
+        class SlowFleet:
+            def run(self, operation):
+                time.sleep(0.05)
+                return True
+
+        # 100 operations per second served by a single worker at 20 per second
+        report = run_load(SlowFleet(), {"orchestrate": 1.0}, rate = 100, concurrency = 1, count = 10)
+
+        # The last operation waited for the previous ones; the queueing time is included
+        self.assertGreater(report["orchestrate"]["max"], 0.3)
+
+
+    def test_format_path(self):
+        self.assertEqual(format_path("certs/{name}.p12", "loadgen3", 3), "certs/loadgen3.p12")
+        self.assertEqual(format_path("certs/system{index}.p12", "loadgen3", 3), "certs/system3.p12")
+        self.assertEqual(format_path("loadgen.p12", "loadgen3", 3), "loadgen.p12")
+        self.assertIsNone(format_path(None, "loadgen3", 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# test_messages.py
+"""Test Arrowhead messages.
+"""
+
+import unittest
+
+from aclpy.interface import ArrowheadInterface
+from aclpy.messages import build_orchestration_request
+from aclpy.service import ArrowheadService
+from aclpy.system import ArrowheadSystem
+
+
+class TestMessages(unittest.TestCase):
+
+    def setUp(self):
+        self.system = ArrowheadSystem(name = "test", address = "127.0.0.1", port = 0)
+        self.interfaces = [ArrowheadInterface(name = "HTTP-SECURE-JSON")]
+        self.service = ArrowheadService(name = "echo")
+
+
+    def test_orchestration_default(self):
+        msg = build_orchestration_request(interfaces = self.interfaces, system = self.system, service = self.service)
+
+        self.assertEqual(msg["orchestrationFlags"], {"overrideStore": "true"})
+        self.assertEqual(msg["requestedService"], {
+            "interfaceRequirements": ["HTTP-SECURE-JSON"],
+            "serviceDefinitionRequirement": "echo",
+        })
+
+
+    def test_orchestration_requirements(self):
+        msg = build_orchestration_request(
+            interfaces = self.interfaces,
+            system = self.system,
+            service = self.service,
+            matchmaking = True,
+            ping_providers = True,
+            min_version = 2,
+            max_version = 3,
+            metadata = {"unit": "m"},
+            security = ["CERTIFICATE"],
+        )
+
+        self.assertEqual(msg["orchestrationFlags"], {
+            "overrideStore": "true",
+            "matchmaking": "true",
+            "metadataSearch": "true",
+            "pingProviders": "true",
+        })
+        self.assertEqual(msg["requestedService"]["minVersionRequirement"], 2)
+        self.assertEqual(msg["requestedService"]["maxVersionRequirement"], 3)
+        self.assertEqual(msg["requestedService"]["metadataRequirements"], {"unit": "m"})
+        self.assertEqual(msg["requestedService"]["securityRequirements"], ["CERTIFICATE"])
+        self.assertNotIn("versionRequirement", msg["requestedService"])
+        self.assertNotIn("preferredProviders", msg)
+
+
+    def test_orchestration_preferred(self):
+        provider = ArrowheadSystem(name = "provider", address = "10.0.0.2", port = 8080)
+
+        msg = build_orchestration_request(
+            interfaces = self.interfaces,
+            system = self.system,
+            service = self.service,
+            only_preferred = True,
+            preferred_providers = [provider],
+            preferred_clouds = [("operator", "cloud")],
+        )
+
+        self.assertEqual(msg["orchestrationFlags"]["onlyPreferred"], "true")
+        self.assertEqual(msg["preferredProviders"], [
+            {"providerSystem": {"systemName": "provider", "address": "10.0.0.2", "port": 8080}},
+            {"providerCloud": {"operator": "operator", "name": "cloud"}},
+        ])
+
+        # The Orchestrator rejects preferred-only orchestration without preferred providers
+        with self.assertRaises(ValueError):
+            build_orchestration_request(
+                interfaces = self.interfaces, system = self.system, service = self.service, only_preferred = True
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
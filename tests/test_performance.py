@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# test_performance.py
+"""Performance regression tests of the hot paths.
+
+Time and memory budgets depend on the machine, so they are checked only when ACLPY_PERF
+is set (see 'make perf'). Set ACLPY_PERF_SCALE to scale them, e.g., ACLPY_PERF_SCALE=0.5
+to tighten them. Reuse of the connections is checked always.
+"""
+
+import http.server
+import json
+import os
+import statistics
+import threading
+import time
+import tracemalloc
+import unittest
+
+from aclpy.client.client import ArrowheadClient
+from aclpy.interface import ArrowheadInterface
+from aclpy.intern import Interner
+from aclpy.messages import build_orchestration_request, build_register_service, build_register_system
+from aclpy.server import ArrowheadServer
+from aclpy.service import ArrowheadService
+from aclpy.synthetic import orchestration_response
+from aclpy.system import ArrowheadSystem
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+
+ENABLED = os.environ.get("ACLPY_PERF", "0") not in ("", "0")
+SCALE = float(os.environ.get("ACLPY_PERF_SCALE", "1"))
+
+# Median time of a single call in milliseconds
+LATENCY = {
+    "build_orchestration_request": 0.05,
+    "build_register_service": 0.05,
+    "build_register_system": 0.05,
+    "parse_orchestration": 40.0,    # 1000 providers, including JSON decoding
+    "orchestrate": 5.0,             # against the stand-in Core, 10 providers
+}
+
+# Memory retained by the parsed results in KiB
+MEMORY = {
+    "parse_orchestration": 3072,            # 1000 providers
+    "parse_orchestration_interned": 1536,   # 1000 providers
+}
+
+# Connections opened to the stand-in Core by a sequence of requests
+CONNECTIONS = {
+    "orchestrate": 1,
+}
+
+
+def measure(function, repeat: int) -> float:
+    """Get median duration of 'function' in milliseconds."""
+    function()
+
+    durations = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations) * 1000
+
+
+def retained(function) -> float:
+    """Get memory allocated by 'function' and still held by its result in KiB."""
+    tracemalloc.start()
+
+    try:
+        result = function()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del result
+
+    return size / 1024
+
+
+class StandInCore(http.server.ThreadingHTTPServer):
+    """Minimal plain-HTTP stand-in of the Orchestrator and the Service Registry."""
+
+    daemon_threads = True
+
+    def __init__(self, providers: int = 10):
+        self.connections = 0
+        self.response = json.dumps(orchestration_response(providers)).encode("utf-8")
+
+        super(StandInCore, self).__init__(("127.0.0.1", 0), StandInHandler)
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super(StandInHandler, self).setup()
+        self.server.connections += 1
+
+
+    def log_message(self, *args):
+        pass
+
+
+    def _send(self, status_code: int, data: bytes):
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        if self.path == "/orchestrator/orchestration":
+            self._send(200, self.server.response)
+        else:
+            self._send(404, b'{"errorCode":404,"exceptionType":"NOT_FOUND","errorMessage":"Unknown."}')
+
+
+    def do_GET(self):
+        self._send(200, b"Got it!")
+
+
+if requests is not None:
+    from aclpy.connector import connector_https
+
+    class PlainConnector(connector_https.ArrowheadConnector):
+        """HTTPS connector without a client certificate; the stand-in Core uses plain HTTP."""
+
+        def _get_adapter(self, system):
+            return requests.adapters.HTTPAdapter()
+
+
+class TestPerformance(unittest.TestCase):
+
+    def setUp(self):
+        self.interface = ArrowheadInterface(name = "HTTP-SECURE-JSON")
+        self.system = ArrowheadSystem(name = "client", address = "127.0.0.1", port = 0, interfaces = [self.interface])
+        self.service = ArrowheadService(name = "temperature", metadata = {"unit": "celsius"})
+
+
+    def assertBudget(self, name: str, value: float, budgets: dict):
+        self.assertLessEqual(value, budgets[name] * SCALE, "%s exceeded its budget" % name)
+
+
+    @unittest.skipUnless(ENABLED, "ACLPY_PERF is not set")
+    def test_messages(self):
+        self.assertBudget("build_orchestration_request", measure(lambda: build_orchestration_request(
+            interfaces = [self.interface], system = self.system, service = self.service,
+            metadata = {"unit": "celsius"}, ping_providers = True,
+        ), 200), LATENCY)
+
+        self.assertBudget("build_register_service", measure(lambda: build_register_service(
+            interfaces = [self.interface], system = self.system, service = self.service,
+        ), 200), LATENCY)
+
+        self.assertBudget("build_register_system", measure(lambda: build_register_system(
+            system = self.system,
+        ), 200), LATENCY)
+
+
+    @unittest.skipUnless(ENABLED, "ACLPY_PERF is not set")
+    def test_parse_orchestration(self):
+        client = ArrowheadClient("client", "127.0.0.1", 0, "", None)
+        data = json.dumps(orchestration_response(1000))
+
+        # Each response is decoded again, as when received from the Core
+        parse = lambda: client._parse_orchestration(json.loads(data))
+
+        self.assertBudget("parse_orchestration", measure(parse, 5), LATENCY)
+        self.assertBudget("parse_orchestration", retained(parse), MEMORY)
+
+        client.interner = Interner()
+        parse()
+
+        self.assertBudget("parse_orchestration_interned", retained(parse), MEMORY)
+
+
+    @unittest.skipIf(requests is None, "requests is not installed")
+    def test_orchestrate(self):
+        core = StandInCore()
+        threading.Thread(target = core.serve_forever, daemon = True).start()
+
+        try:
+            address, port = core.server_address
+            server = ArrowheadServer(
+                orchestrator_url = "http://%s:%d/orchestrator/" % (address, port),
+                serviceregistry_url = "http://%s:%d/serviceregistry/" % (address, port),
+            )
+
+            client = ArrowheadClient("client", "127.0.0.1", 0, "", PlainConnector(server))
+            client.cafile = None
+
+            duration = measure(lambda: client.orchestrate(self.service), 50)
+
+            if ENABLED:
+                self.assertBudget("orchestrate", duration, LATENCY)
+
+            self.assertLessEqual(core.connections, CONNECTIONS["orchestrate"])
+        finally:
+            core.shutdown()
+            core.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# test_probe.py
+"""Test liveness probing of the providers.
+"""
+
+import socket
+import unittest
+
+from aclpy.probe import Prober
+
+from helpers import create_match
+
+
+class TestProber(unittest.TestCase):
+
+    def setUp(self):
+        self.listener = socket.socket()
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen(8)
+        self.alive = self.listener.getsockname()[1]
+
+        # Port that was free a moment ago; nothing listens there
+        closed = socket.socket()
+        closed.bind(("127.0.0.1", 0))
+        self.dead = closed.getsockname()[1]
+        closed.close()
+
+
+    def tearDown(self):
+        self.listener.close()
+
+
+    def test_sort(self):
+        prober = Prober(timeout = 0.5)
+
+        matches = prober.sort([create_match(self.dead), create_match(self.alive)])
+
+        self.assertEqual([match["provider"].port for match in matches], [self.alive, self.dead])
+
+        prober.drop_unreachable = True
+
+        matches = prober.sort([create_match(self.dead), create_match(self.alive)])
+
+        self.assertEqual([match["provider"].port for match in matches], [self.alive])
+
+        # Nothing is dropped when no provider is reachable
+        matches = prober.sort([create_match(self.dead), create_match(self.dead + 1)])
+
+        self.assertEqual([match["provider"].port for match in matches], [self.dead, self.dead + 1])
+
+
+    def test_ttl(self):
+        prober = Prober(ttl = 60)
+
+        prober.probe([("127.0.0.1", self.alive)])
+        self.listener.close()
+
+        # Stored result is used until it expires
+        self.assertIsNotNone(prober.probe([("127.0.0.1", self.alive)])[("127.0.0.1", self.alive)])
+
+        prober.clear()
+
+        self.assertIsNone(prober.probe([("127.0.0.1", self.alive)])[("127.0.0.1", self.alive)])
+
+
+    def test_prune(self):
+        prober = Prober(ttl = 0)
+
+        prober.probe([("127.0.0.1", self.dead)])
+        prober.probe([("127.0.0.1", self.alive)])
+
+        # Expired results are removed
+        self.assertEqual(list(prober._results.keys()), [("127.0.0.1", self.alive)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# test_ratelimit.py
+"""Test client-side rate limiting.
+"""
+
+import threading
+import time
+import unittest
+
+from aclpy.connector.connector import ArrowheadConnector
+from aclpy.connector.ratelimit import RateLimiter
+from aclpy.server import ArrowheadServer
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_rate(self):
+        limiter = RateLimiter(rate = 50, burst = 1)
+
+        start = time.monotonic()
+
+        for _ in range(6):
+            self.assertTrue(limiter.acquire())
+            limiter.release()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        self.assertEqual(limiter.stats()["waited"], 5)
+
+
+    def test_max_in_flight(self):
+        limiter = RateLimiter(max_in_flight = 1)
+
+        self.assertTrue(limiter.acquire())
+        self.assertFalse(limiter.acquire(timeout = 0.05))
+
+        threading.Timer(0.05, limiter.release).start()
+
+        self.assertTrue(limiter.acquire(timeout = 1))
+        self.assertEqual(limiter.in_flight, 1)
+        self.assertEqual(limiter.queue_depth, 0)
+
+
+    def test_connector(self):
+        connector = ArrowheadConnector(ArrowheadServer(serviceregistry_max_in_flight = 4))
+
+        self.assertIsNone(connector.get_limiter("orchestrator"))
+        self.assertEqual(connector.get_limiter("serviceregistry").max_in_flight, 4)
+        self.assertEqual(list(connector.limiter_stats().keys()), ["serviceregistry"])
+
+        # Connectors to the same Core share the limits
+        other = ArrowheadConnector(ArrowheadServer(serviceregistry_max_in_flight = 4))
+        self.assertIs(other.get_limiter("serviceregistry"), connector.get_limiter("serviceregistry"))
+
+        remote = ArrowheadConnector(ArrowheadServer(address = "10.0.0.1", serviceregistry_max_in_flight = 4))
+        self.assertIsNot(remote.get_limiter("serviceregistry"), connector.get_limiter("serviceregistry"))
+
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, RateLimiter, rate = 0)
+        self.assertRaises(ValueError, RateLimiter, max_in_flight = 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
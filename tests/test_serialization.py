@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# test_serialization.py
+"""Test serialization of the models and orchestration results.
+"""
+
+import json
+import pickle
+import time
+import unittest
+
+from aclpy.interface import ArrowheadInterface
+from aclpy.serialization import dump_matches, load_matches
+from aclpy.service import ArrowheadService
+from aclpy.system import ArrowheadSystem
+
+from helpers import create_match
+
+
+class TestModels(unittest.TestCase):
+
+    def setUp(self):
+        self.match = create_match(8080, 2, {"room": "a", "unit": "C"})
+
+
+    def assertSystemEqual(self, first, second):
+        self.assertEqual(first.to_tuple(), second.to_tuple())
+        self.assertEqual([_i.name for _i in first.interfaces], [_i.name for _i in second.interfaces])
+
+
+    def test_tuple(self):
+        self.assertSystemEqual(ArrowheadSystem.from_tuple(self.match["provider"].to_tuple()), self.match["provider"])
+
+        service = ArrowheadService.from_tuple(self.match["service"].to_tuple())
+        self.assertEqual(service.metadata, {"room": "a", "unit": "C"})
+        self.assertEqual(service.uri, "/temperature")
+
+
+    def test_dict(self):
+        self.assertSystemEqual(ArrowheadSystem.from_dict(self.match["provider"].to_dict()), self.match["provider"])
+        self.assertEqual(
+            ArrowheadService.from_dict(self.match["service"].to_dict()).to_tuple(),
+            self.match["service"].to_tuple(),
+        )
+
+        interface = ArrowheadInterface.from_dict(ArrowheadInterface(name = "HTTP-SECURE-JSON").to_dict())
+        self.assertEqual(interface.name, "HTTP-SECURE-JSON")
+
+
+    def test_pickle(self):
+        provider = pickle.loads(pickle.dumps(self.match["provider"]))
+        service = pickle.loads(pickle.dumps(self.match["service"]))
+
+        self.assertIsInstance(provider, ArrowheadSystem)
+        self.assertSystemEqual(provider, self.match["provider"])
+        self.assertEqual(service.to_tuple(), self.match["service"].to_tuple())
+
+
+class TestMatches(unittest.TestCase):
+
+    def test_round_trip(self):
+        matches = [create_match(port, 2, {"room": "a", "unit": "C"}) for port in range(8080, 8090)]
+        matches[3]["stale"] = True
+
+        loaded = load_matches(dump_matches(matches))
+
+        self.assertEqual(len(loaded), 10)
+        self.assertEqual(
+            [(_m["provider"].to_tuple(), _m["service"].to_tuple()) for _m in loaded],
+            [(_m["provider"].to_tuple(), _m["service"].to_tuple()) for _m in matches],
+        )
+        self.assertTrue(loaded[3]["stale"])
+        self.assertNotIn("stale", loaded[0])
+
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            load_matches(b"invalid")
+
+        with self.assertRaises(ValueError):
+            load_matches(pickle.dumps(None))
+
+
+    def test_faster_than_json(self):
+        matches = [create_match(port, 2, {"room": "a", "unit": "C"}) for port in range(1000)]
+
+        def through_json():
+            data = json.dumps([
+                {"provider": _m["provider"].to_dict(), "service": _m["service"].to_dict()} for _m in matches
+            ])
+
+            return [
+                {
+                    "provider": ArrowheadSystem.from_dict(_m["provider"]),
+                    "service": ArrowheadService.from_dict(_m["service"]),
+                } for _m in json.loads(data)
+            ]
+
+        def measure(function):
+            start = time.perf_counter()
+            function()
+
+            return time.perf_counter() - start
+
+        compact = min(measure(lambda: load_matches(dump_matches(matches))) for _ in range(5))
+        baseline = min(measure(through_json) for _ in range(5))
+
+        self.assertLess(compact, baseline)
+
+
+if __name__ == "__main__":
+    unittest.main()
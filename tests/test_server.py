@@ -17,5 +17,27 @@ class TestServer(unittest.TestCase):
         server.get_url("orchestrator")
 
 
+    def test_urls(self):
+        server = ArrowheadServer(address = "10.0.0.1", orchestrator_endpoint = "orch")
+
+        self.assertEqual(server.get_url("orchestrator"), "https://10.0.0.1:8441/orch/")
+        self.assertRaises(ValueError, server.get_url, "gatekeeper")
+
+        server.set_url("orchestrator", "https://10.0.0.2:8441/orchestrator/", ttl = 60)
+        self.assertEqual(server.get_url("orchestrator"), "https://10.0.0.2:8441/orchestrator/")
+        self.assertTrue(server.is_fresh("orchestrator"))
+
+        server.expire("orchestrator")
+        self.assertFalse(server.is_fresh("orchestrator"))
+        self.assertEqual(server.get_url("orchestrator"), "https://10.0.0.2:8441/orchestrator/")
+
+        server.defer("orchestrator", 60)
+        self.assertTrue(server.is_fresh("orchestrator"))
+        self.assertEqual(server.get_url("orchestrator"), "https://10.0.0.2:8441/orchestrator/")
+
+        server.reset("orchestrator")
+        self.assertEqual(server.get_url("orchestrator"), "https://10.0.0.1:8441/orch/")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# test_tls.py
+"""Test TLS session resumption.
+"""
+
+import ssl
+import unittest
+
+from aclpy.connector.tls import ResumingSSLContext
+
+
+class TestResumingSSLContext(unittest.TestCase):
+
+    def test_delegation(self):
+        context = ResumingSSLContext(ssl.create_default_context())
+
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+
+        self.assertFalse(context.context.check_hostname)
+        self.assertEqual(context.verify_mode, ssl.CERT_NONE)
+        self.assertIsNone(context.get_session("localhost"))
+        self.assertEqual(context.stats(), {"handshakes": 0, "resumed": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
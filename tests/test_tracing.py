@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# test_tracing.py
+"""Test tracing of the requests.
+"""
+
+import json
+import time
+import unittest
+
+from aclpy.connector import tracing
+from aclpy.connector.connector import ArrowheadConnector
+from aclpy.connector.hedging import Hedging
+from aclpy.connector.tracing import Tracer
+from aclpy.server import ArrowheadServer
+from aclpy.system import ArrowheadSystem
+
+
+class DummyConnector(ArrowheadConnector):
+
+    def _orchestrate(self, system, message, timeout = None):
+        trace = tracing.current()
+        trace.sending()
+        trace.handshake(time.perf_counter(), 0.002)
+
+        time.sleep(message.get("delay", 0))
+        trace.received(0.002 + message.get("delay", 0))
+
+        return (200, {"response": []})
+
+
+class TestTracing(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = DummyConnector(ArrowheadServer(orchestrator_rate_limit = 100))
+        self.connector.tracer = Tracer(threshold = 0.05)
+        self.system = ArrowheadSystem(name = "test", address = "127.0.0.1", port = 0)
+
+
+    def test_phases(self):
+        self.connector.orchestrate(self.system, {"delay": 0.01})
+
+        trace = self.connector.tracer.recent[-1]
+
+        self.assertEqual(trace.operation, "orchestrate")
+        self.assertEqual(trace.status_code, 200)
+        self.assertEqual(set(trace.phases), {"queue", "connect", "tls", "server"})
+        self.assertAlmostEqual(trace.phases["tls"], 0.002)
+        self.assertGreaterEqual(trace.duration, 0.01)
+        self.assertIsNone(tracing.current())
+
+        self.assertIn("server", self.connector.tracer.summary()["orchestrate"])
+
+
+    def test_hedging(self):
+        with Hedging(min_samples = 5) as hedging:
+            self.connector.hedging = hedging
+
+            for _ in range(30):
+                self.connector.orchestrate(self.system, {"delay": 0})
+
+        # Phases of the first attempts are recorded also after the hedging starts
+        self.assertEqual(len(self.connector.tracer.recent), 30)
+
+        for trace in self.connector.tracer.recent:
+            self.assertEqual(trace.status_code, 200)
+            self.assertIn("server", trace.phases)
+
+
+    def test_slow_log(self):
+        with self.assertLogs("aclpy.slow", level = "WARNING") as logs:
+            self.connector.orchestrate(self.system, {"delay": 0})
+            self.connector.orchestrate(self.system, {"delay": 0.06})
+
+        self.assertEqual(len(logs.records), 1)
+
+        record = json.loads(logs.records[0].getMessage().split(": ", 1)[1])
+
+        self.assertEqual(record["url"], "https://127.0.0.1:8441/orchestrator/")
+        self.assertGreaterEqual(record["phases_ms"]["server"], 50)
+
+
+if __name__ == "__main__":
+    unittest.main()